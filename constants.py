@@ -4,6 +4,16 @@ MAX_STICKS = 3
 LOGICAL_WIDTH = 1280
 LOGICAL_HEIGHT = 720
 
+# === TIMING ===
+SIM_HZ = 120 # Fixed simulation rate (independent of render rate)
+SIM_DT = 1.0 / SIM_HZ
+MAX_FRAME_TIME = 0.25 # Longest frame fed to the simulation (avoids spiral of death)
+HITSTOP_DURATION = 3 / 60 # Seconds the world freezes on impact
+FPS_LIMITS = [30, 60, 120, 144, 240, 0] # 0 = Unlimited
+
+# === EFFECTS ===
+MAX_PARTICLES = 1024 # Hard budget; extra spawns are dropped
+
 # === SURVIVAL ===
 MAX_BODY_TEMP = 37.0
 MIN_BODY_TEMP = 30.0 # Death threshold? Or just min?
@@ -1,5 +1,11 @@
 # CRITICAL: PROCEDURAL PIPELINE - DO NOT REPLACE WITH STATIC ASSETS
 # This file generates the pixel-art character frames dynamically.
+import numpy as np
+
+GRID_WIDTH = 18
+GRID_HEIGHT = 24
+OUTLINE = 6 # Palette index used for outlines
+
 # Import generated sprite data
 try:
     from data.sprite_data import IDLE_DOWN_FRAMES, IDLE_LEFT_FRAMES, IDLE_RIGHT_FRAMES, IDLE_UP_FRAMES, WALK_DOWN_FRAMES
@@ -9,26 +15,35 @@ except ImportError:
     WALK_DOWN_FRAMES = None
 
 def create_base_grid():
-    return [[0 for _ in range(18)] for _ in range(24)]
+    """Empty 24x18 palette-index grid (rows are y)."""
+    return np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
 
 def set_pixel(grid, x, y, val):
     """Set a single pixel safely."""
-    if 0 <= y < 24 and 0 <= x < 18:
-        grid[y][x] = val
+    if 0 <= y < GRID_HEIGHT and 0 <= x < GRID_WIDTH:
+        grid[y, x] = val
 
 def add_selective_outline(grid):
-    """Add clean selective outlining."""
-    temp = [row[:] for row in grid]
-    for y in range(1, 23):
-        for x in range(1, 17):
-            if grid[y][x] != 0 and grid[y][x] != 6:
-                # Check for edges
-                for dy, dx in [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (-1, -1), (1, -1), (-1, 1)]:
-                    ny, nx = y + dy, x + dx
-                    if 0 <= ny < 24 and 0 <= nx < 18:
-                        if grid[ny][nx] == 0:
-                            temp[ny][nx] = 6
-    return temp
+    """Add clean selective outlining.
+
+    Every empty cell touching (8-neighbourhood) a coloured, non-outline cell
+    becomes an outline. Only interior cells act as sources, matching the
+    original hand-drawn rule.
+    """
+    grid = np.asarray(grid, dtype=np.uint8)
+    source = (grid != 0) & (grid != OUTLINE)
+    source[0, :] = source[-1, :] = False
+    source[:, 0] = source[:, -1] = False
+
+    # 3x3 dilation of the sources, done as a horizontal then a vertical pass
+    row = source.copy()
+    row[:, 1:] |= source[:, :-1]
+    row[:, :-1] |= source[:, 1:]
+    near = row.copy()
+    near[1:, :] |= row[:-1, :]
+    near[:-1, :] |= row[1:, :]
+
+    return np.where((grid == 0) & near, np.uint8(OUTLINE), grid)
 
 # === PROPER 16x16 SPRITE (V11) ===
 # Clean, refined pixel art with proper proportions
@@ -37,6 +37,9 @@ PALETTE_BUILDER.update({
 class NPC:
     def __init__(self, x, y, npc_type="saboteur", npc_id="GENERIC"):
         self.pos = pygame.Vector2(x, y)
+        self.prev_pos = pygame.Vector2(self.pos)
+        self.render_pos = pygame.Vector2(self.pos)
+        self.light = None # Persistent LightingEngine handle (see sync_light)
         self.speed = 60  # Slower than player
         self.pixel_size = 4
         self.grid_width = 18
@@ -77,15 +80,16 @@ class NPC:
         self.dialogue_lines = []  # Set by zone/context
         
         self.image = None
+        self.image_version = 0 # Bumped whenever the displayed frame changes (dirty-rect tracking)
         self.render_cache()
     
     def render_cache(self, palette=None):
-        """Render NPC sprite using assigned palette."""
+        """Pick the shared atlas frame using the assigned palette."""
         if palette is None:
             palette = self.palette
             
-        from data.matrices import build_hero_grid
-        self.current_grid = build_hero_grid(
+        from systems.sprite_atlas import character_atlas
+        pose = (
             self.frame_index, 
             self.facing, 
             "TORCH",  # NPCs carry torches
@@ -94,22 +98,11 @@ class NPC:
             False,    # is_lighting
             False     # is_igniting
         )
-        
-        width = self.grid_width * self.pixel_size
-        height = self.grid_height * self.pixel_size
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.image.fill((0, 0, 0, 0))
-        
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                sample_x = (self.grid_width - 1 - x) if self.flip_h else x
-                val = self.current_grid[y][sample_x]
-                if val in palette:
-                    color = palette[val]
-                    if color[3] if len(color) > 3 else True:
-                        rect = (x * self.pixel_size, y * self.pixel_size, 
-                               self.pixel_size, self.pixel_size)
-                        pygame.draw.rect(self.image, color, rect)
+        self.current_grid = character_atlas.get_grid(*pose)
+        image = character_atlas.get_frame(palette, *pose, flip_h=self.flip_h)
+        if image is not self.image:
+            self.image = image
+            self.image_version += 1
     
     def update(self, dt, run_state, env_manager):
         """Update NPC behavior based on type and zone state."""
@@ -125,7 +118,7 @@ class NPC:
         elif self.npc_id == "ELDER" or (zone_stabilized and self.npc_type == "keeper"):
              self._keeper_behavior(dt, campfires)
         else:
-             self._saboteur_behavior(dt, campfires)
+             self._saboteur_behavior(dt, campfires, env_manager)
         
         # Animation
         self.animation_timer += dt
@@ -134,18 +127,23 @@ class NPC:
             self.frame_index = (self.frame_index + 1) % 4
             self.render_cache()
     
-    def _saboteur_behavior(self, dt, campfires):
+    def _saboteur_behavior(self, dt, campfires, env_manager=None):
         """Move toward fires and steal fuel."""
         # Find nearest active fire
         if not self.target_fire or self.target_fire.fuel <= 0:
             self.target_fire = None
-            min_dist = 999999
-            for fire in campfires:
-                if fire.fuel > 0:
-                    dist = (pygame.Vector2(fire.rect.center) - self.pos).length()
-                    if dist < min_dist:
-                        min_dist = dist
-                        self.target_fire = fire
+            if env_manager:
+                # Ring search outward through the spatial index
+                self.target_fire, _ = env_manager.spatial.nearest(
+                    self.pos, "campfire", point=lambda f: f.rect.center, accept=lambda f: f.fuel > 0)
+            else:
+                min_dist = 999999
+                for fire in campfires:
+                    if fire.fuel > 0:
+                        dist = (pygame.Vector2(fire.rect.center) - self.pos).length()
+                        if dist < min_dist:
+                            min_dist = dist
+                            self.target_fire = fire
         
         if self.target_fire:
             # Move toward target
@@ -295,7 +293,7 @@ class NPC:
             
             if self.is_working:
                 # Spawn dust
-                 if random.random() < 0.1:
+                 if random.random() < 6.0 * dt: # ~6 puffs per second
                      env_manager.spawn_footstep_dust(self.pos.x + 10, self.pos.y + 30)
                  # Hammer anim is handled by render_cache (is_working=True)
                  
@@ -303,6 +301,30 @@ class NPC:
             # Idle / Stand near start
             pass
 
+    def begin_step(self):
+        """Remember the position before a fixed simulation step."""
+        self.prev_pos.update(self.pos)
+
+    def interpolate(self, alpha):
+        """Blend the last two simulation steps into render_pos."""
+        if self.pos.distance_squared_to(self.prev_pos) > 64 * 64:
+            self.prev_pos.update(self.pos) # Teleported: snap
+        self.render_pos.update(self.prev_pos.lerp(self.pos, alpha))
+
+    def sync_light(self, lighting_engine):
+        """Keep this NPC's torch light on its rendered position."""
+        x, y = self.render_pos.x + 36, self.render_pos.y + 48
+        if self.light is None:
+            self.light = lighting_engine.add_torch_light(x, y)
+            return
+        self.light.set_position(x, y)
+        lighting_engine.keep(self.light)
+
+    def get_render_state(self):
+        """Screen bounds and visual state, used for dirty-rect tracking."""
+        x, y = int(self.render_pos.x), int(self.render_pos.y)
+        return pygame.Rect(x, y, 72, 96), (self.image_version, x, y)
+
     def draw(self, screen):
-        """Draw NPC sprite."""
-        screen.blit(self.image, (self.pos.x, self.pos.y))
+        """Draw NPC sprite at its interpolated position."""
+        screen.blit(self.image, (self.render_pos.x, self.render_pos.y))
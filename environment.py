@@ -2,7 +2,7 @@ import pygame
 import random
 import math
 
-def generate_rock_tile(size=64):
+def generate_rock_tile(size=64, rng=random):
     """Generates a 64x64 pixelated rock texture with rustic mountain feel."""
     tile = pygame.Surface((size, size))
     # Lighter, warmer base color for rustic mountain/fall vibe
@@ -11,15 +11,15 @@ def generate_rock_tile(size=64):
     
     # Add noise / clumps with warmer tones
     for _ in range(20):
-        shade = random.randint(-15, 20)  # More variation toward lighter
+        shade = rng.randint(-15, 20)  # More variation toward lighter
         c = (max(0, min(255, base_color[0] + shade)),
              max(0, min(255, base_color[1] + shade)),
              max(0, min(255, base_color[2] + shade)))
         
-        w = random.randint(4, 16)
-        h = random.randint(4, 16)
-        x = random.randint(0, size-w)
-        y = random.randint(0, size-h)
+        w = rng.randint(4, 16)
+        h = rng.randint(4, 16)
+        x = rng.randint(0, size-w)
+        y = rng.randint(0, size-h)
         pygame.draw.rect(tile, c, (x, y, w, h))
         
     # Add some "cracks" (less dark)
@@ -28,16 +28,20 @@ def generate_rock_tile(size=64):
         c = (max(0, min(255, base_color[0] + shade)),
              max(0, min(255, base_color[1] + shade)),
              max(0, min(255, base_color[2] + shade)))
-        x1, y1 = random.randint(0, size), random.randint(0, size)
-        x2, y2 = x1 + random.randint(-10, 10), y1 + random.randint(-10, 10)
+        x1, y1 = rng.randint(0, size), rng.randint(0, size)
+        x2, y2 = x1 + rng.randint(-10, 10), y1 + rng.randint(-10, 10)
         pygame.draw.line(tile, c, (x1, y1), (x2, y2), 2)
         
     return tile
 
-def generate_background_surface(width, height):
-    """Creates a pre-tiled background surface."""
+def generate_background_surface(width, height, seed=None):
+    """Creates a pre-tiled background surface (same seed, same rocks)."""
     bg = pygame.Surface((width, height))
-    tile = generate_rock_tile()
+    if seed is None:
+        tile = generate_rock_tile()
+    else:
+        tile = bake_cache.surface("rock_tile", (64, seed), lambda: generate_rock_tile(rng=random.Random(seed)),
+                                  sources=(generate_rock_tile,))
     for y in range(0, height, 64):
         for x in range(0, width, 64):
             bg.blit(tile, (x, y))
@@ -50,12 +54,163 @@ def generate_background_surface(width, height):
     
     return bg
 from constants import TREE_HEALTH, LOGS_PER_TREE, TREE_REGROW_TICKS_SAPLING, TREE_REGROW_TICKS_FULL, MAX_FIRE_FUEL, FUEL_PER_LOG
+from systems.spatial_grid import SpatialGrid
+from systems.particle_engine import ParticleEngine
+from utils.surfaces import prepare, SurfaceCache
+from utils.bake_cache import bake_cache
+
+# Key: (zone id, seed, width, height) -> background; revisiting a zone reuses its rocks
+background_cache = SurfaceCache()
+
+class TreeAtlas:
+    """Flyweight sprite sheet shared by every Tree.
+
+    All tree art is identical between instances, so each visual variant is
+    drawn once into a single sheet, together with its pre-scaled sapling and
+    pre-flashed (hit) versions. Trees only keep a variant name and blit
+    subsurfaces of the sheet. Built lazily on first use.
+    """
+    VARIANTS = ("pine", "pine_snowy", "pine_tall", "dead")
+    STATES = ("full", "stump", "sapling")
+    CELL_SIZE = (48, 96) # Largest variant
+    IMAGE_SIZE = (40, 80) # Canvas every variant is drawn on (pine_tall is then scaled to CELL_SIZE)
+
+    def __init__(self):
+        self.sheet = None
+        # Key: (variant, state, flashed) -> subsurface of sheet
+        self.sprites = {}
+
+    def get(self, variant, state, flashed=False):
+        """Return the shared image for a variant/state ("full", "stump", "sapling")."""
+        if self.sheet is None:
+            self._build()
+        return self.sprites[(variant, state, flashed)]
+
+    def get_size(self, variant):
+        """Size of a variant's full-grown image."""
+        return self.get(variant, "full").get_size()
+
+    def _cells(self):
+        """Key: (variant, state, flashed) -> rect of that image on the sheet."""
+        cell_w, cell_h = self.CELL_SIZE
+        cells = {}
+        for row, variant in enumerate(self.VARIANTS):
+            full_size = self.CELL_SIZE if variant == "pine_tall" else self.IMAGE_SIZE
+            sizes = (full_size, self.IMAGE_SIZE, (full_size[0] // 2, full_size[1] // 2))
+            for col, (state, size) in enumerate(zip(self.STATES, sizes)):
+                for flashed in (False, True):
+                    x = (col * 2 + flashed) * cell_w
+                    cells[(variant, state, flashed)] = pygame.Rect((x, row * cell_h), size)
+        return cells
+
+    def _build(self):
+        cells = self._cells()
+        sheet = bake_cache.surface("tree_sheet", (self.VARIANTS, self.STATES, self.CELL_SIZE),
+                                   lambda: self._draw_sheet(cells),
+                                   sources=(self._draw_sheet, self._draw_variant, self._draw_pine,
+                                            self._draw_dead, self._draw_stump))
+        # Cut the sprites from the display-format copy of the finished sheet
+        self.sheet = prepare(sheet)
+        for key, rect in cells.items():
+            self.sprites[key] = self.sheet.subsurface(rect)
+
+    def _draw_sheet(self, cells):
+        cell_w, cell_h = self.CELL_SIZE
+        columns = len(self.STATES) * 2
+        sheet = pygame.Surface((cell_w * columns, cell_h * len(self.VARIANTS)), pygame.SRCALPHA)
+        sheet.fill((0, 0, 0, 0))
+
+        for variant in self.VARIANTS:
+            full, stump = self._draw_variant(variant)
+            # Saplings are the full tree at half size (was scaled every frame)
+            sapling = pygame.transform.scale(full, (full.get_width() // 2, full.get_height() // 2))
+
+            for state, img in zip(self.STATES, (full, stump, sapling)):
+                for flashed in (False, True):
+                    cell = sheet.subsurface(cells[(variant, state, flashed)])
+                    # MAX onto the cleared sheet is an exact copy (plain blit would alpha-blend)
+                    cell.blit(img, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+                    if flashed:
+                        cell.fill((255, 255, 255, 255), special_flags=pygame.BLEND_RGBA_ADD)
+        return sheet
+
+    def _draw_variant(self, variant):
+        """Return (full, stump) images for a variant."""
+        if variant == "dead":
+            return self._draw_dead(), self._draw_stump()
+        full = self._draw_pine(snowy=(variant == "pine_snowy"))
+        if variant == "pine_tall":
+            full = pygame.transform.scale(full, self.CELL_SIZE)
+        return full, self._draw_stump()
+
+    def _draw_pine(self, snowy=False):
+        # Generate Pine Tree Image
+        image = pygame.Surface(self.IMAGE_SIZE, pygame.SRCALPHA)
+        
+        # Colors
+        trunk_color = (60, 40, 30)
+        leaf_color = (30, 60, 30)
+        highlight = (40, 70, 40)
+        snow_color = (220, 230, 240)
+        
+        # === TRUNK ===
+        pygame.draw.rect(image, trunk_color, (16, 60, 8, 20)) # Base
+        pygame.draw.rect(image, trunk_color, (16, 20, 8, 40)) # Core
+        
+        # === LEAVES (Layers) ===
+        # Bottom Layer
+        pygame.draw.polygon(image, leaf_color, [(0, 60), (20, 30), (40, 60)])
+        pygame.draw.polygon(image, snow_color, [(0, 60), (20, 30), (40, 60)], 2) # Snow edge
+        
+        # Middle Layer
+        pygame.draw.polygon(image, leaf_color, [(4, 45), (20, 15), (36, 45)])
+        if snowy:
+            pygame.draw.polygon(image, snow_color, [(4, 45), (20, 15), (36, 45)], 2)
+        
+        # Top Layer
+        pygame.draw.polygon(image, leaf_color, [(8, 30), (20, 0), (32, 30)])
+        if snowy:
+            pygame.draw.polygon(image, snow_color, [(8, 30), (20, 0), (32, 30)], 2)
+            pygame.draw.line(image, snow_color, (2, 59), (38, 59), 2) # Drift along the lowest boughs
+        # Snow Cap
+        pygame.draw.polygon(image, snow_color, [(14, 10), (20, 0), (26, 10)])
+        return image
+
+    def _draw_dead(self):
+        """Bare, wind-stripped trunk (The Peak)."""
+        image = pygame.Surface(self.IMAGE_SIZE, pygame.SRCALPHA)
+        bark = (75, 65, 60)
+        snow_color = (220, 230, 240)
+        
+        pygame.draw.rect(image, bark, (17, 10, 6, 70)) # Trunk
+        # Branches (left / right, alternating)
+        for y, side in ((22, -1), (34, 1), (46, -1), (56, 1)):
+            end_x = 20 + side * 14
+            pygame.draw.line(image, bark, (20, y + 6), (end_x, y), 3)
+            pygame.draw.line(image, snow_color, (20, y + 5), (end_x, y - 1), 1) # Snow on top
+        pygame.draw.rect(image, snow_color, (17, 8, 6, 3)) # Snow on the broken top
+        return image
+
+    def _draw_stump(self):
+        image = pygame.Surface(self.IMAGE_SIZE, pygame.SRCALPHA)
+        # === STUMP IMAGE ===
+        pygame.draw.rect(image, (60, 40, 30), (16, 60, 8, 12)) # Short trunk
+        pygame.draw.ellipse(image, (80, 60, 40), (16, 60, 8, 4)) # Cut top ring
+        return image
+
+
+# Shared by every Tree
+tree_atlas = TreeAtlas()
+
 
 class Tree:
-    def __init__(self, x, y):
+    STATE_NAMES = {0: "full", 1: "stump", 2: "sapling"}
+
+    def __init__(self, x, y, variant="pine"):
         self.rect = pygame.Rect(x, y, 40, 80) # Visual rect (approx)
         self.hitbox = pygame.Rect(x + 12, y + 68, 16, 12) # Collision base (smaller footprint)
         self.health = TREE_HEALTH
+        self.variant = variant # Art from the shared tree_atlas
         
         # States
         self.STATE_FULL = 0
@@ -64,65 +219,29 @@ class Tree:
         self.state = self.STATE_FULL
         self.regrow_timer = 0
         
-        self.image = None
-        self.stump_image = None
-        
         # Impact juice
         self.shake_timer = 0.0
         self.shake_duration = 0.2
         self.shake_amplitude = 3
-        self.flash_frames = 0
+        self.flash_timer = 0.0
+        self.flash_duration = 0.04 # Long enough to show for at least one rendered frame
         
-        # Precise collision hitbox (bottom 20% of sprite, trunk only)
-        # Precise collision hitbox (The Snap)
-        # Hardcoded to Trunk/Stump (x+10, y+40, w20, h40)
+        # Precise collision hitbox (The Snap): trunk only, centred on the base.
+        # Fixed here at the spot render() used to move it to, so chop tests
+        # and the spatial index agree whether or not the tree has been drawn.
+        trunk_height = int(self.rect.height * 0.2)
+        trunk_width = int(self.rect.width * 0.5)
         self.stump_rect = pygame.Rect(
-            self.rect.x + 10,
-            self.rect.y + 40,
+            self.rect.x + (self.rect.width - trunk_width) // 2,
+            self.rect.bottom - trunk_height,
             20,
             40
         )
         
-        self._generate_images()
-        
-    def _generate_images(self):
-        # Generate Pine Tree Image
-        self.image = pygame.Surface((40, 80), pygame.SRCALPHA)
-        self.stump_image = pygame.Surface((40, 80), pygame.SRCALPHA)
-        
-        # Colors
-        trunk_color = (60, 40, 30)
-        leaf_color = (30, 60, 30)
-        highlight = (40, 70, 40)
-        snow_color = (220, 230, 240)
-        
-        pixel_size = 4
-        
-        # === TRUNK ===
-        pygame.draw.rect(self.image, trunk_color, (16, 60, 8, 20)) # Base
-        pygame.draw.rect(self.image, trunk_color, (16, 20, 8, 40)) # Core
-        
-        # === LEAVES (Layers) ===
-        # Bottom Layer
-        pygame.draw.polygon(self.image, leaf_color, [(0, 60), (20, 30), (40, 60)])
-        pygame.draw.polygon(self.image, snow_color, [(0, 60), (20, 30), (40, 60)], 2) # Snow edge
-        
-        # Middle Layer
-        pygame.draw.polygon(self.image, leaf_color, [(4, 45), (20, 15), (36, 45)])
-        
-        # Top Layer
-        pygame.draw.polygon(self.image, leaf_color, [(8, 30), (20, 0), (32, 30)])
-        # Snow Cap
-        pygame.draw.polygon(self.image, snow_color, [(14, 10), (20, 0), (26, 10)])
-
-        # === STUMP IMAGE ===
-        pygame.draw.rect(self.stump_image, trunk_color, (16, 60, 8, 12)) # Short trunk
-        pygame.draw.ellipse(self.stump_image, (80, 60, 40), (16, 60, 8, 4)) # Cut top ring
-        
     def take_impact(self):
         """Visual-only impact logic for exhausted resources."""
         self.shake_timer = self.shake_duration
-        self.flash_frames = 1
+        self.flash_timer = self.flash_duration
 
     def take_damage(self):
         """Returns number of logs dropped (3 if felled, 0 otherwise)."""
@@ -131,7 +250,7 @@ class Tree:
         
         # Trigger impact effects
         self.shake_timer = self.shake_duration
-        self.flash_frames = 1
+        self.flash_timer = self.flash_duration
         
         if self.health <= 0:
             self.state = self.STATE_STUMP
@@ -159,42 +278,35 @@ class Tree:
         if self.shake_timer > 0:
             self.shake_timer -= dt
         # Update flash
-        if self.flash_frames > 0:
-            self.flash_frames -= 1
+        if self.flash_timer > 0:
+            self.flash_timer -= dt
+
+    def get_render_state(self):
+        """Screen bounds and visual state, used for dirty-rect tracking."""
+        shake_x = 0
+        if self.shake_timer > 0:
+            progress = 1.0 - (self.shake_timer / self.shake_duration)
+            shake_x = int(math.sin(progress * math.pi * 8) * self.shake_amplitude * (self.shake_timer / self.shake_duration))
+        # Full-grown art is the largest image; all states sit bottom-centre on rect
+        w, h = tree_atlas.get_size(self.variant)
+        w, h = max(w, self.rect.width), max(h, self.rect.height)
+        bounds = pygame.Rect(self.rect.centerx - w // 2 - self.shake_amplitude - 1, self.rect.bottom - h, w + self.shake_amplitude * 2 + 2, h)
+        return bounds, (self.state, shake_x, self.flash_timer > 0)
 
     def render(self, surface):
-        img = self.stump_image if self.state == self.STATE_STUMP else self.image
-        
-        # Determine source image and scaling
-        if self.state == self.STATE_STUMP:
-            img = self.stump_image
-        elif self.state == self.STATE_SAPLING:
-            orig_w, orig_h = self.image.get_size()
-            img = pygame.transform.scale(self.image, (orig_w // 2, orig_h // 2))
-        else:
-            img = self.image
+        # Shared atlas image (sapling is pre-scaled, hit flash pre-baked)
+        img = tree_atlas.get(self.variant, self.STATE_NAMES[self.state], self.flash_timer > 0)
             
         shake_x = 0
         if self.shake_timer > 0:
             progress = 1.0 - (self.shake_timer / self.shake_duration)
             shake_x = math.sin(progress * math.pi * 8) * self.shake_amplitude * (self.shake_timer / self.shake_duration)
         
-        render_pos = (self.rect.x + shake_x, self.rect.y)
-        if self.state == self.STATE_SAPLING:
-            render_pos = (self.rect.x + 10 + shake_x, self.rect.y + 40)
+        # Anchor bottom-centre on rect (full/stump: rect.topleft, sapling: +10, +40)
+        w, h = img.get_size()
+        render_pos = (self.rect.centerx - w // 2 + shake_x, self.rect.bottom - h)
         
-        # Update stump_rect to match current position
-        trunk_height = int(self.rect.height * 0.2)
-        trunk_width = int(self.rect.width * 0.5)
-        self.stump_rect.x = self.rect.x + (self.rect.width - trunk_width) // 2
-        self.stump_rect.y = self.rect.bottom - trunk_height
-            
-        if self.flash_frames > 0:
-            flash_img = img.copy()
-            flash_img.fill((255, 255, 255, 255), special_flags=pygame.BLEND_RGBA_ADD)
-            surface.blit(flash_img, render_pos)
-        else:
-            surface.blit(img, render_pos)
+        surface.blit(img, render_pos)
 
 class Stick:
     def __init__(self, x, y):
@@ -203,6 +315,10 @@ class Stick:
         self.consumed = False
         self.angle = random.randint(0, 360)
         
+    def get_render_state(self):
+        """Screen bounds and visual state, used for dirty-rect tracking."""
+        return self.rect, self.consumed
+
     def render(self, surface):
         if self.consumed: return
         # Draw a small stick (line)
@@ -222,6 +338,10 @@ class DeadfallPile:
         self.sticks_remaining = 5
         self.regrow_timer = 0
         
+    def get_render_state(self):
+        """Screen bounds and visual state, used for dirty-rect tracking."""
+        return pygame.Rect(self.pos.x - 26, self.pos.y - 16, 52, 32), self.sticks_remaining
+
     def render(self, surface):
         # Draw a mulch/dirt patch
         pygame.draw.ellipse(surface, (45, 35, 25), (self.pos.x-24, self.pos.y-12, 48, 24))
@@ -254,86 +374,6 @@ class DeadfallPile:
                 self.sticks_remaining += 1
                 self.regrow_timer = 0
 
-class Particle:
-    def __init__(self, x, y, color, size=4):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-2, 2) * 60
-        self.vy = random.uniform(-4, -1) * 60 # Explode up
-        self.life = random.uniform(0.3, 0.6)
-        self.color = color
-        self.gravity = 500
-        self.size = size
-        
-    def update(self, dt, ground_y=720):
-        self.vy += self.gravity * dt
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        
-        # Bounce on ground
-        if self.y >= ground_y - 5:
-            self.y = ground_y - 5
-            self.vy *= -0.5  # Bounce with energy loss
-            self.vx *= 0.8   # Friction
-            
-            # Stop bouncing if too slow
-            if abs(self.vy) < 50:
-                self.vy = 0
-        
-        self.life -= dt
-        return self.life > 0
-        
-    def render(self, surface, offset=(0,0)):
-        if self.life > 0:
-            rx = int(self.x + offset[0])
-            ry = int(self.y + offset[1])
-            pygame.draw.rect(surface, self.color, (rx, ry, self.size, self.size))
-
-class LeafParticle(Particle):
-    def __init__(self, x, y):
-        # Green leaf colors
-        color = random.choice([(34, 139, 34), (0, 100, 0), (50, 205, 50)])
-        super().__init__(x, y, color)
-        self.vx = random.uniform(-1, 1) * 30
-        self.vy = random.uniform(40, 80)
-        self.life = random.uniform(1.2, 2.5)
-        import math
-        self.timer = random.uniform(0, math.pi * 2)
-        self.gravity = 0 # Drift slowly
-        
-    def update(self, dt, ground_y=720):
-        import math
-        self.timer += dt * 5
-        self.x += (self.vx + math.sin(self.timer) * 60) * dt
-        self.y += self.vy * dt
-        
-        self.life -= dt
-        return self.life > 0
-
-class DustParticle(Particle):
-    def __init__(self, x, y):
-        color = random.choice([(180, 180, 180, 150), (200, 200, 200, 150)]) # Dusty gray
-        super().__init__(x, y, color)
-        self.vx = random.uniform(-1, 1) * 30
-        self.vy = random.uniform(-40, -20)
-        self.life = random.uniform(0.3, 0.5)
-        self.gravity = 150
-        
-    def update(self, dt, ground_y=720):
-        self.vy += self.gravity * dt
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.life -= dt
-        return self.life > 0
-    
-    def render(self, surface):
-        if self.life > 0:
-            # Draw smaller and slightly transparent
-            size = int(self.life * 10)
-            s = pygame.Surface((size, size), pygame.SRCALPHA)
-            s.fill(self.color)
-            surface.blit(s, (int(self.x), int(self.y)))
-
 class Campfire:
     def __init__(self, x, y):
         self.rect = pygame.Rect(x, y, 32, 32) # Fire center
@@ -344,11 +384,25 @@ class Campfire:
         self.anim_timer = 0.0
         self.frame = 0
         self.is_tutorial_fire = False  # Tutorial fires never extinguish
+        self.light = None # Persistent LightingEngine handle (see sync_light)
         
     def add_fuel(self, amount=30.0):
         self.fuel = min(self.max_fuel, self.fuel + amount)
         print(f"Fire fueled! Time: {self.fuel:.1f}s")
         
+    def sync_light(self, lighting_engine):
+        """Keep this fire's light in step with its fuel (an unlit fire's light is dropped)."""
+        if self.fuel <= 0:
+            return
+        x, y = self.rect.centerx, self.rect.centery - 10
+        fuel_percent = self.fuel / 100.0
+        if self.light is None:
+            self.light = lighting_engine.add_fire_light(x, y, fuel_percent)
+            return
+        self.light.set_position(x, y)
+        self.light.set_base_radius(lighting_engine.fire_radius(fuel_percent))
+        lighting_engine.keep(self.light)
+        
     def update(self, dt):
         # Tutorial fires never run out
         if self.is_tutorial_fire:
@@ -368,6 +422,17 @@ class Campfire:
             return True 
         return True 
         
+    def get_render_state(self, run_state=None):
+        """Screen bounds and visual state, used for dirty-rect tracking."""
+        # Fire pit and flames reach ~8px above and ~24px below the rect
+        bounds = pygame.Rect(self.rect.x - 4, self.rect.y - 8, self.rect.width + 8, self.rect.height + 24)
+        bounds.union_ip(self.box_rect)
+        stack_height = 0
+        if self.fuel > 10: stack_height = 1
+        if self.fuel > 50: stack_height = 2
+        if self.fuel > 90: stack_height = 3
+        return bounds, (self.fuel > 0, self.frame if self.fuel > 0 else 0, stack_height)
+
     def render(self, surface):
         # Draw BIG Log Chest
         # Draw rear/inside
@@ -437,6 +502,12 @@ class ConstructionSite:
         else:
             run_state.shack_progress["state"] = 3 # Complete
 
+    def get_render_state(self, run_state):
+        """Screen bounds and visual state, used for dirty-rect tracking."""
+        # Roof peak sits 90px above the foundation and overhangs by 10px
+        bounds = pygame.Rect(self.rect.x - 10, self.rect.y - 90, self.rect.width + 20, self.rect.height + 90)
+        return bounds, run_state.shack_progress["state"]
+
     def render(self, surface, run_state):
         progress = run_state.shack_progress
         state = progress["state"]
@@ -493,6 +564,14 @@ class SignalFire(Campfire):
         self.fuel = 0 # Starts unlit
         self.is_lit = False
         
+    def get_render_state(self, run_state=None):
+        """Screen bounds and visual state, used for dirty-rect tracking."""
+        cx, cy = self.rect.centerx, self.rect.centery
+        bounds = pygame.Rect(cx - 100, cy - 100, 200, 200)
+        if self.is_lit or self.fuel > 0:
+            return bounds, object() # Random flames: changes every frame
+        return bounds, False
+
     def render(self, surface, run_state=None):
         cx, cy = self.rect.centerx, self.rect.centery
         
@@ -528,6 +607,10 @@ class Stockpile:
         self.rect = pygame.Rect(x, y, 64, 48)
         self.box_rect = pygame.Rect(x + 8, y + 16, 48, 32)
         
+    def get_render_state(self, run_state):
+        """Screen bounds and visual state, used for dirty-rect tracking."""
+        return self.box_rect, run_state.log_stash if run_state else 0
+
     def render(self, surface, run_state):
         # Draw wooden crate
         pygame.draw.rect(surface, (70, 50, 35), self.box_rect)
@@ -548,6 +631,10 @@ class GuardianNPC:
         self.rect = pygame.Rect(x, y, 72, 96)
         self.dialogue_lines = []  # Set by zone/context
         
+    def get_render_state(self):
+        """Screen bounds and visual state, used for dirty-rect tracking."""
+        return pygame.Rect(self.pos.x + 16, self.pos.y + 6, 40, 76), (int(self.pos.x), int(self.pos.y))
+
     def draw(self, surface):
         # Placeholder visual for NPC (Blue Gideon Variant)
         # Head
@@ -558,10 +645,15 @@ class GuardianNPC:
         pygame.draw.rect(surface, (30, 50, 80), (self.pos.x + 20, self.pos.y + 35, 32, 45), 0, 5)
 
 class WindBreakRock:
+    shared_image = None # Every rock looks the same; baked once and shared
+    
     def __init__(self, x, y):
         self.rect = pygame.Rect(x, y, 80, 60)
         self.hitbox = pygame.Rect(x + 10, y + 20, 60, 30) # Collision
-        self.image = self._generate_image()
+        if WindBreakRock.shared_image is None:
+            WindBreakRock.shared_image = prepare(bake_cache.surface("windbreak_rock", (80, 60), self._generate_image,
+                                                                    sources=(self._generate_image,)))
+        self.image = WindBreakRock.shared_image
         
     def _generate_image(self):
         surf = pygame.Surface((80, 60), pygame.SRCALPHA)
@@ -575,25 +667,28 @@ class WindBreakRock:
     def render(self, surface, offset=(0,0)):
         surface.blit(self.image, (self.rect.x - offset[0], self.rect.y - offset[1]))
 
-class EnvironmentManager:
-    def __init__(self):
+class ZoneLayout:
+    """Everything a zone load generates, ready to be swapped into an EnvironmentManager."""
+    def __init__(self, zone_data, bg_surface):
+        self.zone_data = zone_data
+        self.bg_surface = bg_surface
         self.trees = []
-        self.particles = []
         self.campfires = []
-        self.bg_surface = None
-        self.current_zone = None
-        self.fog_alpha = 180
         self.stockpile = None
         self.construction_site = None
-        self.npc = None
         self.sticks = []
         self.deadfalls = []
-        
-    def load_zone(self, zone_data, width, height, safe_pos=None):
-        self.current_zone = zone_data
-        self.bg_surface = generate_background_surface(width, height)
+        self.rocks = []
+
+class EnvironmentManager:
+    def __init__(self):
         self.trees = []
+        self.particles = ParticleEngine()
         self.campfires = []
+        self.bg_surface = None
+        self.background_seed = random.getrandbits(4) # One of 16 baked rock textures for this session
+        self.current_zone = None
+        self.fog_alpha = 180
         self.stockpile = None
         self.construction_site = None
         self.npc = None
@@ -601,8 +696,31 @@ class EnvironmentManager:
         self.deadfalls = []
         self.rocks = []
         
+        # Spatial index over trees/stumps, sticks, deadfalls, campfires, rocks and NPCs
+        self.spatial = SpatialGrid(cell_size=128)
+        
+    def load_zone(self, zone_data, width, height, safe_pos=None):
+        self.apply_layout(self.build_layout(zone_data, width, height, safe_pos))
+    
+    def build_layout(self, zone_data, width, height, safe_pos=None, rng=random, safe_span=None):
+        """
+        Generate a zone's entities and background without touching the live
+        zone (safe to run on a worker thread with its own rng). safe_span
+        (y0, y1) keeps the spawn clearance for any entry height in that range,
+        for zones prepared before the player's exact entry point is known.
+        """
+        zone_id = zone_data.id if zone_data else None
+        bg_surface = background_cache.get((zone_id, self.background_seed, width, height),
+                                          lambda: generate_background_surface(width, height, f"{zone_id}:{self.background_seed}"))
+        layout = ZoneLayout(zone_data, bg_surface)
+        
         spawn_safe_x, spawn_safe_y = safe_pos if safe_pos else (400, 300)
         
+        def safe_distance(x, y):
+            """Distance from (x, y) to the player's spawn point (or the nearest point of its span)."""
+            sy = min(max(y, safe_span[0]), safe_span[1]) if safe_span else spawn_safe_y
+            return math.hypot(x - spawn_safe_x, y - sy)
+        
         # --- GUARANTEED SPAWNS (Balancing Harshness) ---
         if zone_data:
             if zone_data.id == 0:
@@ -610,11 +728,11 @@ class EnvironmentManager:
                 # Spawn 5 trees for practice (scattered around)
                 for _ in range(5):
                     while True:
-                        x = random.randint(200, 500)
-                        y = random.randint(150, 450)
+                        x = rng.randint(200, 500)
+                        y = rng.randint(150, 450)
                         # Safe Zone around Player Start/Safe Pos
-                        if math.hypot(x - spawn_safe_x, y - spawn_safe_y) > 100:
-                            self.trees.append(Tree(x, y))
+                        if safe_distance(x, y) > 100:
+                            layout.trees.append(Tree(x, y))
                             break
                 
                 # Spawn The Elder NPC handled by NPCManager
@@ -626,41 +744,44 @@ class EnvironmentManager:
                 tutorial_fire = Campfire(550, 320)
                 tutorial_fire.fuel = 100.0
                 tutorial_fire.is_tutorial_fire = True  # Mark as permanent
-                self.campfires.append(tutorial_fire)
+                layout.campfires.append(tutorial_fire)
                 
             elif zone_data.id == 1:
                 # Zone 1: 15 Trees near start
                 for _ in range(15):
                     while True:
-                        x = random.randint(100, width - 200)
-                        y = random.randint(100, height - 200)
+                        x = rng.randint(100, width - 200)
+                        y = rng.randint(100, height - 200)
                         dist_center = math.hypot(x-400, y-300)
-                        dist_player = math.hypot(x-spawn_safe_x, y-spawn_safe_y)
+                        dist_player = safe_distance(x, y)
                         
                         if 120 < dist_center < 450 and dist_player > 100:
-                            self.trees.append(Tree(x, y))
+                            # Mixed-age woods: about one pine in three is a tall one
+                            layout.trees.append(Tree(x, y, variant=rng.choice(("pine", "pine", "pine_tall"))))
                             break
             elif zone_data.id == 2:
                 # Zone 2: INCREASED DENSITY & WIND BREAKS
                 # "Old Growth" - More trees
                 for _ in range(12): # Increased from 5
-                    self.trees.append(Tree(random.randint(50, width-100), random.randint(50, height-100)))
+                    # Blizzard-loaded pines, with the odd tall one breaking the line
+                    variant = rng.choice(("pine_snowy", "pine_snowy", "pine_tall"))
+                    layout.trees.append(Tree(rng.randint(50, width-100), rng.randint(50, height-100), variant=variant))
                 
                 # Help: 5 Guaranteed Deadfalls (Stick Piles) near spawn
                 for i in range(5):
                     # Scatter near left side (spawn)
-                    dx = random.randint(100, 300)
-                    dy = random.randint(100, height-100)
-                    self.deadfalls.append(DeadfallPile(dx, dy))
+                    dx = rng.randint(100, 300)
+                    dy = rng.randint(100, height-100)
+                    layout.deadfalls.append(DeadfallPile(dx, dy))
                 
                 # Wind Breaks (Rocks)
                 # Lane 1 (Top)
-                self.rocks.append(WindBreakRock(300, 150))
-                self.rocks.append(WindBreakRock(600, 150))
-                self.rocks.append(WindBreakRock(900, 150))
+                layout.rocks.append(WindBreakRock(300, 150))
+                layout.rocks.append(WindBreakRock(600, 150))
+                layout.rocks.append(WindBreakRock(900, 150))
                 # Lane 2 (Bottom)
-                self.rocks.append(WindBreakRock(600, 500))
-                self.rocks.append(WindBreakRock(900, 500))
+                layout.rocks.append(WindBreakRock(600, 500))
+                layout.rocks.append(WindBreakRock(900, 500))
                 
                 # HUB ANCHOR: Campfire + Construction Site
                 # Center of zone
@@ -668,15 +789,15 @@ class EnvironmentManager:
                 
                 # 1. Spawn Hub Campfire
                 hub_fire = Campfire(hub_x, hub_y)
-                self.campfires.append(hub_fire)
+                layout.campfires.append(hub_fire)
                 
                 # 2. Spawn Construction Site (100px North)
                 # Adjusting coordinates: Campfire is at hub_y. Site should be 'above' it.
                 # Screen Y increases downwards. So North is Y - 100.
-                self.construction_site = ConstructionSite(hub_x, hub_y - 120)
+                layout.construction_site = ConstructionSite(hub_x, hub_y - 120)
                 
                 # 3. Link them
-                self.construction_site.linked_fire = hub_fire
+                layout.construction_site.linked_fire = hub_fire
                 
             elif zone_data.id == 3:
                 # Zone 3: Builder's Ridge / Merged
@@ -689,10 +810,10 @@ class EnvironmentManager:
                 # self.construction_site = ConstructionSite(200, 250)
                 # Some trees
                 for _ in range(8):
-                    x = random.randint(50, width-100)
-                    y = random.randint(50, height-100)
+                    x = rng.randint(50, width-100)
+                    y = rng.randint(50, height-100)
                     if math.hypot(x-200, y-250) > 120: 
-                        self.trees.append(Tree(x, y))
+                        layout.trees.append(Tree(x, y))
             elif zone_data.id == 4:
                 # Zone 4: The Peak (Zone 3 ID in prompt, but let's assume valid ID)
                 # Prompt says Zone 3 is Peak. Wait, previous zone was Zone 3 (Builder's Ridge).
@@ -701,35 +822,81 @@ class EnvironmentManager:
                 
                 # Terrain: Sparse Dead Trees
                 for _ in range(4):
-                     self.trees.append(Tree(random.randint(100, width-100), random.randint(200, height-100)))
-                     # Mark as dead? Tree class handles snow.
+                     layout.trees.append(Tree(rng.randint(100, width-100), rng.randint(200, height-100), variant="dead"))
                 
                 # Rocks guiding path (Narrow up center)
                 for y_rock in range(200, height, 100):
                      # Left wall
-                     self.rocks.append(WindBreakRock(width//2 - 150, y_rock))
+                     layout.rocks.append(WindBreakRock(width//2 - 150, y_rock))
                      # Right wall
-                     self.rocks.append(WindBreakRock(width//2 + 150, y_rock))
+                     layout.rocks.append(WindBreakRock(width//2 + 150, y_rock))
                 
                 # Signal Fire at Top Center
                 sf = SignalFire(width//2, 120)
-                self.campfires.append(sf)
+                layout.campfires.append(sf)
                 
                 # No construction site, no stockpile (final challenge)
-                self.stockpile = None
+                layout.stockpile = None
 
         # Fill remaining slots from zone_data if any (keeping it consistent)
         count = zone_data.resource_count if zone_data else 15
-        current_tree_count = len(self.trees)
+        current_tree_count = len(layout.trees)
         if current_tree_count < count:
             for _ in range(count - current_tree_count):
                 while True:
-                    x = random.randint(50, width - 100)
-                    y = random.randint(50, height - 100)
+                    x = rng.randint(50, width - 100)
+                    y = rng.randint(50, height - 100)
                     if abs(x - 400) > 80 and abs(y - 300) > 80:
-                        if math.hypot(x - spawn_safe_x, y - spawn_safe_y) > 80:
-                            self.trees.append(Tree(x, y))
+                        if safe_distance(x, y) > 80:
+                            layout.trees.append(Tree(x, y))
                             break
+        
+        return layout
+    
+    def apply_layout(self, layout):
+        """Swap a built zone in as the live one."""
+        self.current_zone = layout.zone_data
+        self.bg_surface = layout.bg_surface
+        self.trees = layout.trees
+        self.campfires = layout.campfires
+        self.stockpile = layout.stockpile
+        self.construction_site = layout.construction_site
+        self.npc = None
+        self.sticks = layout.sticks
+        self.deadfalls = layout.deadfalls
+        self.rocks = layout.rocks
+        self.rebuild_spatial_index()
+    
+    def rebuild_spatial_index(self):
+        """Re-index every static entity (after a zone load or bulk change)."""
+        self.spatial.clear()
+        for tree in self.trees:
+            # Every rect tree queries test (sprite, chop trunk, collision base)
+            self.spatial.insert(tree, tree.rect.union(tree.stump_rect).union(tree.hitbox), "tree")
+        for fire in self.campfires:
+            self.spatial.insert(fire, fire.rect.union(fire.box_rect), "campfire")
+        for stick in self.sticks:
+            if not stick.consumed:
+                self.spatial.insert(stick, stick.rect, "stick")
+        for df in self.deadfalls:
+            self.spatial.insert(df, df.rect, "deadfall")
+        for rock in self.rocks:
+            self.spatial.insert(rock, rock.rect, "rock")
+    
+    def sync_npcs(self, npcs):
+        """Bring moving NPCs up to date in the index (and drop removed ones)."""
+        current = {id(npc) for npc in npcs}
+        for npc in self.spatial.query_all("npc"):
+            if id(npc) not in current:
+                self.spatial.remove(npc)
+        for npc in npcs:
+            # Sprite-sized bounds from the top-left pos (the point distances use)
+            self.spatial.insert(npc, (int(npc.pos.x), int(npc.pos.y), 72, 96), "npc")
+    
+    def consume_stick(self, stick):
+        """Mark a loose stick as picked up."""
+        stick.consumed = True
+        self.spatial.remove(stick)
 
     def setup_haven(self):
         """Spawns safe-haven entities for stabilized Zone 1."""
@@ -737,6 +904,7 @@ class EnvironmentManager:
         fx, fy = 400, 350
         self.campfires = [Campfire(fx, fy)]
         self.campfires[0].fuel = 100.0
+        self.rebuild_spatial_index()
         
         # NPC (Elder) handled by NPCManager
         
@@ -749,36 +917,34 @@ class EnvironmentManager:
             px = fx + random.randint(-40, 40)
             py = fy + random.randint(-40, 40)
             color = random.choice([(255, 100, 0), (255, 200, 50), (200, 100, 50)])
-            p = Particle(px, py, color, size=3)
-            p.vy = random.uniform(-100, -50) # Float up
-            p.life = random.uniform(1.0, 3.0)
-            self.particles.append(p)
+            self.particles.emit(px, py, color, size=3,
+                                vy=random.uniform(-100, -50), # Float up
+                                life=random.uniform(1.0, 3.0))
     
     def spawn_campfire(self, x, y):
-        self.campfires.append(Campfire(x, y))
-        return self.campfires[-1]
+        fire = Campfire(x, y)
+        self.campfires.append(fire)
+        self.spatial.insert(fire, fire.rect.union(fire.box_rect), "campfire")
+        return fire
 
     def spawn_wood_chips(self, x, y, count=5):
         wood_colors = [(100, 70, 40), (140, 100, 60), (70, 50, 30)]
         for _ in range(count):
-             # Ensure Particle is defined, assuming it is from previous edit
-            p = Particle(x, y, random.choice(wood_colors))
-            self.particles.append(p)
+            self.particles.emit(x, y, random.choice(wood_colors))
             
     def spawn_leaf_fall(self, x, y, count=3):
         for _ in range(count):
-            self.particles.append(LeafParticle(x, y))
+            self.particles.emit_leaf(x, y)
 
     def spawn_footstep_dust(self, x, y):
         for _ in range(1):
              # 2x2 grey pixel
             color = random.choice([(150, 150, 150), (120, 120, 120)])
-            p = Particle(x, y, color, size=2)
             # Custom physics for footsteps (lighter, drift)
-            p.vx = random.uniform(-10, 10)
-            p.vy = random.uniform(-10, -5) # Slight puff up
-            p.life = 0.3
-            self.particles.append(p)
+            self.particles.emit(x, y, color, size=2,
+                                vx=random.uniform(-10, 10),
+                                vy=random.uniform(-10, -5), # Slight puff up
+                                life=0.3)
             
     def update_ticks(self):
         """Called by TickSystem to handle time-based resource regrowth."""
@@ -790,14 +956,16 @@ class EnvironmentManager:
                 sx = tree.rect.centerx + random.randint(-40, 40)
                 sy = tree.rect.bottom + random.randint(5, 25)
                 # Ensure within bounds
-                self.sticks.append(Stick(sx, sy))
+                stick = Stick(sx, sy)
+                self.sticks.append(stick)
+                self.spatial.insert(stick, stick.rect, "stick")
                 
         for df in self.deadfalls:
             df.update_tick()
 
     def update(self, dt):
         # Update particles
-        self.particles = [p for p in self.particles if p.update(dt)]
+        self.particles.update(dt)
         # Update Campfires
         for f in self.campfires:
             f.update(dt)
@@ -808,21 +976,33 @@ class EnvironmentManager:
             surface.blit(self.bg_surface, offset)
             
     def render_particles(self, surface, offset=(0,0)):
-        for p in self.particles:
-            p.render(surface, offset)
+        self.particles.render(surface, offset)
+
+    def get_particle_rects(self):
+        """Current particle bounds (for dirty-rect tracking)."""
+        return self.particles.get_rects()
+
+    def get_border_rect(self, run_state, screen_width, screen_height):
+        """Area covered by the animated fog wall, or None if hidden."""
+        if run_state.current_zone_id == 1 and self.fog_alpha > 0:
+            return pygame.Rect(screen_width - 100, 0, 100, screen_height)
+        return None
             
     # For campfire rendering, they should be Y-Sorted ideally.
     # We will expose them in main.py via env_manager.campfires
 
-    def draw_border(self, screen, run_state, dt):
-        """Draws the spatial boundary (fog wall)."""
+    def update_border(self, run_state, dt):
+        """Fades the fog wall out once Zone 1 is stabilized."""
         if run_state.current_zone_id == 1:
             if not run_state.zone_1_stabilized:
                 self.fog_alpha = 180
             else:
                 fade_speed = (180.0 / 3.0) # 3 seconds
                 self.fog_alpha = max(0, self.fog_alpha - fade_speed * dt)
-            
+
+    def draw_border(self, screen, run_state):
+        """Draws the spatial boundary (fog wall)."""
+        if run_state.current_zone_id == 1:
             if self.fog_alpha > 0:
                 s_w, s_h = screen.get_size()
                 # Draw along the right edge
@@ -0,0 +1,272 @@
+"""
+Headless simulation runner.
+
+Steps the survival simulation without a window, audio or frame pacing so
+balance changes can be checked over thousands of simulated minutes.
+
+    python headless.py --minutes 30 --runs 20 --seed 1
+    python headless.py --script forager.json --output results.json
+
+A script is a JSON list of input steps (or {"loop": true, "steps": [...]}):
+
+    [{"duration": 2.0, "move": [1, 0]},
+     {"duration": 4.0, "action": true},
+     {"duration": 0.1, "swap": true}]
+
+Inputs are fed through the same controller path the player uses for a
+gamepad. Without a script the player stands still.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import json
+import random
+import sys
+import time
+
+import pygame
+
+from player import Player
+from environment import EnvironmentManager
+from data.run_state import RunState
+from systems.zone_manager import ZoneManager
+from systems.tick_system import TickSystem
+from systems.npc_manager import NPCManager
+from systems.event_manager import EventManager
+from systems.tutorial_manager import TutorialManager
+from constants import SIM_DT, HITSTOP_DURATION
+from main import advance_tutorial, setup_stabilized_haven, get_zone_transition, enter_zone
+
+
+class ScriptedController:
+    """Stands in for a pygame joystick and replays a timeline of inputs."""
+
+    def __init__(self, steps, loop=True):
+        self.steps = steps
+        self.loop = loop
+        self.time = 0.0
+        self.total = sum(step.get("duration", 1.0) for step in steps)
+        self.current = steps[0] if steps else {}
+
+    def advance(self, dt):
+        """Move the timeline forward and pick the active step."""
+        self.time += dt
+        if not self.steps:
+            return
+        t = self.time % self.total if self.loop else self.time
+        for step in self.steps:
+            t -= step.get("duration", 1.0)
+            if t < 0:
+                self.current = step
+                return
+        self.current = {} # Script finished: no input
+
+    def get_axis(self, axis):
+        move = self.current.get("move", (0, 0))
+        return move[axis] if axis < len(move) else 0.0
+
+    def get_button(self, button):
+        if button == 0: return self.current.get("action", False) # Chop / interact
+        if button == 1: return self.current.get("ignite", False)
+        if button == 2: return self.current.get("swap", False)
+        return False
+
+
+def load_script(path):
+    """
+    Read a script file into a ScriptedController.
+    Raises ValueError for a script with no steps or a step that never ends.
+    """
+    with open(path, "r") as f:
+        data = json.load(f)
+    steps, loop = (data.get("steps", []), data.get("loop", True)) if isinstance(data, dict) else (data, True)
+    if not isinstance(steps, list) or not steps:
+        raise ValueError("script has no steps")
+    for i, step in enumerate(steps):
+        duration = step.get("duration", 1.0) if isinstance(step, dict) else None
+        if not isinstance(duration, (int, float)) or duration <= 0:
+            raise ValueError(f"step {i} needs a positive duration")
+    return ScriptedController(steps, loop)
+
+
+def run_simulation(minutes=10.0, seed=None, script=None, dt=SIM_DT, start_zone=0):
+    """
+    Run one simulated game and return a summary dict.
+
+    Mirrors the PLAYING update order in main.main(). The Zone 2 redemption
+    cutscene needs dialogue input, so it resolves immediately here.
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    zone_manager = ZoneManager()
+    env_manager = EnvironmentManager()
+    tick_system = TickSystem(tick_interval=1.2)
+    npc_manager = NPCManager()
+    event_manager = EventManager()
+    tutorial_manager = TutorialManager()
+
+    notifications = []
+    def notify(text, duration=3.0, type_="info"):
+        notifications.append((round(elapsed, 2), text))
+
+    # New game (same setup as the "new_game" menu action)
+    zone_manager.reset()
+    run_state = RunState()
+    if start_zone:
+        run_state.current_zone_id = start_zone
+        run_state.tutorial_completed = True
+    zone = zone_manager.get_zone(run_state.current_zone_id)
+    env_manager.load_zone(zone, 1280, 720)
+    player = Player()
+    if run_state.current_zone_id == 0:
+        player.pos.x, player.pos.y = 100, 300
+    npc_manager.clear_npcs()
+    npc_manager.spawn_npc_for_zone(zone, run_state, 1280, 720)
+
+    controller = script
+    hitstop_timer = 0.0
+    elapsed = 0.0
+    max_zone = run_state.current_zone_id
+    cold_snaps = 0
+    end_time = minutes * 60.0
+    wall_start = time.perf_counter()
+
+    while elapsed < end_time and run_state.is_alive:
+        elapsed += dt
+        if controller:
+            controller.advance(dt)
+
+        # Hit-stop freezes the world briefly, as in main
+        if hitstop_timer > 0:
+            hitstop_timer -= dt
+            continue
+
+        tick_system.update(dt, run_state, env_manager, player, None, event_manager)
+        if run_state.body_temp <= 0 and run_state.is_alive:
+            run_state.is_alive = False
+            break
+
+        was_cold_snap = event_manager.active_event == "COLD_SNAP"
+        event_manager.update(dt, run_state)
+        if event_manager.active_event == "COLD_SNAP" and not was_cold_snap:
+            cold_snaps += 1
+
+        env_manager.update(dt)
+        tutorial_manager.update(dt, run_state, player)
+        for tree in env_manager.trees:
+            tree.update(dt)
+
+        if player.redemption_event:
+            player.redemption_event = False
+            if not run_state.zone_2_redeemed:
+                run_state.zone_2_redeemed = True
+                zone_manager.stabilize_zone(2)
+                notify("THE WIND GAP IS STABILIZED")
+
+        npc_manager.update(dt, run_state, env_manager)
+        old_pos = (player.pos.x, player.pos.y)
+        player.update(dt, env_manager.trees, env_manager, controller, run_state)
+        advance_tutorial(run_state, player, old_pos, notify)
+
+        if player.hit_impact:
+            hitstop_timer = HITSTOP_DURATION
+            player.hit_impact = False
+
+        if player.stabilization_event:
+            player.stabilization_event = False
+            notify("ZONE 1 STABILIZED")
+            if run_state.current_zone_id == 1:
+                setup_stabilized_haven(run_state, env_manager, npc_manager)
+
+        transition_zone = get_zone_transition(player, run_state, env_manager, event_manager, notify)
+        if transition_zone > 0:
+            enter_zone(transition_zone, run_state, zone_manager, env_manager, npc_manager, player)
+            max_zone = max(max_zone, transition_zone)
+
+    wall_time = time.perf_counter() - wall_start
+    return {
+        "seed": seed,
+        "survived": run_state.is_alive,
+        "survival_time": round(elapsed, 2),
+        "ticks": run_state.tick_count,
+        "logs_gathered": run_state.total_logs_gathered,
+        "logs_deposited": {
+            "zone_1": run_state.logs_deposited_in_zone_1,
+            "zone_2": run_state.logs_deposited_in_zone_2,
+            "zone_3": run_state.logs_deposited_in_zone_3,
+        },
+        "zone_reached": max_zone,
+        "final_zone": run_state.current_zone_id,
+        "body_temp": round(run_state.body_temp, 1),
+        "cold_snaps": cold_snaps,
+        "notifications": notifications,
+        "wall_time": round(wall_time, 3),
+    }
+
+
+def summarize(results):
+    """Aggregate stats over several runs."""
+    count = len(results)
+    zones = {}
+    for r in results:
+        zones[r["zone_reached"]] = zones.get(r["zone_reached"], 0) + 1
+    return {
+        "runs": count,
+        "deaths": sum(1 for r in results if not r["survived"]),
+        "mean_survival_time": round(sum(r["survival_time"] for r in results) / count, 2),
+        "mean_logs_gathered": round(sum(r["logs_gathered"] for r in results) / count, 2),
+        "zone_reached": {str(z): n for z, n in sorted(zones.items())},
+        "simulated_minutes": round(sum(r["survival_time"] for r in results) / 60.0, 2),
+        "wall_time": round(sum(r["wall_time"] for r in results), 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the survival simulation without a display.")
+    parser.add_argument("--minutes", type=float, default=10.0, help="simulated minutes per run")
+    parser.add_argument("--runs", type=int, default=1, help="number of runs (seeds increase per run)")
+    parser.add_argument("--seed", type=int, default=0, help="first random seed")
+    parser.add_argument("--script", help="JSON input script (default: no input)")
+    parser.add_argument("--zone", type=int, default=0, help="start in this zone (skips the tutorial)")
+    parser.add_argument("--dt", type=float, default=SIM_DT, help="simulation step in seconds (default: the game's fixed step)")
+    parser.add_argument("--output", help="write the JSON summary here instead of stdout")
+    parser.add_argument("--verbose", action="store_true", help="keep the game's console logging")
+    args = parser.parse_args(argv)
+    if args.script:
+        try:
+            load_script(args.script)
+        except (OSError, ValueError) as e: # json.JSONDecodeError is a ValueError
+            parser.error(f"bad --script {args.script}: {e}")
+
+    pygame.init()
+
+    results = []
+    for i in range(args.runs):
+        script = load_script(args.script) if args.script else None
+        if args.verbose:
+            result = run_simulation(args.minutes, args.seed + i, script, args.dt, args.zone)
+        else:
+            # The game logs every tick; keep stdout clean for the summary
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                result = run_simulation(args.minutes, args.seed + i, script, args.dt, args.zone)
+        results.append(result)
+
+    report = {"summary": summarize(results), "runs": results}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+        print(f"Wrote {len(results)} runs to {args.output}")
+    else:
+        print(text)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,5 +1,9 @@
 import pygame
 import sys
+from constants import FPS_LIMITS
+from systems.lighting_engine import LightingEngine
+from systems.presenter import Presenter
+from ui.text import get_font, render_text
 
 class GameState:
     MAIN_MENU = "main_menu"
@@ -20,16 +24,16 @@ class MenuSystem:
         
         # Fonts
         try:
-            self.title_font = pygame.font.SysFont("Stencil", 72, bold=True)
-            self.subtitle_font = pygame.font.SysFont("Papyrus", 48)
-            self.menu_font = pygame.font.SysFont("Papyrus", 32)
-            self.small_font = pygame.font.SysFont("Papyrus", 20)
+            self.title_font = get_font("Stencil", 72, bold=True)
+            self.subtitle_font = get_font("Papyrus", 48)
+            self.menu_font = get_font("Papyrus", 32)
+            self.small_font = get_font("Papyrus", 20)
         except:
             # Fallback if fonts not available
-            self.title_font = pygame.font.SysFont("Arial", 72, bold=True)
-            self.subtitle_font = pygame.font.SysFont("Arial", 48)
-            self.menu_font = pygame.font.SysFont("Arial", 32)
-            self.small_font = pygame.font.SysFont("Arial", 20)
+            self.title_font = get_font("Arial", 72, bold=True)
+            self.subtitle_font = get_font("Arial", 48)
+            self.menu_font = get_font("Arial", 32)
+            self.small_font = get_font("Arial", 20)
         
         # Menu options (dynamic based on save file)
         self.update_menu_options()
@@ -83,7 +87,12 @@ class MenuSystem:
                 ("Display Mode", "display_mode", "graphics"),
                 ("Resolution", "resolution", "graphics"),
                 ("VSync", "vsync", "graphics"),
-                ("Show FPS", "show_fps", "graphics")
+                ("Show FPS", "show_fps", "graphics"),
+                ("Dirty Rects", "dirty_rects", "graphics"),
+                ("FPS Limit", "fps_limit", "graphics"),
+                ("Light Quality", "light_resolution", "graphics"),
+                ("Scaling", "scale_filter", "graphics"),
+                ("Profile Log", "profile_log", "graphics")
             ]),
             ("Gameplay", [
                 ("Difficulty", "difficulty", "gameplay")
@@ -318,6 +327,20 @@ class MenuSystem:
                 current_idx = resolutions.index(current_value) if current_value in resolutions else 0
                 new_idx = (current_idx + 1) % len(resolutions)
                 self.game_settings.set(cat, key, resolutions[new_idx])
+            elif key == "fps_limit":
+                current_idx = FPS_LIMITS.index(current_value) if current_value in FPS_LIMITS else 1
+                new_idx = (current_idx + 1) % len(FPS_LIMITS)
+                self.game_settings.set(cat, key, FPS_LIMITS[new_idx])
+            elif key == "light_resolution":
+                divisors = LightingEngine.RESOLUTION_DIVISORS
+                current_idx = divisors.index(current_value) if current_value in divisors else 0
+                new_idx = (current_idx + 1) % len(divisors)
+                self.game_settings.set(cat, key, divisors[new_idx])
+            elif key == "scale_filter":
+                filters = Presenter.FILTERS
+                current_idx = filters.index(current_value) if current_value in filters else 0
+                new_idx = (current_idx + 1) % len(filters)
+                self.game_settings.set(cat, key, filters[new_idx])
             
             if cat == "graphics" and (key == "display_mode" or key == "resolution"):
                 self.return_state = "settings_applied"
@@ -342,7 +365,7 @@ class MenuSystem:
         """Draw text with an outline for better readability."""
         # Draw outline (8 directions)
         for dx, dy in [(-2,-2), (-2,0), (-2,2), (0,-2), (0,2), (2,-2), (2,0), (2,2)]:
-            outline_surf = font.render(text, True, outline_color)
+            outline_surf = render_text(font, text, outline_color)
             if center:
                 outline_rect = outline_surf.get_rect(center=(x + dx, y + dy))
             else:
@@ -350,7 +373,7 @@ class MenuSystem:
             screen.blit(outline_surf, outline_rect)
         
         # Draw main text
-        text_surf = font.render(text, True, color)
+        text_surf = render_text(font, text, color)
         if center:
             text_rect = text_surf.get_rect(center=(x, y))
         else:
@@ -372,17 +395,17 @@ class MenuSystem:
         font = self.title_font
         
         # Shadow
-        shadow_surf = font.render(text, True, (0, 0, 0))
+        shadow_surf = render_text(font, text, (0, 0, 0))
         shadow_rect = shadow_surf.get_rect(center=(cx + 2, cy + 2))
         screen.blit(shadow_surf, shadow_rect)
         
         # Outline (Dark Orange)
-        outline_surf = font.render(text, True, (180, 80, 0))
+        outline_surf = render_text(font, text, (180, 80, 0))
         outline_rect = outline_surf.get_rect(center=(cx + 1, cy + 1))
         screen.blit(outline_surf, outline_rect)
         
         # Main (White)
-        main_surf = font.render(text, True, (255, 255, 255))
+        main_surf = render_text(font, text, (255, 255, 255))
         main_rect = main_surf.get_rect(center=(cx, cy))
         screen.blit(main_surf, main_rect)
         
@@ -404,7 +427,7 @@ class MenuSystem:
                                            rect.left - 40, rect.centery + 5, center=False) # +5 y adjust for caret visual center
         
         # Footer
-        footer = self.small_font.render("Use Arrow Keys to Navigate | Enter to Select", True, (200, 200, 200))
+        footer = render_text(self.small_font, "Use Arrow Keys to Navigate | Enter to Select", (200, 200, 200))
         footer_rect = footer.get_rect(center=(self.screen_width // 2, self.screen_height - 40))
         screen.blit(footer, footer_rect)
     
@@ -426,7 +449,7 @@ class MenuSystem:
             # Category header (highlight if selected)
             is_selected_cat = (col_idx == self.settings_selected_category)
             cat_color = self.selected_color if is_selected_cat else self.menu_color
-            cat_text = self.menu_font.render(category_name, True, cat_color)
+            cat_text = render_text(self.menu_font, category_name, cat_color)
             screen.blit(cat_text, (x_pos, y_offset))
             
             # Options
@@ -444,6 +467,10 @@ class MenuSystem:
                     value_str = "ON" if value else "OFF"
                 elif isinstance(value, int) and key.endswith("volume"):
                     value_str = f"{value}%"
+                elif key == "fps_limit":
+                    value_str = str(value) if value else "Unlimited"
+                elif key == "light_resolution":
+                    value_str = "Full" if value == 1 else f"1/{value}"
                 else:
                     value_str = str(value)
                 
@@ -451,14 +478,14 @@ class MenuSystem:
                 label_color = self.selected_color if is_selected else self.menu_color
                 value_color = self.selected_color if is_selected else self.subtitle_color
                 
-                label_surf = self.small_font.render(f"{label}:", True, label_color)
-                value_surf = self.small_font.render(value_str, True, value_color)
+                label_surf = render_text(self.small_font, f"{label}:", label_color)
+                value_surf = render_text(self.small_font, value_str, value_color)
                 screen.blit(label_surf, (x_pos, y_pos))
                 screen.blit(value_surf, (x_pos + 200, y_pos))
                 
                 # Draw selection indicator
                 if is_selected:
-                    indicator = self.small_font.render(">", True, self.selected_color)
+                    indicator = render_text(self.small_font, ">", self.selected_color)
                     screen.blit(indicator, (x_pos - 20, y_pos))
         
         # Instructions
@@ -469,7 +496,7 @@ class MenuSystem:
         
         y_inst = self.screen_height - 100
         for i, inst in enumerate(instructions):
-            inst_surf = self.small_font.render(inst, True, (180, 180, 180))
+            inst_surf = render_text(self.small_font, inst, (180, 180, 180))
             inst_rect = inst_surf.get_rect(center=(self.screen_width // 2, y_inst + i * 30))
             screen.blit(inst_surf, inst_rect)
     
@@ -495,12 +522,12 @@ class MenuSystem:
                                                self.screen_width // 2, start_y + i * 60)
             
             if i == self.selected_index:
-                indicator = self.menu_font.render(">", True, self.selected_color)
+                indicator = render_text(self.menu_font, ">", self.selected_color)
                 screen.blit(indicator, (rect.left - 40, rect.top))
         
         # Feedback message (e.g., "Saved!")
         if self.message_timer > 0:
-            msg_surf = self.menu_font.render(self.message, True, (100, 255, 100))
+            msg_surf = render_text(self.menu_font, self.message, (100, 255, 100))
             msg_rect = msg_surf.get_rect(center=(self.screen_width // 2, self.screen_height - 100))
             screen.blit(msg_surf, msg_rect)
         
@@ -514,21 +541,21 @@ class MenuSystem:
         
         cx, cy = self.screen_width // 2, self.screen_height // 2
         
-        font_large = pygame.font.SysFont("Times New Roman", 48, italic=True)
-        font_small = pygame.font.SysFont("Times New Roman", 24)
+        font_large = get_font("Times New Roman", 48, italic=True)
+        font_small = get_font("Times New Roman", 24)
         
         # Main Message
-        t1 = font_large.render("GIDEON FOUND THE LIGHT.", True, (10, 10, 20))
+        t1 = render_text(font_large, "GIDEON FOUND THE LIGHT.", (10, 10, 20))
         r1 = t1.get_rect(center=(cx, cy - 50))
         screen.blit(t1, r1)
         
         # Dev Credit
-        t2 = font_small.render("Developed by Family Game Company LLC", True, (50, 50, 60))
+        t2 = render_text(font_small, "Developed by Family Game Company LLC", (50, 50, 60))
         r2 = t2.get_rect(center=(cx, cy + 50))
         screen.blit(t2, r2)
         
         # Return Hint
-        t3 = font_small.render("[Press Key to Return]", True, (150, 150, 160))
+        t3 = render_text(font_small, "[Press Key to Return]", (150, 150, 160))
         r3 = t3.get_rect(center=(cx, self.screen_height - 50))
         screen.blit(t3, r3)
             
@@ -544,8 +571,7 @@ class MenuSystem:
         alpha = int(self.fade_alpha)
         
         # Center: "THE COLD TOOK YOU"
-        title_surf = self.title_font.render("THE COLD TOOK YOU", True, (255, 255, 255))
-        title_surf.set_alpha(alpha)
+        title_surf = render_text(self.title_font, "THE COLD TOOK YOU", (255, 255, 255), alpha=alpha)
         title_rect = title_surf.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
         screen.blit(title_surf, title_rect)
         
@@ -557,8 +583,7 @@ class MenuSystem:
         else:
             stats_text = "Days Survived: 0"
             
-        stats_surf = self.subtitle_font.render(stats_text, True, (200, 200, 255))
-        stats_surf.set_alpha(alpha)
+        stats_surf = render_text(self.subtitle_font, stats_text, (200, 200, 255), alpha=alpha)
         stats_rect = stats_surf.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
         screen.blit(stats_surf, stats_rect)
         
@@ -572,7 +597,7 @@ class MenuSystem:
                                                    self.screen_width // 2, start_y + i * 60)
                 
                 if i == self.selected_index:
-                    indicator = self.menu_font.render(">", True, self.selected_color)
+                    indicator = render_text(self.menu_font, ">", self.selected_color)
                     screen.blit(indicator, (rect.left - 40, rect.top))
 
     def update(self, dt):
@@ -23,6 +23,10 @@ PALETTE = {
 class Player:
     def __init__(self):
         self.pos = pygame.Vector2(400, 300)
+        # Interpolation between fixed simulation steps (see interpolate)
+        self.prev_pos = pygame.Vector2(self.pos)
+        self.render_pos = pygame.Vector2(self.pos)
+        self.light = None # Persistent LightingEngine handle (see sync_light)
         self.speed = 180 # Slightly slower for "weight"
         self.pixel_size = 4
         self.grid_width = 18
@@ -69,7 +73,8 @@ class Player:
         self.last_move_direction = pygame.Vector2(0, 0)
         
         # Squash & Stretch
-        self.squash_frames_remaining = 0
+        self.squash_timer = 0.0
+        self.squash_duration = 2 / 60
         self.squash_scale_x = 1.0
         self.squash_scale_y = 1.0
         
@@ -81,12 +86,14 @@ class Player:
         self.hit_impact = False # Flag for hit-stop
         self.stabilization_event = False
         self.redemption_event = False
-        self.swing_arc_frames = 0
+        self.swing_arc_timer = 0.0
+        self.swing_arc_visible = False
         
         self.current_cycle = IDLE_CYCLE
         self.current_grid = self.current_cycle[self.frame_index]
         
         self.image = None
+        self.image_version = 0 # Bumped whenever the displayed frame changes (dirty-rect tracking)
         self.render_cache()
 
     def change_temp(self, amount, run_state):
@@ -118,29 +125,17 @@ class Player:
         return pygame.Rect(cx - size//2, cy + dist, size, size)
 
     def render_cache(self, palette=None):
+        """Pick the shared atlas frame for the current pose and palette."""
         if palette is None:
             palette = PALETTE
-            
-        # Passing active_tool and is_chopping to the grid generator would be ideal, 
-        # but for now matrices.py handles the drawing based on frame.
-        # Let's ensure build_hero_grid is updated to accept these states.
-        from data.matrices import build_hero_grid 
-        self.current_grid = build_hero_grid(self.frame_index, self.facing, self.active_tool, self.is_chopping, self.is_moving, self.is_lighting, self.is_igniting)
-        
-        width = self.grid_width * self.pixel_size
-        height = self.grid_height * self.pixel_size
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.image.fill((0, 0, 0, 0))
-        
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                sample_x = (self.grid_width - 1 - x) if self.flip_h else x
-                val = self.current_grid[y][sample_x]
-                if val in palette:
-                    color = palette[val]
-                    if color[3] if len(color) > 3 else True:
-                        rect = (x * self.pixel_size, y * self.pixel_size, self.pixel_size, self.pixel_size)
-                        pygame.draw.rect(self.image, color, rect)
+        
+        from systems.sprite_atlas import character_atlas
+        pose = (self.frame_index, self.facing, self.active_tool, self.is_chopping, self.is_moving, self.is_lighting, self.is_igniting)
+        self.current_grid = character_atlas.get_grid(*pose)
+        image = character_atlas.get_frame(palette, *pose, flip_h=self.flip_h)
+        if image is not self.image:
+            self.image = image
+            self.image_version += 1
 
     def update(self, dt, trees=[], env_manager=None, controller=None, run_state=None, camera=None, floating_texts=None, audio_manager=None):
         if run_state and not run_state.is_alive:
@@ -155,6 +150,12 @@ class Player:
                 from ui.floating_text import FloatingText
                 floating_texts.append(FloatingText(self.pos.x + 36, self.pos.y, text, color))
         
+        # Trees that could touch rect (spatial index when available, else the full list)
+        def trees_near(rect):
+            if env_manager:
+                return env_manager.spatial.query_rect(rect, "tree")
+            return trees
+        
         # === DUAL CLOCK UPDATES ===
         
         # Action Tick (0.6s) - For Interactions/Chopping
@@ -266,7 +267,7 @@ class Player:
                                 interaction_done = True
 
                     if not interaction_done:
-                        for fire in env_manager.campfires:
+                        for fire in env_manager.spatial.query_radius(self.pos, 65, "campfire"):
                             dist = (pygame.Vector2(fire.box_rect.center) - self.pos).length()
                             if dist < 65: # Reachable
                                 if run_state and run_state.inventory["logs"] > 0:
@@ -342,7 +343,7 @@ class Player:
         # --- INSTANT INTERACTIONS (Sticks/Deadfall) ---
         if env_manager:
             # Auto-collect loose sticks on ground
-            for stick in env_manager.sticks:
+            for stick in env_manager.spatial.query_radius(self.pos, 30, "stick"):
                 if not stick.consumed:
                     dist = (self.pos - stick.pos).length()
                     if dist < 30:
@@ -358,17 +359,17 @@ class Player:
                             # Prompt: "Show a small popup text: 'Need real wood (Logs).'"
                             # If we spam text every frame, it overlaps.
                             # We can check a timer or just chance?
-                            if random.random() < 0.05: # Occasional reminder
+                            if random.random() < 3.0 * dt: # Occasional reminder (~3 per second)
                                  spawn_text("Need Logs", (200, 50, 50))
                             pass 
                         else:
-                            stick.consumed = True
+                            env_manager.consume_stick(stick)
                             run_state.inventory["sticks"] += 1
                             spawn_text("+STICK", (150, 120, 80))
             
             # Deadfall Piles (Require Action Trigger)
             if action_triggered:
-                for df in env_manager.deadfalls:
+                for df in env_manager.spatial.query_radius(self.pos, 50, "deadfall"):
                     dist = (self.pos - df.pos).length()
                     if dist < 50:
                         if df.take_stick():
@@ -385,13 +386,13 @@ class Player:
             # Hit on tick
             if action_triggered:
                 print("[TICK] Chop Swing!")
-                self.swing_arc_frames = 3
+                self.swing_arc_timer = 3 / 60
                 hit_rect = self.target_hitbox
                 
                 # HIT LOGIC
                 hit_something = False
                 if env_manager:
-                    for tree in trees:
+                    for tree in trees_near(hit_rect):
                         if tree.state == tree.STATE_FULL and tree.stump_rect.colliderect(hit_rect):
                             hit_something = True
                             env_manager.spawn_wood_chips(tree.rect.centerx, tree.rect.bottom - 20, 5)
@@ -401,7 +402,7 @@ class Player:
                             if camera:
                                 camera.shake(2)
                             
-                            self.squash_frames_remaining = 2
+                            self.squash_timer = self.squash_duration
                             self.squash_scale_x = 1.1 
                             self.squash_scale_y = 0.9 
                             self.hit_impact = True 
@@ -471,7 +472,7 @@ class Player:
              # X
              self.pos.x += move.x
              player_rect.x = self.pos.x + 20
-             for tree in trees:
+             for tree in trees_near(player_rect):
                  if tree.state != tree.STATE_STUMP and tree.hitbox.colliderect(player_rect):
                      self.pos.x -= move.x # Revert
                      break
@@ -480,7 +481,7 @@ class Player:
              self.pos.y += move.y
              player_rect.y = self.pos.y + 70 # Update Y
              player_rect.x = self.pos.x + 20 # Keep X updated
-             for tree in trees:
+             for tree in trees_near(player_rect):
                  if tree.state != tree.STATE_STUMP and tree.hitbox.colliderect(player_rect):
                      self.pos.y -= move.y
                      break
@@ -536,15 +537,15 @@ class Player:
         self.tilt_angle += tilt_diff * min(1.0, dt * self.tilt_speed)
         
         # 3. Squash & Stretch countdown
-        if self.squash_frames_remaining > 0:
-            self.squash_frames_remaining -= 1
-            if self.squash_frames_remaining == 0:
+        if self.squash_timer > 0:
+            self.squash_timer -= dt
+            if self.squash_timer <= 0:
                 self.squash_scale_x = 1.0
                 self.squash_scale_y = 1.0
         
         # 4. Ghosting trail
         if self.is_moving and self.image:
-            self.ghost_positions.append((self.pos.x, self.pos.y, self.image.copy()))
+            self.ghost_positions.append((self.pos.x, self.pos.y, self.image)) # Shared atlas frame, no copy
             if len(self.ghost_positions) > self.ghost_max_trail:
                 self.ghost_positions.pop(0)
         else:
@@ -595,42 +596,83 @@ class Player:
         self.render_cache(death_p)
 
 
+    def update_effects(self, dt):
+        """Advance visual-only effects. Called once per rendered frame."""
+        if self.swing_arc_timer > 0:
+            self.swing_arc_timer -= dt
+            self.swing_arc_visible = True
+        else:
+            self.swing_arc_visible = False
+
+    def begin_step(self):
+        """Remember the position before a fixed simulation step."""
+        self.prev_pos.update(self.pos)
+
+    def interpolate(self, alpha):
+        """Blend the last two simulation steps into render_pos (0 = previous, 1 = current)."""
+        if self.pos.distance_squared_to(self.prev_pos) > 64 * 64:
+            # Teleported (respawn, zone change): don't smear across the screen
+            self.prev_pos.update(self.pos)
+        self.render_pos.update(self.prev_pos.lerp(self.pos, alpha))
+
+    def reset_interpolation(self):
+        """Snap the rendered position to the simulated one."""
+        self.prev_pos.update(self.pos)
+        self.render_pos.update(self.pos)
+
+    def sync_light(self, lighting_engine):
+        """Keep the personal light on the rendered player."""
+        x, y = self.render_pos.x + 36, self.render_pos.y + 48
+        if self.light is None:
+            self.light = lighting_engine.add_player_light(x, y)
+            return
+        self.light.set_position(x, y)
+        lighting_engine.keep(self.light)
+
+    def get_render_state(self):
+        """Screen bounds and visual state, used for dirty-rect tracking."""
+        x, y = int(self.render_pos.x), int(self.render_pos.y)
+        if self.swing_arc_visible:
+            # Arc surface (100x100) can extend 30px around the sprite
+            return pygame.Rect(x - 30, y - 30, 140, 140), (self.image_version, x, y, self.facing, self.flip_h)
+        return pygame.Rect(x, y, 72, 96), (self.image_version, x, y)
+
     def draw(self, screen):
-        """Blit the cached surface at the center of current position."""
-        rect = self.image.get_rect(center=(self.pos.x + 32, self.pos.y + 32)) 
+        """Blit the cached surface at the interpolated position."""
+        pos = self.render_pos
+        rect = self.image.get_rect(center=(pos.x + 32, pos.y + 32)) 
         # Wait, pos is top-left usually? 
-        # Previous draw code: rect = self.image.get_rect(center=(self.pos.x, self.pos.y))
+        # Previous draw code: rect = self.image.get_rect(center=(pos.x, pos.y))
         # If pos is top-left, drawing at center=pos puts it offset by half!
         # Standard pygame: blit at pos.
-        screen.blit(self.image, (self.pos.x, self.pos.y))
+        screen.blit(self.image, (pos.x, pos.y))
         
-        # Hit Arc Visualization
-        if self.swing_arc_frames > 0:
-            self.swing_arc_frames -= 1
+        # Hit Arc Visualization (countdown advanced in update_effects)
+        if self.swing_arc_visible:
             s = pygame.Surface((100, 100), pygame.SRCALPHA)
             rect = pygame.Rect(10, 10, 80, 80)
             
             start_angle = 0
             stop_angle = 0
-            offset_pos = (self.pos.x - 14, self.pos.y - 12) # Center-ish adjustment
+            offset_pos = (pos.x - 14, pos.y - 12) # Center-ish adjustment
             
             if self.facing == "DOWN":
                 start_angle = math.pi * 0.25
                 stop_angle = math.pi * 0.75
-                offset_pos = (self.pos.x - 14, self.pos.y + 10)
+                offset_pos = (pos.x - 14, pos.y + 10)
             elif self.facing == "UP":
                 start_angle = math.pi * 1.25
                 stop_angle = math.pi * 1.75
-                offset_pos = (self.pos.x - 14, self.pos.y - 30)
+                offset_pos = (pos.x - 14, pos.y - 30)
             elif self.facing == "SIDE" and self.flip_h: # LEFT
                 start_angle = math.pi * 0.75
                 stop_angle = math.pi * 1.25
-                offset_pos = (self.pos.x - 30, self.pos.y - 10)
+                offset_pos = (pos.x - 30, pos.y - 10)
             elif self.facing == "SIDE" and not self.flip_h: # RIGHT
                 # Right side split
                 pygame.draw.arc(s, (255, 255, 255, 180), rect, 0, math.pi * 0.25, 4)
                 pygame.draw.arc(s, (255, 255, 255, 180), rect, math.pi * 1.75, math.pi * 2, 4)
-                screen.blit(s, (self.pos.x + 10, self.pos.y - 10))
+                screen.blit(s, (pos.x + 10, pos.y - 10))
                 return # Done for right
 
             if start_angle != 0 or stop_angle != 0:
@@ -20,7 +20,12 @@ class GameSettings:
                 "resolution": "1280x720",
                 "vsync": True,
                 "show_fps": False,
-                "particle_effects": True
+                "particle_effects": True,
+                "dirty_rects": False,  # Redraw only changed regions
+                "fps_limit": 60,  # Render cap; simulation runs at a fixed rate (0 = unlimited)
+                "light_resolution": 1,  # Light map divisor: 1 (full), 2, 4, 8 (smoothscaled up)
+                "scale_filter": "Nearest",  # Window scaling: Nearest, Scale2x, Smooth
+                "profile_log": False  # Append per-frame phase timings to profile_log.jsonl
             },
             "gameplay": {
                 "difficulty": "Normal",  # Easy, Normal, Hard
@@ -1,5 +1,12 @@
 import pygame
 import os
+import queue
+import threading
+import time
+from collections import deque
+
+from systems.voice_pool import VoicePool, SOUND_CATEGORIES, DEFAULT_CATEGORY
+from utils.bake_cache import bake_cache
 
 class DummySound:
     def play(self, loops=0, maxtime=0, fade_ms=0): pass
@@ -8,6 +15,17 @@ class DummySound:
     def get_volume(self): return 0.0
 
 class AudioManager:
+    """Sound effects, ambience and music behind one audio service thread.
+
+    The service thread owns every mixer call. Public methods only post a
+    command to a queue and return at once; the thread runs the matching
+    underscore method, and between commands it keeps the music stream fed.
+    Loading and generating sounds happens once at startup on the caller's
+    thread.
+    """
+    VOICE_POOL_SIZE = 8 # Shared channels for untargeted sound effects
+    IDLE_WAIT = 0.25 # Longest the service sleeps with nothing to do
+
     def __init__(self):
         try:
             pygame.mixer.init()
@@ -17,6 +35,7 @@ class AudioManager:
             self.mixer_initialized = False
             
         self.sounds = {}
+        self.gains = {} # Key: sound name -> base level relative to the SFX volume
         self.music_volume = 0.5
         self.sfx_volume = 0.7
         
@@ -25,18 +44,78 @@ class AudioManager:
             self.ambient_channel = pygame.mixer.Channel(0) 
             self.step_channel = pygame.mixer.Channel(1)    
             self.action_channel = pygame.mixer.Channel(2)  
+            self.music_channel = pygame.mixer.Channel(3) # Streamed music blocks
+            # Everything else goes through the voice pool on channels 4+
+            pygame.mixer.set_num_channels(4 + self.VOICE_POOL_SIZE)
+            pygame.mixer.set_reserved(4 + self.VOICE_POOL_SIZE)
+            self.voices = VoicePool(4, self.VOICE_POOL_SIZE)
         else:
             self.ambient_channel = None
             self.step_channel = None
             self.action_channel = None
+            self.music_channel = None
+            self.voices = None
+        
+        # Stats (set up before the service thread, which updates them)
+        self.commands_run = 0
+        self.max_depth = 0
+        self.latencies = deque(maxlen=120) # Seconds from post to run
+        
+        # Audio service thread: (posted time, method, args) commands, None to stop
+        self.commands = queue.SimpleQueue()
+        self.voice_stats = {"active": 0, "size": 0, "played": 0, "stolen": 0, "dropped": 0}
+        self.music = None
+        self.service_thread = None
+        if self.mixer_initialized:
+            self.service_thread = threading.Thread(target=self._service_loop, daemon=True)
+            self.service_thread.start()
         
-        # Procedural Music
+        # Procedural Music (after the service starts: it posts its Sound setup there)
         try:
             from systems.music_manager import MusicManager
             self.music = MusicManager(self)
         except ImportError:
             self.music = None
         
+    def _post(self, method, *args):
+        """Queue a call for the service thread (never blocks)."""
+        if self.service_thread is None:
+            return # No mixer: nothing would be heard
+        self.commands.put((time.perf_counter(), method, args))
+        self.max_depth = max(self.max_depth, self.commands.qsize())
+    
+    def _service_loop(self):
+        """Run queued commands and feed the music stream until shutdown."""
+        while True:
+            wait = self.IDLE_WAIT
+            if self.music:
+                wait = min(wait, self.music.pump())
+            try:
+                command = self.commands.get(timeout=wait)
+            except queue.Empty:
+                command = ()
+            if command is None:
+                break
+            if command:
+                posted, method, args = command
+                self.latencies.append(time.perf_counter() - posted)
+                try:
+                    method(*args)
+                except Exception as e:
+                    print(f"[AUDIO] {method.__name__} failed: {e}")
+                self.commands_run += 1
+            if self.voices:
+                self.voice_stats = self.voices.get_stats()
+    
+    def shutdown(self):
+        """Stop the music and the service thread before the mixer goes away."""
+        if self.service_thread is None:
+            return
+        self._post(self._stop_theme)
+        self.commands.put(None)
+        self.service_thread.join(timeout=1.0)
+        self.service_thread = None
+        
     def load_sound(self, name, filepath):
         """Load a sound effect safely."""
         if not self.mixer_initialized:
@@ -46,8 +125,8 @@ class AudioManager:
         try:
             if os.path.exists(filepath):
                 sound = pygame.mixer.Sound(filepath)
-                sound.set_volume(self.sfx_volume)
                 self.sounds[name] = sound
+                self.gains[name] = 1.0
                 print(f"Loaded sound: {name}")
                 return True
             else:
@@ -60,35 +139,60 @@ class AudioManager:
             return False
     
     def play_sound(self, name, loops=0, channel=None, volume=None):
-        """Play a sound effect."""
+        """Play a sound effect (volume applies to this play only)."""
+        self._post(self._play_sound, name, loops, channel, volume)
+    
+    def _play_sound(self, name, loops=0, channel=None, volume=None):
         if name in self.sounds:
             sound = self.sounds[name]
-            if volume is not None:
-                sound.set_volume(volume * self.sfx_volume)
+            level = self.gains.get(name, 1.0) * (1.0 if volume is None else volume)
             
             if channel:
+                channel.set_volume(level * self.sfx_volume)
                 channel.play(sound, loops=loops)
+            elif self.voices and not isinstance(sound, DummySound):
+                category = SOUND_CATEGORIES.get(name, DEFAULT_CATEGORY)
+                self.voices.play(sound, category, level, self.sfx_volume, loops=loops)
             else:
                 sound.play(loops=loops)
                 
     def stop_sound(self, name):
         """Stop a specific sound."""
+        self._post(self._stop_sound, name)
+    
+    def _stop_sound(self, name):
         if name in self.sounds:
             self.sounds[name].stop()
     
     def play_ambient(self, name, loops=-1):
         """Play ambient sound on dedicated channel."""
+        self._post(self._play_ambient, name, loops)
+    
+    def _play_ambient(self, name, loops=-1):
         if name in self.sounds:
             self.ambient_channel.play(self.sounds[name], loops=loops)
     
     def stop_ambient(self):
         """Stop ambient sounds."""
+        self._post(self._stop_ambient)
+    
+    def _stop_ambient(self):
         self.ambient_channel.stop()
     
+    def set_ambient_volume(self, volume):
+        """Set the ambient channel's level."""
+        self._post(self._set_ambient_volume, volume)
+    
+    def _set_ambient_volume(self, volume):
+        self.ambient_channel.set_volume(volume)
+    
     def play_step(self):
         """Play footstep sound (non-overlapping)."""
+        self._post(self._play_step)
+    
+    def _play_step(self):
         if not self.step_channel.get_busy():
-            self.play_sound("step", channel=self.step_channel)
+            self._play_sound("step", channel=self.step_channel)
     
     def play_chop(self):
         """Play chop sound."""
@@ -96,9 +200,39 @@ class AudioManager:
     
     def set_sfx_volume(self, volume):
         """Set sound effects volume (0.0 to 1.0)."""
+        self._post(self._set_sfx_volume, volume)
+    
+    def _set_sfx_volume(self, volume):
         self.sfx_volume = max(0.0, min(1.0, volume))
-        for sound in self.sounds.values():
-            sound.set_volume(self.sfx_volume)
+        if self.voices:
+            self.voices.set_master(self.sfx_volume)
+    
+    def start_theme(self):
+        """Start the procedural music."""
+        if self.music:
+            self._post(self.music.start_theme)
+    
+    def stop_theme(self):
+        """Stop the procedural music."""
+        self._post(self._stop_theme)
+    
+    def _stop_theme(self):
+        if self.music:
+            self.music.stop_theme()
+    
+    def play_win_jingle(self):
+        """Play the zone-complete jingle."""
+        if self.music:
+            self._post(self.music.play_win_jingle)
+    
+    def get_stats(self):
+        """Return voice pool and command queue counters for the debug overlay."""
+        latencies = list(self.latencies)
+        stats = dict(self.voice_stats)
+        stats.update({"depth": self.commands.qsize(), "max_depth": self.max_depth, "commands": self.commands_run,
+                      "latency_ms": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+                      "max_latency_ms": 1000 * max(latencies) if latencies else 0.0})
+        return stats
     
     def generate_placeholder_sounds(self):
         """Generate simple placeholder sounds if audio files don't exist."""
@@ -109,24 +243,29 @@ class AudioManager:
         # Create simple sine wave sounds
         try:
             # Chop sound (short click)
-            chop_sound = pygame.mixer.Sound(buffer=self._generate_click())
-            chop_sound.set_volume(self.sfx_volume)
+            chop_sound = pygame.mixer.Sound(buffer=self._baked_click())
             self.sounds["chop"] = chop_sound
+            self.gains["chop"] = 1.0
             
             # Step sound (soft click)
-            step_sound = pygame.mixer.Sound(buffer=self._generate_click(frequency=200, duration=0.1))
-            step_sound.set_volume(self.sfx_volume * 0.3)
+            step_sound = pygame.mixer.Sound(buffer=self._baked_click(frequency=200, duration=0.1))
             self.sounds["step"] = step_sound
+            self.gains["step"] = 0.3
             
             # Ice Crack (high pitch sharp snap)
-            ice_sound = pygame.mixer.Sound(buffer=self._generate_click(frequency=800, duration=0.4))
-            ice_sound.set_volume(self.sfx_volume)
+            ice_sound = pygame.mixer.Sound(buffer=self._baked_click(frequency=800, duration=0.4))
             self.sounds["ice_crack"] = ice_sound
+            self.gains["ice_crack"] = 1.0
             
             print("Placeholder sounds generated")
         except Exception as e:
             print(f"Could not generate placeholder sounds: {e}")
     
+    def _baked_click(self, frequency=440, duration=0.15):
+        """PCM for a click, loaded from the bake cache when possible."""
+        return bake_cache.data("click", (frequency, duration), lambda: self._generate_click(frequency, duration),
+                               sources=(self._generate_click,))
+    
     def _generate_click(self, frequency=440, duration=0.15):
         """Generate a simple click sound."""
         try:
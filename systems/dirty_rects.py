@@ -0,0 +1,173 @@
+import pygame
+
+class DirtyRectTracker:
+    """Collects changed screen regions so a frame can be redrawn partially.
+
+    Drawables report (rect, state) pairs every frame. When an object's state
+    or rect changes, both the old and new rect are marked dirty. Short-lived
+    regions (particles, snow, floating text) are reported with add() and are
+    kept dirty for one extra frame so their previous position gets erased.
+
+    Thick pygame.draw.line calls rasterize differently when the clip rect
+    cuts through them, so every drawable touching a dirty region is pulled
+    into it whole. If too much of the screen is dirty, or the regions can't
+    be merged into a few rectangles, a full redraw is requested instead.
+    """
+
+    def __init__(self, width, height, max_regions=12, full_redraw_ratio=0.45, padding=2):
+        self.width = width
+        self.height = height
+        self.max_regions = max_regions
+        self.full_redraw_ratio = full_redraw_ratio
+        self.padding = padding
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+
+        # Key: drawable -> (rect, state) from the previous frame
+        self.prev_states = {}
+        self.current_states = {}
+        # Bounds that must never be split by a clip rect
+        self.solid_rects = []
+
+        self.regions = []
+        self.transient = []
+        self.prev_transient = []
+
+        self.effects_signature = None
+        self.full_reason = "first frame"
+
+        # Stats
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.last_region_count = 0
+
+    def begin_frame(self):
+        """Start collecting regions for a new frame."""
+        self.current_states = {}
+        self.solid_rects = []
+        self.regions = []
+        self.transient = []
+        self.full_reason = None
+
+    def request_full(self, reason):
+        """Force a full redraw this frame."""
+        if not self.full_reason:
+            self.full_reason = reason
+
+    def check_effects(self, signature):
+        """Full-screen effects (tint, lighting, zone) must match last frame."""
+        if signature != self.effects_signature:
+            self.request_full("full-screen effect changed")
+        self.effects_signature = signature
+
+    def track(self, key, rect, state, solid=True):
+        """Report a persistent drawable's bounds and visual state.
+
+        solid=False is for things that are only ever blitted (light
+        gradients), which stay exact when partially clipped.
+        """
+        rect = pygame.Rect(rect)
+        self.current_states[key] = (rect, state)
+        if solid:
+            self.solid_rects.append(rect)
+        prev = self.prev_states.get(key)
+        if prev is None:
+            self.regions.append(rect)
+        elif prev[1] != state or prev[0] != rect:
+            self.regions.append(prev[0])
+            self.regions.append(rect)
+
+    def add(self, rect):
+        """Report a region that is redrawn this frame only."""
+        self.transient.append(pygame.Rect(rect))
+
+    def end_frame(self):
+        """Return the merged dirty rects, or None when a full redraw is needed."""
+        # Drawables that disappeared leave their old area dirty
+        for key, (rect, _) in self.prev_states.items():
+            if key not in self.current_states:
+                self.regions.append(rect)
+        self.prev_states = self.current_states
+
+        regions = self.regions + self.transient + self.prev_transient
+        self.prev_transient = self.transient
+
+        rects = None
+        if not self.full_reason:
+            rects = self._merge(regions)
+
+        if rects is None:
+            self.full_frames += 1
+            self.last_region_count = 0
+        else:
+            self.partial_frames += 1
+            self.last_region_count = len(rects)
+        return rects
+
+    def _merge(self, regions):
+        """Grow regions over touched drawables and union overlapping ones."""
+        merged = []
+        for r in regions:
+            # Inflate a little so scaled presentation never leaves seams
+            r = r.inflate(self.padding * 2, self.padding * 2).clip(self.screen_rect)
+            if r.width > 0 and r.height > 0:
+                merged.append(r)
+
+        solids = [r for r in self.solid_rects if r.colliderect(self.screen_rect)]
+        changed = True
+        while changed:
+            changed = False
+
+            # Pull in every drawable a region touches
+            remaining = []
+            for solid in solids:
+                idx = solid.collidelist(merged)
+                if idx == -1:
+                    remaining.append(solid)
+                elif not merged[idx].contains(solid):
+                    merged[idx] = merged[idx].union(solid).clip(self.screen_rect)
+                    changed = True
+            solids = remaining
+
+            # Union overlapping regions until they are disjoint
+            i = 0
+            while i < len(merged):
+                j = merged[i].collidelist(merged[i + 1:])
+                if j == -1:
+                    i += 1
+                    continue
+                merged[i] = merged[i].union(merged.pop(i + 1 + j))
+                changed = True
+
+            area = sum(r.width * r.height for r in merged)
+            if area > self.full_redraw_ratio * self.width * self.height:
+                self.request_full("too much of the screen changed")
+                return None
+
+        if len(merged) > self.max_regions:
+            self.request_full("too many dirty regions")
+            return None
+        return merged
+
+    def reset(self):
+        """Forget all history (zone change, display change)."""
+        self.prev_states = {}
+        self.prev_transient = []
+        self.effects_signature = None
+
+
+def present_regions(screen, surface, rects, scale, origin):
+    """Copy dirty logical regions onto the window and return window rects."""
+    ox, oy = origin
+    screen_rects = []
+    for r in rects:
+        if scale == 1:
+            dest = screen.blit(surface, (ox + r.x, oy + r.y), r)
+        else:
+            x0 = ox + int(r.x * scale)
+            y0 = oy + int(r.y * scale)
+            x1 = ox + int(r.right * scale + 0.999)
+            y1 = oy + int(r.bottom * scale + 0.999)
+            part = pygame.transform.scale(surface.subsurface(r), (x1 - x0, y1 - y0))
+            dest = screen.blit(part, (x0, y0))
+        screen_rects.append(dest)
+    return screen_rects
@@ -1,5 +1,6 @@
 import random
 import pygame
+from ui.text import get_font, render_text
 
 class EventManager:
     def __init__(self):
@@ -74,7 +75,7 @@ class EventManager:
     def render(self, screen, width, height):
         if self.is_warning:
             # Draw big warning text
-            font = pygame.font.SysFont("Arial", 48, bold=True)
+            font = get_font("Arial", 48, bold=True)
             text = "A COLD SNAP IS APPROACHING"
             color = (255, 100, 100) # Urgent Red
             
@@ -82,8 +83,7 @@ class EventManager:
             import math
             alpha = int(128 + 127 * math.sin(pygame.time.get_ticks() * 0.01))
             
-            surf = font.render(text, True, color)
-            surf.set_alpha(alpha)
+            surf = render_text(font, text, color, alpha=alpha)
             rect = surf.get_rect(center=(width // 2, height // 3))
             screen.blit(surf, rect)
             
@@ -108,7 +108,7 @@ class EventManager:
             screen.blit(overlay, (0, 0), special_flags=pygame.BLEND_ADD)
             
             # Status text
-            font = pygame.font.SysFont("Arial", 24, bold=True)
+            font = get_font("Arial", 24, bold=True)
             text = f"COLD SNAP ACTIVE: {int(self.event_timer)}s"
-            surf = font.render(text, True, (0, 200, 255))
+            surf = render_text(font, text, (0, 200, 255))
             screen.blit(surf, (width // 2 - 100, 20))
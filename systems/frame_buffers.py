@@ -0,0 +1,53 @@
+import pygame
+
+class FrameBufferPool:
+    """Owns the long-lived render targets used by the main loop.
+
+    Buffers are keyed by name and handed out every frame. A buffer is only
+    reallocated when the requested size or flags change (window resize,
+    logical resolution change), so steady-state frames allocate nothing.
+    """
+
+    def __init__(self):
+        # Key: name -> (size, flags, Surface)
+        self.buffers = {}
+
+        # Stats
+        self.allocations = 0
+        self.allocations_by_name = {}
+
+    def get(self, name, size, flags=0, fill=None):
+        """Return the persistent buffer for name, recreating it on size change.
+
+        fill is applied only when the buffer is (re)allocated, which lets
+        static overlays (warm tint, flash) be prepared once and reused.
+        """
+        size = (int(size[0]), int(size[1]))
+        entry = self.buffers.get(name)
+        if entry and entry[0] == size and entry[1] == flags:
+            return entry[2]
+
+        surface = pygame.Surface(size, flags)
+        if fill is not None:
+            surface.fill(fill)
+
+        self.buffers[name] = (size, flags, surface)
+        self.allocations += 1
+        self.allocations_by_name[name] = self.allocations_by_name.get(name, 0) + 1
+        return surface
+
+    def release(self, name):
+        """Drop a buffer so its memory can be reclaimed."""
+        self.buffers.pop(name, None)
+
+    def clear(self):
+        """Drop every pooled buffer (e.g. after a display mode change)."""
+        self.buffers.clear()
+
+    def get_stats(self):
+        """Return allocation counters for the debug overlay."""
+        return {
+            "buffers": len(self.buffers),
+            "allocations": self.allocations,
+            "by_name": dict(self.allocations_by_name),
+        }
@@ -1,6 +1,11 @@
 import pygame
 import random
 import math
+from collections import OrderedDict
+
+from constants import MAX_FIRE_FUEL
+from utils.surfaces import prepare
+from utils.bake_cache import bake_cache
 
 class LightSource:
     def __init__(self, x, y, radius, color=(255, 220, 180), flicker_strength=0.0):
@@ -13,6 +18,21 @@ class LightSource:
         self.flicker_timer = 0.0
         self.flicker_offset = 0
         
+        # Registry bookkeeping (owned by LightingEngine)
+        self.active = False
+        self.frame_id = -1
+        self.drawn_state = None # (bounds, color) last drawn into the light layer
+        
+    def set_position(self, x, y):
+        self.x = x
+        self.y = y
+        
+    def set_base_radius(self, radius):
+        """Change the steady radius (flicker keeps applying on top)."""
+        if radius != self.base_radius:
+            self.base_radius = radius
+            self.radius = max(10, radius + self.flicker_offset)
+        
     def update(self, dt):
         """Update light flickering."""
         if self.flicker_strength > 0:
@@ -24,31 +44,108 @@ class LightSource:
                 self.radius = max(10, self.base_radius + self.flicker_offset)
 
 class LightingEngine:
-    def __init__(self, screen_width, screen_height):
+    # Fire light properties
+    FIRE_MIN_RADIUS = 150 # Empty fire
+    FIRE_MAX_RADIUS = 200 # Full fire
+    FIRE_FLICKER = 15     # Flicker strength
+    FIRE_COLOR = (255, 180, 100) # Warm orange-yellow
+    
+    RESOLUTION_DIVISORS = [1, 2, 4, 8] # Light map size = screen size / divisor
+    
+    def __init__(self, screen_width, screen_height, resolution_divisor=1):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        
-        # Darkness layer (will be multiplied with scene)
-        self.light_layer = pygame.Surface((screen_width, screen_height))
         self.darkness_color = (10, 10, 30)  # Dark blue-black
         
-        # Light sources
+        # Darkness layer (will be multiplied with scene), possibly at reduced resolution
+        self.resolution_divisor = None
+        self.light_layer = None
+        self.upscaled_layer = None # Reused smoothscale target when the map is low-res
+        self.upscale_needed = False
+        
+        # Light sources (persistent handles; see keep())
         self.lights = []
+        self.visible_lights = []
+        self.frame_id = 0
+        self.removed_bounds = [] # Areas of dropped lights still drawn in the layer
+        self.needs_full_build = True
+        self.redrawn_regions = 0
         
         # Optimization: Cache light gradients
-        # Key: (radius, color_tuple) -> Surface
-        self.light_cache = {}
+        # Radii are snapped to radius_step so flicker and fuel changes reuse gradients
+        # Key: (quantized_radius, color_tuple) -> Surface, least recently used first
+        self.light_cache = OrderedDict()
+        self.radius_step = 4
+        self.cache_budget = 32 * 1024 * 1024 # Bytes of gradient surfaces kept
+        self.cache_bytes = 0
+        
+        # Stats
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        
+        self.set_resolution_divisor(resolution_divisor)
+    
+    def set_resolution_divisor(self, divisor):
+        """Draw lights into a (screen / divisor) map, smoothscaled up before the multiply."""
+        if divisor not in self.RESOLUTION_DIVISORS:
+            divisor = 1
+        if divisor == self.resolution_divisor:
+            return
+        self.resolution_divisor = divisor
+        map_size = (-(-self.screen_width // divisor), -(-self.screen_height // divisor))
+        self.light_layer = pygame.Surface(map_size)
+        self.upscaled_layer = pygame.Surface((self.screen_width, self.screen_height)) if divisor > 1 else None
+        
+        # Gradients and drawn positions are in map pixels: start over
+        self.light_cache.clear()
+        self.cache_bytes = 0
+        self.removed_bounds = []
+        for light in self.lights:
+            light.drawn_state = None
+        self.needs_full_build = True
+        self.prewarm() # Rebuild now, not as hitches when the lights next draw
         
     def clear_lights(self):
         """Remove all light sources."""
+        for light in self.lights:
+            self._detach(light)
         self.lights.clear()
     
     def add_light(self, x, y, radius, color=(255, 220, 180), flicker_strength=0):
-        """Add a light source."""
+        """Add a light source and return its handle."""
         light = LightSource(x, y, radius, color, flicker_strength)
-        self.lights.append(light)
+        self.keep(light)
         return light
     
+    def begin_frame(self):
+        """Start a frame of keep() calls; handles not kept by end_frame() are dropped."""
+        self.frame_id += 1
+    
+    def keep(self, light):
+        """Mark a light handle as in use this frame (re-registers it if it was dropped)."""
+        if not light.active:
+            light.active = True
+            self.lights.append(light)
+        light.frame_id = self.frame_id
+    
+    def end_frame(self):
+        """Drop lights whose owner didn't keep them (fire went out, zone changed, NPC left)."""
+        if any(light.frame_id != self.frame_id for light in self.lights):
+            kept = []
+            for light in self.lights:
+                if light.frame_id == self.frame_id:
+                    kept.append(light)
+                else:
+                    self._detach(light)
+            self.lights = kept
+    
+    def _detach(self, light):
+        light.active = False
+        if light.drawn_state:
+            self.removed_bounds.append(light.drawn_state[0])
+            light.drawn_state = None
+    
     def update(self, dt):
         """Update all light sources (flickering, etc)."""
         for light in self.lights:
@@ -56,23 +153,111 @@ class LightingEngine:
     
     def render(self, target_surface):
         """Render lighting layer onto target surface."""
-        # Fill with darkness
-        self.light_layer.fill(self.darkness_color)
+        self.build()
+        self.apply(target_surface)
+    
+    def build(self):
+        """Bring the light layer up to date, redrawing only where lights changed."""
+        screen = self.light_layer.get_rect()
+        dirty = self.removed_bounds
+        self.removed_bounds = []
         
-        # Draw each light source
+        # Cull against the viewport and find lights that moved, resized or recoloured
+        visible = []
         for light in self.lights:
-            self._draw_light(light)
+            bounds = self._map_bounds(light)
+            state = (bounds, light.color) if bounds.width > 0 and bounds.colliderect(screen) else None
+            if state != light.drawn_state:
+                if light.drawn_state:
+                    dirty.append(light.drawn_state[0])
+                if state:
+                    dirty.append(bounds)
+                light.drawn_state = state
+            if state:
+                visible.append(light)
+        self.visible_lights = visible
+        
+        if self.needs_full_build or len(dirty) > 16:
+            self.needs_full_build = False
+            dirty = [screen]
         
-        # Apply lighting layer using multiply blend
-        target_surface.blit(self.light_layer, (0, 0), special_flags=pygame.BLEND_MULT)
+        # Fill with darkness and redraw every light touching each changed area (clip keeps this exact)
+        for rect in dirty:
+            rect = rect.clip(screen)
+            if not rect.width or not rect.height:
+                continue
+            self.light_layer.set_clip(rect)
+            self.light_layer.fill(self.darkness_color)
+            for light in visible:
+                if light.drawn_state[0].colliderect(rect):
+                    self._draw_light(light)
+        self.light_layer.set_clip(None)
+        self.redrawn_regions = len(dirty)
+        if dirty:
+            self.upscale_needed = True
+    
+    def apply(self, target_surface):
+        """Multiply the prepared light layer onto target (respects its clip)."""
+        layer = self.light_layer
+        if self.upscaled_layer:
+            # Soft gradients survive the upscale; only redo it when the map changed
+            if self.upscale_needed:
+                pygame.transform.smoothscale(layer, (self.screen_width, self.screen_height), self.upscaled_layer)
+                self.upscale_needed = False
+            layer = self.upscaled_layer
+        target_surface.blit(layer, (0, 0), special_flags=pygame.BLEND_MULT)
+    
+    def quantize_radius(self, radius):
+        """Radius actually drawn for a light (nearest multiple of radius_step)."""
+        return int(round(radius / self.radius_step)) * self.radius_step
+    
+    def _map_radius(self, radius):
+        """Gradient radius in light-map pixels for a light of the given radius."""
+        radius = self.quantize_radius(radius)
+        if radius <= 0 or self.resolution_divisor == 1:
+            return radius
+        return max(1, round(radius / self.resolution_divisor))
+    
+    def _map_bounds(self, light):
+        """Light-map area covered by a light's gradient."""
+        radius = self._map_radius(light.radius)
+        d = self.resolution_divisor
+        return pygame.Rect(int(light.x) // d - radius, int(light.y) // d - radius, radius * 2, radius * 2)
+    
+    def get_light_bounds(self, light):
+        """Screen area touched by a light's gradient."""
+        bounds = self._map_bounds(light)
+        d = self.resolution_divisor
+        if d == 1:
+            return bounds
+        # Scaled up, plus smoothscale's bleed and drift (it maps x * (map_w - 1) / screen_w)
+        return pygame.Rect(bounds.x * d, bounds.y * d, bounds.width * d, bounds.height * d).inflate(d * 4, d * 4)
     
     def _get_cached_light_surf(self, radius, color):
         """Retrieve or create a cached gradient surface."""
         key = (radius, color)
-        if key in self.light_cache:
-            return self.light_cache[key]
+        surf = self.light_cache.get(key)
+        if surf is not None:
+            self.light_cache.move_to_end(key)
+            self.cache_hits += 1
+            return surf
+        self.cache_misses += 1
+        
+        surf = prepare(bake_cache.surface("light", (radius, tuple(color), tuple(self.darkness_color)),
+                                          lambda: self._draw_light_surf(radius, color),
+                                          sources=(self._draw_light_surf,)))
+        self.light_cache[key] = surf
+        self.cache_bytes += self._surface_bytes(surf)
         
-        # Create new gradient surface
+        # Evict least recently used gradients past the budget (never the one just built)
+        while self.cache_bytes > self.cache_budget and len(self.light_cache) > 1:
+            _, old = self.light_cache.popitem(last=False)
+            self.cache_bytes -= self._surface_bytes(old)
+            self.cache_evictions += 1
+        return surf
+    
+    def _draw_light_surf(self, radius, color):
+        """Draw a gradient surface: tinted light fading out to the darkness colour."""
         surf = pygame.Surface((radius * 2, radius * 2))
         surf.fill(self.darkness_color) # Base darkness
         
@@ -95,22 +280,44 @@ class LightingEngine:
             
             if step_radius > 0:
                 pygame.draw.circle(surf, (r, g, b), (cx, cy), step_radius)
-                
-        self.light_cache[key] = surf
         return surf
+    
+    def _surface_bytes(self, surf):
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+    
+    def prewarm(self):
+        """Build the gradients for the game's usual lights ahead of time (avoids first-use hitches)."""
+        # Fires at any fuel level, including flicker
+        low = self.quantize_radius(self.FIRE_MIN_RADIUS - self.FIRE_FLICKER)
+        # Campfires pass fuel / 100, so a fully fuelled fire burns past FIRE_MAX_RADIUS
+        high = self.quantize_radius(self.fire_radius(MAX_FIRE_FUEL / 100.0) + self.FIRE_FLICKER)
+        warm = [(radius, self.FIRE_COLOR) for radius in range(low, high + 1, self.radius_step)]
+        warm.append((80, (200, 200, 220))) # Player
+        warm.append((100, (255, 200, 150))) # Torches
+        for radius, color in warm:
+            self._get_cached_light_surf(self._map_radius(radius), color)
+        # The overlay's hit rate only counts gameplay lookups
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def get_stats(self):
+        """Return gradient cache counters for the debug overlay."""
+        return {"entries": len(self.light_cache), "bytes": self.cache_bytes,
+                "hits": self.cache_hits, "misses": self.cache_misses, "evictions": self.cache_evictions,
+                "lights": len(self.lights), "visible": len(self.visible_lights), "redrawn": self.redrawn_regions}
 
     def _draw_light(self, light):
         """Draw a single light source using cached surface."""
-        radius = int(light.radius)
+        radius = self._map_radius(light.radius)
         if radius <= 0: return
         
         # Get cached surface
         light_surf = self._get_cached_light_surf(radius, light.color)
         
-        # Blit centered at light position
+        # Blit centered at light position (in light-map pixels)
         # We need to subtract radius to center top-left
-        dest_x = int(light.x) - radius
-        dest_y = int(light.y) - radius
+        dest_x = int(light.x) // self.resolution_divisor - radius
+        dest_y = int(light.y) // self.resolution_divisor - radius
         
         # Optimization: Don't blit special flags for individual lights onto darkness layer
         # Just simple blit, because the light surf includes the darkness color background
@@ -125,14 +332,11 @@ class LightingEngine:
     
     def add_fire_light(self, x, y, fuel_percent=1.0):
         """Add a flickering fire light source."""
-        # Fire light properties
-        base_radius = 150 + (fuel_percent * 50)  # Larger fires = more light
-        flicker = 15  # Flicker strength
-        
-        # Warm orange-yellow color
-        color = (255, 180, 100)
-        
-        return self.add_light(x, y, base_radius, color, flicker)
+        return self.add_light(x, y, self.fire_radius(fuel_percent), self.FIRE_COLOR, self.FIRE_FLICKER)
+    
+    def fire_radius(self, fuel_percent):
+        """Steady radius of a fire light (larger fires = more light)."""
+        return self.FIRE_MIN_RADIUS + fuel_percent * (self.FIRE_MAX_RADIUS - self.FIRE_MIN_RADIUS)
     
     def add_player_light(self, x, y):
         """Add player's personal light (small, steady)."""
@@ -1,17 +1,45 @@
 import pygame
 import numpy as np
 import threading
-import time
+
+from utils.bake_cache import bake_cache
 
 class MusicManager:
+    """Procedural score, streamed gaplessly in fixed-size blocks.
+
+    The audio service thread calls pump(), which mixes the chord progression
+    into BLOCK_SECONDS blocks and keeps the music channel fed with
+    Channel.queue, so chord overlaps are sample-exact instead of depending
+    on sleep timing. Three
+    layers (pad, pulse, frost) crossfade toward targets set from gameplay by
+    set_mood(). Chord layers are synthesized once at startup on a warm-up
+    thread, which then posts the Sound creation to the audio service so only
+    that thread touches the mixer. Blocks are written into a fixed ring of
+    Sounds, so memory stays bounded and the main thread never waits on
+    synthesis.
+    """
+    BLOCK_SECONDS = 0.25
+    RING_SIZE = 3 # Playing, queued, and the one being rendered
+    FADE_SECONDS = 2.0 # Time for a layer to go from silent to full
+    CHORD_SECONDS = 3.0
+    CHORD_STEP = 2.5 # Seconds between chord starts (the rest overlaps)
+    SEQUENCE_GAP = 1.0 # Extra pause after each progression
+    LAYERS = ("pad", "pulse", "frost")
+    # How tense each zone sounds before the cold adds to it
+    ZONE_TENSION = {0: 0.0, 1: 0.15, 2: 0.45, 3: 0.7}
+
     def __init__(self, audio_manager):
         self.audio_manager = audio_manager
-        self.sample_rate = 22050
+        mixer = pygame.mixer.get_init()
+        # Render at the mixer's own rate so pitch and timing are exact
+        self.sample_rate = mixer[0] if mixer else 22050
+        self.mixer_channels = mixer[2] if mixer else 2
         self.volume = 0.4
         self.current_theme = None
-        self.theme_thread = None
-        self.stop_event = threading.Event()
-        
+        self.playing = False
+        self.streaming = False
+        self.channel = getattr(audio_manager, "music_channel", None)
+
         # Chord frequencies (Key of G Major)
         self.CHORDS = {
             "G": [196.00, 246.94, 293.66],
@@ -19,12 +47,87 @@ class MusicManager:
             "C": [130.81, 164.81, 196.00],
             "D": [146.83, 185.00, 220.00]
         }
-        
-    def _generate_tone(self, frequencies, duration=2.0, fade=0.5):
+        # Progression 1: G, Em, C, D
+        # Progression 2: G, C, D, Em
+        self.SEQUENCES = [["G", "EM", "C", "D"], ["G", "C", "D", "EM"]]
+
+        # Sequencer state (owned by the audio service thread)
+        self.block = int(self.sample_rate * self.BLOCK_SECONDS)
+        self.cursor = 0 # Samples rendered so far
+        self.next_chord_at = 0
+        self.schedule = self._chord_schedule()
+        self.voices = [] # [chord name, start sample], at most two overlap
+        self.gains = [1.0, 0.0, 0.0] # Current level per layer
+        # Written by set_mood() on the main thread; a tuple swap is atomic
+        self.targets = (1.0, 0.0, 0.0)
+
+        # Every buffer the music plays: PCM synthesized once off the main
+        # thread, Sounds created on the audio service thread
+        self.layers = {} # Key: chord name -> float32 array per layer
+        self.jingle = None
+        self.ring = [] # [(Sound, int16 sample view)]
+        self.ring_index = 0
+        self.pending = None # Rendered (Sound, view) waiting for the channel
+        self.ready = threading.Event()
+        self.warm_thread = None
+        if mixer and mixer[1] == -16 and self.channel is not None:
+            self.warm_thread = threading.Thread(target=self._synthesize_all, daemon=True)
+            self.warm_thread.start()
+
+        # Stats
+        self.blocks = 0
+        self.underruns = 0
+
+    def _synthesize_all(self):
+        """Build the chord layers and jingle PCM (run once in the background)."""
+        for name, frequencies in self.CHORDS.items():
+            self.layers[name] = bake_cache.array(
+                "music_chord", (name, frequencies, self.sample_rate, self.CHORD_SECONDS),
+                lambda: self._generate_layers(frequencies),
+                sources=(self._generate_layers, self._generate_pad, self._generate_pulse,
+                         self._generate_frost, self._envelope))
+
+        # Scratch buffers for the mixer loop
+        self.mix = np.zeros(self.block, dtype=np.float32)
+        self.layer_mix = np.zeros((len(self.LAYERS), self.block), dtype=np.float32)
+        self.ramp = np.linspace(0, 1, self.block, endpoint=False, dtype=np.float32)
+        self.envelope = np.zeros(self.block, dtype=np.float32)
+
+        jingle_pcm = bake_cache.data("music_jingle", (self.sample_rate, self.mixer_channels),
+                                     self._generate_jingle, sources=(self._generate_jingle,))
+        self.audio_manager._post(self._install_buffers, jingle_pcm)
+
+    def _install_buffers(self, jingle_pcm):
+        """Create the block ring and jingle Sounds (runs on the audio service thread)."""
+        shape = (self.block, self.mixer_channels) if self.mixer_channels > 1 else (self.block,)
+        for _ in range(self.RING_SIZE):
+            sound = pygame.mixer.Sound(buffer=np.zeros(shape, dtype=np.int16).tobytes())
+            self.ring.append((sound, pygame.sndarray.samples(sound)))
+        self.jingle = pygame.mixer.Sound(buffer=jingle_pcm)
+        self.ready.set()
+
+    def _generate_layers(self, frequencies):
+        """One chord's pad, pulse and frost layers as a float32 (3, samples) array."""
+        return np.stack([
+            self._generate_pad(frequencies, self.CHORD_SECONDS),
+            self._generate_pulse(frequencies, self.CHORD_SECONDS),
+            self._generate_frost(frequencies, self.CHORD_SECONDS),
+        ]).astype(np.float32)
+
+    def _envelope(self, samples, fade):
+        """Soft attack and long decay."""
+        attack = int(self.sample_rate * 0.5)
+        decay = int(self.sample_rate * fade)
+        envelope = np.ones(samples)
+        envelope[:attack] = np.linspace(0, 1, attack)
+        envelope[-decay:] = np.linspace(1, 0, decay)
+        return envelope
+
+    def _generate_pad(self, frequencies, duration=2.0, fade=0.5):
         """Generates a soft, pad-like chord."""
         samples = int(self.sample_rate * duration)
         t = np.linspace(0, duration, samples, False)
-        
+
         # Mix frequencies
         wave = np.zeros(samples)
         for f in frequencies:
@@ -33,87 +136,170 @@ class MusicManager:
             # Add subtle harmonics for warmth
             wave += 0.5 * np.sin(2 * np.pi * f * 2 * t)
             wave += 0.25 * np.sin(2 * np.pi * f * 0.5 * t)
-            
+
         wave = wave / len(frequencies)
-        
-        # Apply envelope (Soft attack and long decay)
-        attack = int(self.sample_rate * 0.5)
-        decay = int(self.sample_rate * fade)
-        envelope = np.ones(samples)
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-decay:] = np.linspace(1, 0, decay)
-        
-        wave = wave * envelope * 0.3
-        
-        # Convert to 16-bit
-        wave = (wave * 32767).astype(np.int16)
-        
-        # Stereo
-        stereo_wave = np.column_stack((wave, wave))
-        return pygame.mixer.Sound(buffer=stereo_wave.tobytes())
+        return wave * self._envelope(samples, fade) * 0.3
+
+    def _generate_pulse(self, frequencies, duration=2.0, fade=0.5):
+        """Low root drone throbbing at a slow heartbeat (tension layer)."""
+        samples = int(self.sample_rate * duration)
+        t = np.linspace(0, duration, samples, False)
+        root = frequencies[0] / 2
+        wave = np.sin(2 * np.pi * root * t) + 0.3 * np.sin(2 * np.pi * root * 3 * t)
+        throb = 0.5 * (1 + np.sin(2 * np.pi * 1.6 * t - np.pi / 2))
+        return wave * throb * self._envelope(samples, fade) * 0.25
+
+    def _generate_frost(self, frequencies, duration=2.0, fade=0.5):
+        """Thin, shimmering high partials (cold layer)."""
+        samples = int(self.sample_rate * duration)
+        t = np.linspace(0, duration, samples, False)
+        wave = np.zeros(samples)
+        for f in frequencies:
+            wave += np.sin(2 * np.pi * f * 4 * t)
+        shimmer = 0.6 + 0.4 * np.sin(2 * np.pi * 5.0 * t)
+        return wave / len(frequencies) * shimmer * self._envelope(samples, fade) * 0.12
+
+    def _chord_schedule(self):
+        """Endless (chord name, samples until the next chord) sequence."""
+        step = int(self.sample_rate * self.CHORD_STEP)
+        gap = int(self.sample_rate * self.SEQUENCE_GAP)
+        seq_index = 0
+        while True:
+            seq = self.SEQUENCES[seq_index]
+            for i, chord_name in enumerate(seq):
+                yield chord_name, step + (gap if i == len(seq) - 1 else 0)
+            seq_index = (seq_index + 1) % len(self.SEQUENCES)
+
+    def set_mood(self, zone_id, cold_snap, body_temp):
+        """Set layer targets from gameplay (cheap; safe to call every frame)."""
+        cold = max(0.0, min(1.0, (37.0 - body_temp) / 37.0))
+        pulse = max(self.ZONE_TENSION.get(zone_id, 0.0), cold)
+        frost = 1.0 if cold_snap else cold * 0.5
+        self.targets = (1.0 - 0.5 * frost, pulse, frost)
+
+    def _render_block(self, view):
+        """Mix the next block of the timeline into one ring Sound."""
+        start, end = self.cursor, self.cursor + self.block
+
+        # Start every chord that begins inside this block
+        while self.next_chord_at < end:
+            chord_name, wait = next(self.schedule)
+            self.voices.append([chord_name, self.next_chord_at])
+            self.next_chord_at += wait
+
+        self.layer_mix.fill(0)
+        for voice in self.voices:
+            layers = self.layers[voice[0]]
+            offset = start - voice[1]
+            src_from, dst_from = max(0, offset), max(0, -offset)
+            count = min(layers.shape[1] - src_from, self.block - dst_from)
+            if count > 0:
+                self.layer_mix[:, dst_from:dst_from + count] += layers[:, src_from:src_from + count]
+        self.voices = [v for v in self.voices if end - v[1] < self.layers[v[0]].shape[1]]
+
+        # Crossfade: each layer ramps toward its target across the block
+        step = self.BLOCK_SECONDS / self.FADE_SECONDS
+        self.mix.fill(0)
+        for i, target in enumerate(self.targets):
+            current = self.gains[i]
+            following = current + max(-step, min(step, target - current))
+            if current == 0 and following == 0:
+                continue
+            np.multiply(self.ramp, following - current, out=self.envelope)
+            self.envelope += current
+            self.envelope *= self.layer_mix[i]
+            self.mix += self.envelope
+            self.gains[i] = following
+
+        self.mix *= 32767
+        np.clip(self.mix, -32767, 32767, out=self.mix)
+        if view.ndim == 2:
+            for c in range(view.shape[1]):
+                view[:, c] = self.mix
+        else:
+            view[:] = self.mix
+        self.cursor = end
+        self.blocks += 1
+
+    def _next_slot(self):
+        sound, view = self.ring[self.ring_index]
+        self.ring_index = (self.ring_index + 1) % len(self.ring)
+        return sound, view
 
     def start_theme(self):
-        """Starts the procedural theme loop in a background thread."""
-        if self.theme_thread and self.theme_thread.is_alive():
-            return
-            
-        self.stop_event.clear()
-        self.theme_thread = threading.Thread(target=self._music_loop, daemon=True)
-        self.theme_thread.start()
+        """Starts the procedural theme (the audio service then keeps it fed)."""
+        if self.playing or self.warm_thread is None:
+            return # Already playing, or no usable mixer
+        self.playing = True
+        self.streaming = False # Nothing handed to the channel yet
+        self.pending = None
         print("[MUSIC] Theme Loop Started")
 
     def stop_theme(self):
-        self.stop_event.set()
-        if self.theme_thread:
-            self.theme_thread.join(timeout=1.0)
-            
-    def _music_loop(self):
-        """The actual sequence logic."""
-        # Progression 1: G, Em, C, D
-        # Progression 2: G, C, D, Em
-        p1 = ["G", "EM", "C", "D"]
-        p2 = ["G", "C", "D", "EM"]
-        
-        sequences = [p1, p2]
-        seq_index = 0
-        
-        while not self.stop_event.is_set():
-            seq = sequences[seq_index]
-            for chord_name in seq:
-                if self.stop_event.is_set(): break
-                
-                # Generate/Get chord
-                chord_sound = self._generate_tone(self.CHORDS[chord_name], duration=3.0)
-                chord_sound.set_volume(self.audio_manager.music_volume)
-                chord_sound.play()
-                
-                # Wait for next chord (with overlap)
-                time.sleep(2.5) 
-                
-            seq_index = (seq_index + 1) % len(sequences)
-            # Short break between sequences
-            time.sleep(1.0)
+        self.playing = False
+        if self.channel is not None:
+            self.channel.stop()
+
+    def pump(self):
+        """
+        Keep one block playing and one queued, rendering the next in between.
+        Called from the audio service thread; returns how long it can sleep.
+        """
+        wait = self.BLOCK_SECONDS / 4
+        if not self.playing or not self.ready.is_set():
+            return wait
+        try:
+            if self.pending is None:
+                self.pending = self._next_slot()
+                self._render_block(self.pending[1])
+            self.channel.set_volume(self.audio_manager.music_volume)
+            if not self.channel.get_busy():
+                if self.streaming:
+                    self.underruns += 1 # Ran dry between blocks
+                self.channel.play(self.pending[0])
+                self.streaming = True
+            elif self.channel.get_queue() is None:
+                self.channel.queue(self.pending[0])
+            else:
+                return wait
+        except pygame.error:
+            self.playing = False # Mixer shut down under us (quitting)
+            return wait
+        # The slot after the queued one is neither playing nor queued
+        self.pending = self._next_slot()
+        self._render_block(self.pending[1])
+        return 0
 
     def play_win_jingle(self):
         """Plays a nice completion jingle."""
+        if self.jingle is None:
+            return # Still synthesizing; never stall the frame for it
+        self.audio_manager.voices.play(self.jingle, "event", 1.0, self.audio_manager.sfx_volume)
+
+    def _generate_jingle(self):
+        """Synthesizes the completion jingle (16-bit PCM in the mixer's layout)."""
         # Rapid arpeggio of G Major 9
         freqs = [196.00, 246.94, 293.66, 392.00, 493.88] # G3, B3, D4, G4, B4
         samples = int(self.sample_rate * 1.5)
         t = np.linspace(0, 1.5, samples, False)
         wave = np.zeros(samples)
-        
+
         for i, f in enumerate(freqs):
             start = int(i * 0.1 * self.sample_rate)
-            duration_samples = samples - start
-            if duration_samples <= 0: continue
-            
-            t_sub = t[:duration_samples]
-            # Chiming tone
-            sub_wave = np.sin(2 * np.pi * f * t_sub) * np.exp(-t_sub * 4)
-            wave[start:start+duration_samples] += sub_wave * 0.4
-            
+            if start < samples:
+                sub_t = t[:samples-start]
+                note = np.sin(2 * np.pi * f * sub_t)
+                # Ping envelope
+                env = np.exp(-sub_t * 5)
+                wave[start:] += note * env * 0.2
+
         wave = (wave * 32767).astype(np.int16)
-        stereo_wave = np.column_stack((wave, wave))
-        jingle = pygame.mixer.Sound(buffer=stereo_wave.tobytes())
-        jingle.set_volume(self.audio_manager.sfx_volume)
-        jingle.play()
+        if self.mixer_channels == 1:
+            return wave.tobytes()
+        stereo_wave = np.repeat(wave[:, None], self.mixer_channels, axis=1)
+        return stereo_wave.tobytes()
+
+    def get_stats(self):
+        """Return counters for the debug overlay."""
+        return {"blocks": self.blocks, "underruns": self.underruns,
+                "gains": dict(zip(self.LAYERS, (round(g, 2) for g in self.gains)))}
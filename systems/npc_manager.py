@@ -87,6 +87,8 @@ class NPCManager:
         # Update existing NPCs
         for npc in self.npcs:
             npc.update(dt, run_state, env_manager)
+        if env_manager:
+            env_manager.sync_npcs(self.npcs)
         
         # Spawn timer (for automatic spawning)
         self.spawn_timer += dt
@@ -0,0 +1,187 @@
+import math
+import random
+
+import numpy as np
+import pygame
+
+from constants import MAX_PARTICLES, LOGICAL_HEIGHT
+from utils.surfaces import prepare
+
+# Behaviour kinds
+KIND_CHIP = 0 # Gravity + ground bounce (wood chips, embers, footstep dust)
+KIND_LEAF = 1 # Slow fall with sideways sway
+KIND_DUST = 2 # Gravity, shrinks and fades as it dies
+
+
+class ParticleEngine:
+    """Fixed-capacity, structure-of-arrays particle system.
+
+    Every particle lives in a slot of preallocated NumPy arrays; live
+    particles are packed at the front ([0, count)) so integration, bounce
+    and sway run as whole-array operations. Spawning past the budget drops
+    the new particle instead of growing anything. Colours are interned into
+    a small table, and each (colour, size) square is drawn from a cached
+    sprite with one blits call per frame.
+    """
+
+    def __init__(self, capacity=MAX_PARTICLES, ground_y=LOGICAL_HEIGHT):
+        self.capacity = capacity
+        self.ground_y = ground_y
+        self.count = 0
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.gravity = np.zeros(capacity)
+        self.timer = np.zeros(capacity) # Leaf sway phase
+        self.size = np.zeros(capacity, dtype=np.int16)
+        self.kind = np.zeros(capacity, dtype=np.uint8)
+        self.color = np.zeros(capacity, dtype=np.uint16) # Index into self.colors
+        self.arrays = (self.x, self.y, self.vx, self.vy, self.life, self.gravity,
+                       self.timer, self.size, self.kind, self.color)
+
+        # Interned colours: index -> colour tuple, colour tuple -> index
+        self.colors = []
+        self.color_ids = {}
+        # Key: (color_id, size) -> square Surface
+        self.sprites = {}
+
+        # Stats
+        self.dropped = 0
+
+    def __len__(self):
+        return self.count
+
+    def _color_id(self, color):
+        color = tuple(color)
+        index = self.color_ids.get(color)
+        if index is None:
+            index = self.color_ids[color] = len(self.colors)
+            self.colors.append(color)
+        return index
+
+    def emit(self, x, y, color, size=4, kind=KIND_CHIP, vx=None, vy=None, life=None, gravity=500, timer=0.0):
+        """
+        Add one particle. Unset vx/vy/life get the classic chip burst
+        (random sideways, launched up). Returns the slot, or None when the
+        budget is full.
+        """
+        # Always drawn (even when overridden or dropped) so cosmetic particles
+        # consume the shared random stream the same way the old Particle class did
+        burst_vx = random.uniform(-2, 2) * 60
+        burst_vy = random.uniform(-4, -1) * 60 # Explode up
+        burst_life = random.uniform(0.3, 0.6)
+
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return None
+        i = self.count
+        self.count += 1
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = burst_vx if vx is None else vx
+        self.vy[i] = burst_vy if vy is None else vy
+        self.life[i] = burst_life if life is None else life
+        self.gravity[i] = gravity
+        self.timer[i] = timer
+        self.size[i] = size
+        self.kind[i] = kind
+        self.color[i] = self._color_id(color)
+        return i
+
+    def emit_leaf(self, x, y):
+        """Green leaf drifting down from a felled tree."""
+        color = random.choice([(34, 139, 34), (0, 100, 0), (50, 205, 50)])
+        return self.emit(x, y, color, kind=KIND_LEAF, gravity=0, # Drift slowly
+                         vx=random.uniform(-1, 1) * 30, vy=random.uniform(40, 80),
+                         life=random.uniform(1.2, 2.5), timer=random.uniform(0, math.pi * 2))
+
+    def emit_dust(self, x, y):
+        """Translucent grey puff that shrinks as it fades."""
+        color = random.choice([(180, 180, 180, 150), (200, 200, 200, 150)]) # Dusty gray
+        return self.emit(x, y, color, kind=KIND_DUST, gravity=150,
+                         vx=random.uniform(-1, 1) * 30, vy=random.uniform(-40, -20),
+                         life=random.uniform(0.3, 0.5))
+
+    def update(self, dt):
+        n = self.count
+        if not n:
+            return
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        kind = self.kind[:n]
+
+        # Integrate (leaves have no gravity, but sway sideways)
+        vy += self.gravity[:n] * dt
+        leaf = kind == KIND_LEAF
+        if leaf.any():
+            timer = self.timer[:n]
+            timer[leaf] += dt * 5
+            x += (vx + np.where(leaf, np.sin(timer) * 60, 0.0)) * dt
+        else:
+            x += vx * dt
+        y += vy * dt
+
+        # Bounce chips on the ground
+        floor = self.ground_y - 5
+        bounce = (kind == KIND_CHIP) & (y >= floor)
+        if bounce.any():
+            y[bounce] = floor
+            vy[bounce] *= -0.5 # Bounce with energy loss
+            vx[bounce] *= 0.8  # Friction
+            vy[bounce & (np.abs(vy) < 50)] = 0 # Stop bouncing if too slow
+
+        life = self.life[:n]
+        life -= dt
+
+        # Compact survivors to the front (keeps spawn order for drawing)
+        alive = life > 0
+        if not alive.all():
+            kept = int(alive.sum())
+            for array in self.arrays:
+                array[:kept] = array[:n][alive]
+            self.count = kept
+
+    def _sizes(self):
+        """Drawn size of each live particle (dust shrinks with life)."""
+        n = self.count
+        return np.where(self.kind[:n] == KIND_DUST, (self.life[:n] * 10).astype(np.int16), self.size[:n])
+
+    def _sprite(self, color_id, size):
+        sprite = self.sprites.get((color_id, size))
+        if sprite is None:
+            color = self.colors[color_id]
+            if len(color) > 3 and color[3] < 255:
+                sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            else:
+                sprite = pygame.Surface((size, size))
+            sprite.fill(color)
+            sprite = self.sprites[(color_id, size)] = prepare(sprite)
+        return sprite
+
+    def render(self, surface, offset=(0, 0)):
+        n = self.count
+        if not n:
+            return
+        xs = (self.x[:n] + offset[0]).astype(np.int32).tolist()
+        ys = (self.y[:n] + offset[1]).astype(np.int32).tolist()
+        sprite = self._sprite
+        blits = [(sprite(c, s), (rx, ry))
+                 for c, s, rx, ry in zip(self.color[:n].tolist(), self._sizes().tolist(), xs, ys) if s > 0]
+        surface.blits(blits, doreturn=False)
+
+    def get_rects(self):
+        """Screen bounds of every live particle (for dirty-rect tracking)."""
+        n = self.count
+        xs = self.x[:n].astype(np.int32).tolist()
+        ys = self.y[:n].astype(np.int32).tolist()
+        return [pygame.Rect(rx, ry, s, s) for rx, ry, s in zip(xs, ys, self._sizes().tolist())]
+
+    def clear(self):
+        """Remove every particle."""
+        self.count = 0
+
+    def get_stats(self):
+        """Return counters for the debug overlay."""
+        return {"live": self.count, "capacity": self.capacity, "dropped": self.dropped}
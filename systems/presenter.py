@@ -0,0 +1,176 @@
+import time
+
+import pygame
+
+
+class Presenter:
+    """Final present stage: letterboxes and scales the logical frame onto the window.
+
+    The layout (scale, viewport, letterbox bars) is worked out once per
+    window size. Frames are scaled straight into a subsurface of the window,
+    so there is no intermediate copy and only the bars are cleared. When
+    the viewport is an exact multiple of the logical size, nearest scaling
+    is plain pixel replication; the faster of transform.scale and a NumPy
+    strided copy is picked once per layout by timing a small probe frame. Screen shake moves the
+    image off the viewport, which falls back to a pooled buffer and a
+    full clear.
+    """
+    FILTERS = ("Nearest", "Scale2x", "Smooth")
+    PROBE_DIVISOR = 8 # Calibration probe is 1/8 of the logical frame per side
+
+    def __init__(self, logical_size, frame_pool, scale_filter="Nearest"):
+        self.logical_w, self.logical_h = logical_size
+        self.frame_pool = frame_pool
+        self.filter = scale_filter if scale_filter in self.FILTERS else "Nearest"
+
+        # Layout (rebuilt when the window surface or its size changes)
+        self.screen = None
+        self.screen_size = None
+        self.scale = 1.0
+        self.viewport = pygame.Rect(0, 0, self.logical_w, self.logical_h)
+        self.bars = [] # Letterbox rects outside the viewport
+        self.dest = None # Window subsurface covering the viewport
+        self.integer_scale = None # k when the viewport is exactly k x logical
+        self.replicate = False # Integer fast path uses the NumPy copy
+
+        # Stats
+        self.layouts = 0
+        self.path = None
+
+    def set_filter(self, scale_filter):
+        if scale_filter in self.FILTERS and scale_filter != self.filter:
+            self.filter = scale_filter
+            self.frame_pool.release("scaled")
+            self.frame_pool.release("scale2x")
+
+    @property
+    def origin(self):
+        return self.viewport.topleft
+
+    def supports_regions(self):
+        """Partial presents scale regions with nearest sampling only."""
+        return self.scale == 1 or self.filter == "Nearest"
+
+    def layout(self, screen):
+        """Recompute scale, viewport and bars if the window changed."""
+        if screen is self.screen and screen.get_size() == self.screen_size:
+            return
+        self.screen = screen
+        self.screen_size = screen_w, screen_h = screen.get_size()
+
+        self.scale = min(screen_w / self.logical_w, screen_h / self.logical_h)
+        new_w, new_h = int(self.logical_w * self.scale), int(self.logical_h * self.scale)
+        ox, oy = (screen_w - new_w) // 2, (screen_h - new_h) // 2
+        self.viewport = pygame.Rect(ox, oy, new_w, new_h)
+
+        self.bars = [rect for rect in (
+            pygame.Rect(0, 0, screen_w, oy), # Top
+            pygame.Rect(0, oy + new_h, screen_w, screen_h - oy - new_h), # Bottom
+            pygame.Rect(0, oy, ox, new_h), # Left
+            pygame.Rect(ox + new_w, oy, screen_w - ox - new_w, new_h), # Right
+        ) if rect.width > 0 and rect.height > 0]
+
+        k = new_w // self.logical_w
+        exact = new_w == self.logical_w * k and new_h == self.logical_h * k
+        self.integer_scale = k if exact and k > 1 else None
+        self.dest = screen.subsurface(self.viewport) if new_w and new_h else None
+        self.replicate = False
+        if self.integer_scale and self.dest is not None:
+            self._calibrate()
+        self.layouts += 1
+
+    def _can_replicate(self, surface):
+        return (self.dest is not None and surface.get_bytesize() == 4 and self.dest.get_bytesize() == 4
+                and surface.get_masks()[:3] == self.dest.get_masks()[:3])
+
+    def _replicate(self, surface, dest, k):
+        """Nearest integer upscale: every source pixel fills a k x k block of dest."""
+        src = pygame.surfarray.pixels2d(surface)
+        dst = pygame.surfarray.pixels2d(dest)
+        for i in range(k):
+            for j in range(k):
+                dst[i::k, j::k] = src
+        del src, dst # Unlock both surfaces
+
+    def _calibrate(self):
+        """
+        Time both nearest paths on a small probe in the window's format and
+        keep the faster (cheap enough to run inside layout()).
+        """
+        k = self.integer_scale
+        probe_size = (max(1, self.logical_w // self.PROBE_DIVISOR), max(1, self.logical_h // self.PROBE_DIVISOR))
+        probe = pygame.Surface(probe_size, 0, self.dest)
+        probe_dest = pygame.Surface((probe_size[0] * k, probe_size[1] * k), 0, self.dest)
+        if not self._can_replicate(probe):
+            return
+        timings = []
+        for replicate in (False, True):
+            best = None
+            for _ in range(4): # First run warms up, best of the rest
+                start = time.perf_counter()
+                if replicate:
+                    self._replicate(probe, probe_dest, k)
+                else:
+                    pygame.transform.scale(probe, probe_dest.get_size(), probe_dest)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings.append(best)
+        self.replicate = timings[1] < timings[0]
+
+    def _scale_into(self, surface, dest):
+        """Scale surface to dest's size with the chosen filter, writing into dest."""
+        size = dest.get_size()
+        if self.filter == "Smooth":
+            pygame.transform.smoothscale(surface, size, dest)
+            self.path = "smooth"
+        elif self.filter == "Scale2x" and size[0] >= surface.get_width() * 2:
+            doubled_size = (surface.get_width() * 2, surface.get_height() * 2)
+            if size == doubled_size:
+                pygame.transform.scale2x(surface, dest)
+            else:
+                # Double with scale2x, then nearest the rest of the way
+                doubled = self.frame_pool.get("scale2x", doubled_size)
+                pygame.transform.scale2x(surface, doubled)
+                pygame.transform.scale(doubled, size, dest)
+            self.path = "scale2x"
+        elif dest is self.dest and self.replicate and self._can_replicate(surface):
+            self._replicate(surface, dest, self.integer_scale)
+            self.path = "replicate"
+        else:
+            pygame.transform.scale(surface, size, dest)
+            self.path = "nearest"
+
+    def present(self, screen, surface, offset=(0, 0), background=(0, 0, 0)):
+        """Draw the logical frame onto the window (offset is in logical pixels)."""
+        self.layout(screen)
+        sx, sy = int(offset[0] * self.scale), int(offset[1] * self.scale)
+
+        if self.viewport.size == surface.get_size():
+            # 1:1 window, no scale copy needed
+            if (sx, sy) == (0, 0):
+                for bar in self.bars:
+                    screen.fill(background, bar)
+            else:
+                screen.fill(background)
+            screen.blit(surface, (self.viewport.x + sx, self.viewport.y + sy))
+            self.path = "copy"
+            return
+
+        if (sx, sy) == (0, 0) and self.dest is not None:
+            for bar in self.bars:
+                screen.fill(background, bar)
+            try:
+                self._scale_into(surface, self.dest)
+                return
+            except ValueError:
+                self.dest = None # Window format differs from the frame; go through a buffer
+
+        scaled = self.frame_pool.get("scaled", self.viewport.size)
+        self._scale_into(surface, scaled)
+        screen.fill(background)
+        screen.blit(scaled, (self.viewport.x + sx, self.viewport.y + sy))
+
+    def get_stats(self):
+        """Return the current layout for the debug overlay."""
+        return {"scale": self.scale, "viewport": self.viewport.size, "integer": self.integer_scale,
+                "filter": self.filter, "path": self.path, "layouts": self.layouts}
@@ -0,0 +1,115 @@
+import json
+import time
+from collections import deque
+
+
+class FrameProfiler:
+    """Per-phase frame timing.
+
+    The main loop calls begin_frame(), then mark(name) as each phase
+    finishes: the time since the previous mark is charged to that phase
+    (phases run several times a frame, like fixed simulation steps or
+    dirty-rect redraws, add up). end_frame() closes the frame, keeps the
+    last WINDOW frames for the rolling p50/p99 breakdown and, when a log
+    file is set, appends the frame as one JSON line. While disabled every
+    call returns immediately.
+    """
+    WINDOW = 240 # Frames in the rolling breakdown
+    SUMMARY_INTERVAL = 30 # Frames between overlay refreshes
+
+    def __init__(self, log_path="profile_log.jsonl"):
+        self.enabled = False
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+        self.current = {} # Key: phase -> seconds this frame
+        # Key: phase -> per-frame milliseconds (first-seen order is display order)
+        self.history = {}
+        self.totals = deque(maxlen=self.WINDOW)
+        self.frame_index = 0
+        self.summary = []
+        self.summary_frame = 0 # frame_index the summary was computed at
+
+        # JSONL export (appended to while logging is on)
+        self.log_path = log_path
+        self.log_file = None
+        self.logging = False
+
+    def set_enabled(self, enabled, logging=False):
+        """Turn timing on or off; logging also writes every frame to log_path."""
+        self.enabled = enabled or logging
+        if logging != self.logging:
+            self.logging = logging
+            self.close()
+            if logging:
+                try:
+                    self.log_file = open(self.log_path, 'a')
+                except OSError as e:
+                    print(f"Failed to open profile log: {e}")
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame_start = self.last_mark = time.perf_counter()
+        self.current = {}
+
+    def mark(self, name):
+        """Charge the time since the previous mark to phase name."""
+        if not self.enabled or not self.frame_start:
+            return
+        now = time.perf_counter()
+        self.current[name] = self.current.get(name, 0.0) + now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        if not self.enabled or not self.frame_start:
+            return
+        total = time.perf_counter() - self.frame_start
+        self.frame_start = 0.0
+        self.frame_index += 1
+        self.totals.append(total * 1000)
+        for name in self.current:
+            if name not in self.history:
+                self.history[name] = deque([0.0] * (len(self.totals) - 1), maxlen=self.WINDOW)
+        for name, samples in self.history.items():
+            samples.append(self.current.get(name, 0.0) * 1000)
+
+        if self.log_file is not None:
+            phases = {name: round(seconds * 1000, 3) for name, seconds in self.current.items()}
+            self.log_file.write(json.dumps({"frame": self.frame_index, "time": round(time.time(), 3),
+                                            "ms": round(total * 1000, 3), "phases": phases}) + "\n")
+
+    def close(self):
+        """Flush and close the per-frame log."""
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+    @staticmethod
+    def _percentile(ordered, pct):
+        return ordered[min(len(ordered) - 1, int(pct * len(ordered)))]
+
+    def get_summary(self):
+        """
+        Rolling [(phase, avg, p50, p99)] in milliseconds, "frame" first.
+        Refreshed every SUMMARY_INTERVAL frames so the overlay stays readable.
+        """
+        if self.summary and self.frame_index - self.summary_frame < self.SUMMARY_INTERVAL:
+            return self.summary
+        self.summary_frame = self.frame_index
+        rows = []
+        for name, samples in [("frame", self.totals)] + list(self.history.items()):
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            rows.append((name, sum(ordered) / len(ordered),
+                         self._percentile(ordered, 0.5), self._percentile(ordered, 0.99)))
+        self.summary = rows
+        return rows
+
+    def get_stats(self):
+        """Return the rolling frame time (ms) for the FPS readout."""
+        summary = self.get_summary()
+        if not summary:
+            return {"frames": self.frame_index, "avg": 0.0, "p50": 0.0, "p99": 0.0}
+        _, avg, p50, p99 = summary[0]
+        return {"frames": self.frame_index, "avg": avg, "p50": p50, "p99": p99}
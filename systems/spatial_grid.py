@@ -0,0 +1,204 @@
+import math
+import pygame
+
+class SpatialGrid:
+    """Uniform-grid spatial hash over world entities.
+
+    Every entity is stored with a kind ("tree", "campfire", ...) and a
+    bounding rect in each grid cell the rect touches. Queries only visit the
+    cells around the area asked about, so their cost depends on how crowded
+    that area is rather than on how many entities the zone holds.
+
+    Results are candidates in insertion order: callers keep their own exact
+    distance or hitbox checks, and "first match wins" loops behave the same
+    as they did over the plain lists.
+    """
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        # Key: (cx, cy) -> {id(obj): obj}
+        self.cells = {}
+        # Key: id(obj) -> [obj, kind, rect, cell_keys, order]
+        self.entries = {}
+        # Key: kind -> {id(obj): obj}
+        self.kinds = {}
+        self.next_order = 0
+
+    def clear(self):
+        """Remove every entity."""
+        self.cells.clear()
+        self.entries.clear()
+        self.kinds.clear()
+        self.next_order = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self.entries
+
+    def _cell_range(self, rect):
+        """Cell coordinates covered by rect (inclusive)."""
+        size = self.cell_size
+        x0 = int(rect.left // size)
+        y0 = int(rect.top // size)
+        x1 = int((rect.right - 1) // size) if rect.width > 0 else x0
+        y1 = int((rect.bottom - 1) // size) if rect.height > 0 else y0
+        return x0, y0, x1, y1
+
+    def _cell_keys(self, rect):
+        x0, y0, x1, y1 = self._cell_range(rect)
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, obj, rect, kind):
+        """Add obj (or move it, if already present) with the given bounds."""
+        if id(obj) in self.entries:
+            self.move(obj, rect)
+            return
+        rect = pygame.Rect(rect)
+        keys = self._cell_keys(rect)
+        for key in keys:
+            self.cells.setdefault(key, {})[id(obj)] = obj
+        self.entries[id(obj)] = [obj, kind, rect, keys, self.next_order]
+        self.kinds.setdefault(kind, {})[id(obj)] = obj
+        self.next_order += 1
+
+    def remove(self, obj):
+        """Drop obj from the grid (no-op if absent)."""
+        entry = self.entries.pop(id(obj), None)
+        if not entry:
+            return
+        self.kinds[entry[1]].pop(id(obj), None)
+        for key in entry[3]:
+            cell = self.cells.get(key)
+            if cell is not None:
+                cell.pop(id(obj), None)
+                if not cell:
+                    del self.cells[key]
+
+    def move(self, obj, rect):
+        """Update obj's bounds; only touches cells when it crosses a cell edge."""
+        entry = self.entries.get(id(obj))
+        if not entry:
+            return
+        rect = pygame.Rect(rect)
+        if rect == entry[2]:
+            return
+        keys = self._cell_keys(rect)
+        if keys != entry[3]:
+            for key in entry[3]:
+                cell = self.cells.get(key)
+                if cell is not None:
+                    cell.pop(id(obj), None)
+                    if not cell:
+                        del self.cells[key]
+            for key in keys:
+                self.cells.setdefault(key, {})[id(obj)] = obj
+            entry[3] = keys
+        entry[2] = rect
+
+    def get_rect(self, obj):
+        """Bounds stored for obj, or None."""
+        entry = self.entries.get(id(obj))
+        return entry[2] if entry else None
+
+    def query_all(self, kind=None):
+        """Every entity (of one kind), in insertion order."""
+        if kind is None:
+            keys = self.entries.keys()
+        else:
+            keys = self.kinds.get(kind, {}).keys()
+        entries = sorted((self.entries[key] for key in keys), key=lambda e: e[4])
+        return [e[0] for e in entries]
+
+    def _collect(self, x0, y0, x1, y1, kind):
+        """Entries in a block of cells, deduplicated."""
+        found = {}
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if not cell:
+                    continue
+                for key in cell:
+                    if key not in found:
+                        entry = self.entries[key]
+                        if kind is None or entry[1] == kind:
+                            found[key] = entry
+        return found.values()
+
+    def query_rect(self, rect, kind=None):
+        """Entities whose bounds overlap rect."""
+        rect = pygame.Rect(rect)
+        hits = [e for e in self._collect(*self._cell_range(rect), kind) if e[2].colliderect(rect)]
+        hits.sort(key=lambda e: e[4])
+        return [e[0] for e in hits]
+
+    def query_radius(self, center, radius, kind=None):
+        """Entities whose bounds come within radius of center."""
+        cx, cy = center
+        area = pygame.Rect(int(cx - radius) - 1, int(cy - radius) - 1, int(radius * 2) + 3, int(radius * 2) + 3)
+        limit = (radius + 1) ** 2
+        hits = []
+        for entry in self._collect(*self._cell_range(area), kind):
+            r = entry[2]
+            # Closest point of the rect to the center
+            dx = cx - max(r.left, min(cx, r.right))
+            dy = cy - max(r.top, min(cy, r.bottom))
+            if dx * dx + dy * dy <= limit:
+                hits.append(entry)
+        hits.sort(key=lambda e: e[4])
+        return [e[0] for e in hits]
+
+    def nearest(self, center, kind=None, point=None, accept=None, max_radius=None):
+        """
+        Closest entity to center, searching outward ring by ring.
+
+        point(obj) gives the position distances are measured to (default: the
+        centre of its bounds) and must lie inside the stored bounds. accept(obj)
+        can reject candidates (e.g. unlit fires). Returns (obj, distance) or
+        (None, None).
+        """
+        if not self.entries:
+            return None, None
+        size = self.cell_size
+        px, py = center
+        ox, oy = int(px // size), int(py // size)
+
+        # Rings past the occupied area can't hold anything
+        keys = self.cells.keys()
+        min_x = min(k[0] for k in keys); max_x = max(k[0] for k in keys)
+        min_y = min(k[1] for k in keys); max_y = max(k[1] for k in keys)
+        max_ring = max(abs(ox - min_x), abs(ox - max_x), abs(oy - min_y), abs(oy - max_y))
+        if max_radius is not None:
+            max_ring = min(max_ring, int(max_radius // size) + 1)
+
+        best, best_dist = None, None
+        seen = set()
+        for ring in range(max_ring + 1):
+            for cx in range(ox - ring, ox + ring + 1):
+                for cy in range(oy - ring, oy + ring + 1):
+                    if ring and max(abs(cx - ox), abs(cy - oy)) != ring:
+                        continue # Inner cells were searched already
+                    cell = self.cells.get((cx, cy))
+                    if not cell:
+                        continue
+                    for key, obj in cell.items():
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        entry = self.entries[key]
+                        if kind is not None and entry[1] != kind:
+                            continue
+                        if accept and not accept(obj):
+                            continue
+                        qx, qy = point(obj) if point else entry[2].center
+                        dist = math.hypot(qx - px, qy - py)
+                        if max_radius is not None and dist > max_radius:
+                            continue
+                        if best is None or dist < best_dist or (dist == best_dist and entry[4] < self.entries[id(best)][4]):
+                            best, best_dist = obj, dist
+            # Anything in an outer ring is at least ring * size away
+            if best is not None and best_dist <= ring * size:
+                break
+        return best, best_dist
@@ -0,0 +1,108 @@
+import numpy as np
+import pygame
+
+from utils.surfaces import prepare
+
+def palette_lut(palette):
+    """256-entry lookup of packed SRCALPHA pixels for a palette dict (missing/clear indices stay transparent)."""
+    # Same pixel layout as every pygame.Surface(size, SRCALPHA)
+    r_shift, g_shift, b_shift, a_shift = pygame.Surface((1, 1), pygame.SRCALPHA).get_shifts()
+    lut = np.zeros(256, dtype=np.uint32)
+    for val, color in palette.items():
+        alpha = color[3] if len(color) > 3 else 255
+        if alpha:
+            lut[val] = (color[0] << r_shift) | (color[1] << g_shift) | (color[2] << b_shift) | (alpha << a_shift)
+    return lut
+
+def rasterize_grid(grid, lut, pixel_size=4, flip_h=False):
+    """Colour-map a palette-index grid and upscale it straight into an SRCALPHA surface."""
+    grid = np.asarray(grid, dtype=np.uint8)
+    if flip_h:
+        grid = grid[:, ::-1]
+    # Map colours on the small grid, then blow each cell up to a pixel_size block
+    pixels = lut[grid].repeat(pixel_size, axis=0).repeat(pixel_size, axis=1)
+
+    image = pygame.Surface((pixels.shape[1], pixels.shape[0]), pygame.SRCALPHA)
+    pygame.surfarray.pixels2d(image)[...] = pixels.T # surfarray is indexed (x, y)
+    return image
+
+
+class CharacterAtlas:
+    """Process-wide cache of rendered character frames.
+
+    Player and NPCs are drawn from the same procedural grids, so a frame is
+    fully described by its pose (frame index, facing, tool, action flags),
+    its horizontal flip and its palette. Each combination is rasterized once,
+    the first time it is asked for, and the resulting Surface is shared by
+    every character that needs it. Shared frames must never be drawn into.
+    """
+
+    def __init__(self, pixel_size=4):
+        self.pixel_size = pixel_size
+
+        # Key: (pose, flip_h, palette_key) -> Surface
+        self.frames = {}
+        # Key: pose -> grid (grids don't depend on palette or flip)
+        self.grids = {}
+        # Key: id(palette) -> (palette, palette_key); palettes are plain dicts
+        self.palette_keys = {}
+        # Key: palette_key -> RGBA lookup table
+        self.luts = {}
+
+        # Stats
+        self.hits = 0
+        self.builds = 0
+
+    def _palette_key(self, palette):
+        """Hashable form of a palette dict (cached for long-lived palettes)."""
+        cached = self.palette_keys.get(id(palette))
+        if cached and cached[0] is palette:
+            return cached[1]
+        key = tuple(sorted(palette.items()))
+        if len(self.palette_keys) > 64:
+            self.palette_keys.clear() # Temporary palette copies; don't hoard them
+        self.palette_keys[id(palette)] = (palette, key)
+        return key
+
+    def get_grid(self, frame_index, facing, tool, is_chopping, is_moving, is_lighting, is_igniting):
+        """Return the (shared, read-only) index grid for a pose."""
+        pose = (frame_index, facing, tool, is_chopping, is_moving, is_lighting, is_igniting)
+        grid = self.grids.get(pose)
+        if grid is None:
+            from data.matrices import build_hero_grid
+            grid = build_hero_grid(*pose)
+            self.grids[pose] = grid
+        return grid
+
+    def get_frame(self, palette, frame_index, facing, tool="TORCH", is_chopping=False,
+                  is_moving=False, is_lighting=False, is_igniting=False, flip_h=False):
+        """Return the shared Surface for a pose/flip/palette, building it on first use."""
+        pose = (frame_index, facing, tool, is_chopping, is_moving, is_lighting, is_igniting)
+        key = (pose, flip_h, self._palette_key(palette))
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.hits += 1
+            return frame
+
+        lut = self.luts.get(key[2])
+        if lut is None:
+            lut = self.luts[key[2]] = palette_lut(palette)
+        frame = prepare(rasterize_grid(self.get_grid(*pose), lut, self.pixel_size, flip_h))
+        self.frames[key] = frame
+        self.builds += 1
+        return frame
+
+    def clear(self):
+        """Drop every cached frame."""
+        self.frames.clear()
+        self.grids.clear()
+        self.palette_keys.clear()
+        self.luts.clear()
+
+    def get_stats(self):
+        """Return cache counters for the debug overlay."""
+        return {"frames": len(self.frames), "hits": self.hits, "builds": self.builds}
+
+
+# Shared by every Player and NPC instance
+character_atlas = CharacterAtlas()
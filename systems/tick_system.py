@@ -57,7 +57,7 @@ class TickSystem:
         # Check if player is near an active fire
         is_warmed = False
         if env_manager and player:
-            for fire in env_manager.campfires:
+            for fire in env_manager.spatial.query_radius(player.pos, 200, "campfire"):
                 if fire.fuel > 0:
                     import pygame
                     dist = (pygame.Vector2(fire.rect.center) - player.pos).length()
@@ -92,7 +92,9 @@ class TickSystem:
                 # Wind Chill Calculation (Check Shelter)
                 is_sheltered = False
                 if env_manager and hasattr(env_manager, 'rocks'):
-                    for rock in env_manager.rocks:
+                    # Only rocks whose centre can be up to 100px left / 50px above or below
+                    shelter_area = (int(player.pos.x) - 101, int(player.pos.y) - 51, 103, 103)
+                    for rock in env_manager.spatial.query_rect(shelter_area, "rock"):
                         # Simple "Behind Rock" logic
                         # Assuming wind blows LEFT to RIGHT (or based on weather?)
                         # Let's say wind is consistently from WEST (Left)
@@ -0,0 +1,102 @@
+import time
+
+import pygame
+
+# Category -> (max simultaneous voices, priority; higher wins when stealing)
+CATEGORIES = {
+    "foley": (2, 1),    # Footsteps, light handling
+    "impact": (3, 2),   # Chops and wood thuds
+    "ambience": (1, 3), # Wind gusts and howls
+    "event": (2, 4),    # Ice cracks and other one-off cues
+}
+DEFAULT_CATEGORY = "foley"
+
+# Which category each named sound plays in
+SOUND_CATEGORIES = {
+    "step": "foley",
+    "chop": "impact",
+    "wind": "ambience",
+    "fire_crackle": "ambience",
+    "ice_crack": "event",
+}
+
+
+class Voice:
+    """One pooled mixer channel and what it was last asked to play."""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.category = None
+        self.priority = 0
+        self.started = 0.0
+        self.volume = 1.0 # Per-voice gain before the master SFX volume
+
+    def is_active(self):
+        return self.category is not None and self.channel.get_busy()
+
+
+class VoicePool:
+    """Fixed set of mixer channels shared by every untargeted sound effect.
+
+    Each category has a voice limit: a new sound in a full category takes
+    over that category's oldest voice. When the whole pool is busy the oldest
+    voice of the lowest priority at or below the new sound's is stolen;
+    otherwise the new sound is dropped. Volume is set on the channel, so
+    overlapping plays of one Sound never change each other's level.
+    """
+
+    def __init__(self, first_channel, size):
+        self.voices = [Voice(pygame.mixer.Channel(first_channel + i)) for i in range(size)]
+
+        # Stats
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+
+    def _pick(self, category, priority):
+        """Choose the voice for a new sound, or None to drop it."""
+        limit = CATEGORIES.get(category, CATEGORIES[DEFAULT_CATEGORY])[0]
+        active = [v for v in self.voices if v.is_active()]
+
+        same = [v for v in active if v.category == category]
+        if len(same) >= limit:
+            return min(same, key=lambda v: v.started)
+
+        for voice in self.voices:
+            if not voice.is_active():
+                return voice
+
+        victims = [v for v in active if v.priority <= priority]
+        if not victims:
+            return None
+        return min(victims, key=lambda v: (v.priority, v.started))
+
+    def play(self, sound, category, volume, master, loops=0):
+        """Play sound on a pooled voice at volume * master. Returns False if dropped."""
+        priority = CATEGORIES.get(category, CATEGORIES[DEFAULT_CATEGORY])[1]
+        voice = self._pick(category, priority)
+        if voice is None:
+            self.dropped += 1
+            return False
+        if voice.is_active():
+            self.stolen += 1
+
+        voice.category = category
+        voice.priority = priority
+        voice.started = time.perf_counter()
+        voice.volume = volume
+        voice.channel.set_volume(volume * master)
+        voice.channel.play(sound, loops=loops)
+        self.played += 1
+        return True
+
+    def set_master(self, master):
+        """Re-level every playing voice after the SFX volume changes."""
+        for voice in self.voices:
+            if voice.is_active():
+                voice.channel.set_volume(voice.volume * master)
+
+    def get_stats(self):
+        """Return counters for the debug overlay."""
+        return {"active": sum(v.is_active() for v in self.voices), "size": len(self.voices),
+                "played": self.played, "stolen": self.stolen, "dropped": self.dropped}
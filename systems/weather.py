@@ -1,35 +1,36 @@
+import numpy as np
 import pygame
-import random
 
-class SnowParticle:
-    def __init__(self, x, y, dx, dy, size=1):
-        self.x = x
-        self.y = y
-        self.dx = dx  # Horizontal velocity (wind)
-        self.dy = dy  # Vertical velocity (fall)
-        self.size = size
-        self.alpha = random.randint(150, 255)
-        
-    def update(self, dt, wind_multiplier=1.0):
-        """Update particle position with wind effect."""
-        self.x += self.dx * wind_multiplier * dt * 60  # Scale by 60 for frame-independent
-        self.y += self.dy * dt * 60
-        
-    def is_offscreen(self, screen_width, screen_height):
-        """Check if particle has left the screen."""
-        return (self.y > screen_height or 
-                self.x < -10 or 
-                self.x > screen_width + 10)
+from utils.surfaces import prepare
 
 class WeatherSystem:
+    """Falling snow and wind gusts.
+
+    Flakes are stored as NumPy arrays (position, velocity, size) with the
+    live ones packed at the front, so wind integration and off-screen
+    recycling are whole-array operations. 1px flakes are written straight
+    into the target's pixels; larger ones are blitted from a cached sprite.
+    """
+    CAPACITY = 20000 # Upper bound for any zone's max_particles
+    DIRTY_RECT_LIMIT = 256 # Past this, report one bounding rect instead of one per flake
+
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
         
         # Particles
-        self.particles = []
         self.max_particles = 300
-        self.spawn_rate = 5  # Particles per frame
+        self.spawn_rate = 300  # Particles per second
+        self.spawn_accumulator = 0.0
+        self.rng = np.random.default_rng()
+        self.count = 0
+        self.x = np.zeros(self.CAPACITY)
+        self.y = np.zeros(self.CAPACITY)
+        self.dx = np.zeros(self.CAPACITY) # Horizontal velocity (wind)
+        self.dy = np.zeros(self.CAPACITY) # Vertical velocity (fall)
+        self.size = np.zeros(self.CAPACITY, dtype=np.int8)
+        self.arrays = (self.x, self.y, self.dx, self.dy, self.size)
+        self.flake_sprites = {} # Key: size -> Surface
         
         # Wind configuration (set by zone)
         self.base_dx = 0  # Base horizontal wind
@@ -52,19 +53,22 @@ class WeatherSystem:
             # Zone 1: Gentle fall
             self.base_dx = 0
             self.base_dy = 2
-            self.spawn_rate = 3
+            self.spawn_rate = 180
+            self.max_particles = 300
             print(f"Weather: Gentle snow (Zone {zone_id})")
         elif zone_id == 2:
             # Zone 2: Hard wind
             self.base_dx = -3
             self.base_dy = 4
-            self.spawn_rate = 6
+            self.spawn_rate = 4000
+            self.max_particles = 20000
             print(f"Weather: Harsh blizzard (Zone {zone_id})")
         else:
             # Default
             self.base_dx = 0
             self.base_dy = 2
-            self.spawn_rate = 3
+            self.spawn_rate = 180
+            self.max_particles = 300
     
     def update(self, dt, audio_manager=None):
         """Update weather particles and gusting."""
@@ -78,7 +82,7 @@ class WeatherSystem:
             
             # Audio hook: Increase wind volume during gust
             if audio_manager and "wind" in audio_manager.sounds:
-                audio_manager.ambient_channel.set_volume(1.0)
+                audio_manager.set_ambient_volume(1.0)
         
         # Update gust state
         if self.is_gusting:
@@ -88,35 +92,51 @@ class WeatherSystem:
                 
                 # Audio hook: Return wind to normal volume
                 if audio_manager and "wind" in audio_manager.sounds:
-                    audio_manager.ambient_channel.set_volume(0.5)
+                    audio_manager.set_ambient_volume(0.5)
         
-        # Spawn new particles
-        for _ in range(self.spawn_rate):
-            if len(self.particles) < self.max_particles:
-                self.spawn_particle()
+        # Spawn new particles (rate is per second; carry the remainder between steps)
+        self.spawn_accumulator += self.spawn_rate * dt
+        spawn_count = int(self.spawn_accumulator)
+        self.spawn_accumulator -= spawn_count
+        self.spawn_particles(min(spawn_count, min(self.max_particles, self.CAPACITY) - self.count))
         
         # Update existing particles
-        for particle in self.particles[:]:
-            particle.update(dt, self.current_wind_multiplier)
-            
-            # Remove offscreen particles
-            if particle.is_offscreen(self.screen_width, self.screen_height):
-                self.particles.remove(particle)
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        x += self.dx[:n] * (self.current_wind_multiplier * dt * 60) # Scale by 60 for frame-independent
+        y += self.dy[:n] * (dt * 60)
+        
+        # Recycle offscreen particles (survivors stay packed at the front)
+        offscreen = (y > self.screen_height) | (x < -10) | (x > self.screen_width + 10)
+        if offscreen.any():
+            alive = ~offscreen
+            kept = int(alive.sum())
+            for array in self.arrays:
+                array[:kept] = array[:n][alive]
+            self.count = kept
     
-    def spawn_particle(self):
-        """Spawn a new snow particle at the top of the screen."""
-        x = random.randint(-50, self.screen_width + 50)
-        y = random.randint(-20, 0)
+    def spawn_particles(self, count):
+        """Spawn snow particles at the top of the screen."""
+        if count <= 0:
+            return
+        start, end = self.count, self.count + count
+        rng = self.rng
+        self.x[start:end] = rng.integers(-50, self.screen_width + 51, count)
+        self.y[start:end] = rng.integers(-20, 1, count)
         
         # Slight variation in particle velocity
-        dx = self.base_dx + random.uniform(-0.5, 0.5)
-        dy = self.base_dy + random.uniform(-0.3, 0.3)
+        self.dx[start:end] = self.base_dx + rng.uniform(-0.5, 0.5, count)
+        self.dy[start:end] = self.base_dy + rng.uniform(-0.3, 0.3, count)
         
         # Vary particle size slightly
-        size = random.choice([1, 1, 1, 2])  # Mostly 1px, occasionally 2px
-        
-        particle = SnowParticle(x, y, dx, dy, size)
-        self.particles.append(particle)
+        self.size[start:end] = rng.choice((1, 1, 1, 2), count) # Mostly 1px, occasionally 2px
+        self.count = end
+    
+    def spawn_particle(self):
+        """Spawn a single snow particle (if there is room)."""
+        self.spawn_particles(min(1, min(self.max_particles, self.CAPACITY) - self.count))
     
     def trigger_gust(self):
         """Trigger a wind gust."""
@@ -131,22 +151,58 @@ class WeatherSystem:
         self.current_wind_multiplier = 1.0
         print("Gust subsides...")
     
+    def _flake_sprite(self, size):
+        """Snowflake of the given radius, drawn as pygame.draw.circle would."""
+        sprite = self.flake_sprites.get(size)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2 + 1, size * 2 + 1))
+            sprite.set_colorkey((0, 0, 0))
+            pygame.draw.circle(sprite, (255, 255, 255), (size, size), size)
+            sprite = self.flake_sprites[size] = prepare(sprite) # RLE: mostly colour key
+        return sprite
+    
     def render(self, surface):
         """Render snow particles."""
-        for particle in self.particles:
-            # Draw particle as a small white circle or rect
-            color = (255, 255, 255, particle.alpha)
-            
-            if particle.size == 1:
-                # Single pixel
-                if 0 <= particle.x < self.screen_width and 0 <= particle.y < self.screen_height:
-                    surface.set_at((int(particle.x), int(particle.y)), color[:3])
-            else:
-                # Larger snowflake
-                pygame.draw.circle(surface, color[:3], 
-                                 (int(particle.x), int(particle.y)), 
-                                 particle.size)
+        n = self.count
+        if not n:
+            return
+        xs = self.x[:n].astype(np.int32)
+        ys = self.y[:n].astype(np.int32)
+        sizes = self.size[:n]
+        
+        # Single pixels: one fancy-indexed write, limited to the clip (set_at honoured it)
+        clip = surface.get_clip().clip(0, 0, self.screen_width, self.screen_height)
+        x, y = self.x[:n], self.y[:n]
+        single = ((sizes == 1) & (x >= clip.left) & (x < clip.right)
+                  & (y >= clip.top) & (y < clip.bottom))
+        if single.any():
+            pixels = pygame.surfarray.pixels2d(surface)
+            pixels[xs[single], ys[single]] = surface.map_rgb((255, 255, 255))
+            del pixels # Unlock before blitting
+        
+        # Larger snowflakes
+        large = sizes > 1
+        if large.any():
+            blits = [(self._flake_sprite(size), (x - size, y - size))
+                     for x, y, size in zip(xs[large].tolist(), ys[large].tolist(), sizes[large].tolist())]
+            surface.blits(blits, doreturn=False)
+    
+    def get_dirty_rects(self):
+        """Bounds of every flake drawn this frame (for dirty-rect tracking)."""
+        n = self.count
+        if not n:
+            return []
+        xs = self.x[:n].astype(np.int32)
+        ys = self.y[:n].astype(np.int32)
+        sizes = self.size[:n].astype(np.int32)
+        if n > self.DIRTY_RECT_LIMIT:
+            # Dense snow: one rect (the tracker will fall back to a full redraw)
+            left, top = int((xs - sizes).min()), int((ys - sizes).min())
+            right, bottom = int((xs + sizes).max()) + 1, int((ys + sizes).max()) + 1
+            return [pygame.Rect(left, top, right - left, bottom - top)]
+        return [pygame.Rect(x - size, y - size, size * 2 + 1, size * 2 + 1)
+                for x, y, size in zip(xs.tolist(), ys.tolist(), sizes.tolist())]
     
     def clear(self):
         """Remove all particles (for zone transitions)."""
-        self.particles.clear()
+        self.count = 0
@@ -0,0 +1,108 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+
+def edge_targets(zone_id, width, height):
+    """
+    Where each screen edge leads from zone_id, as
+    {edge: (zone, entry_pos, entry_span)}. Mirrors the edge rules in
+    main.get_zone_transition; entry_span is the range of heights the player
+    can arrive at when only the entry column is fixed.
+    """
+    column = (0, height)
+    targets = {}
+    if zone_id in (0, 1):
+        targets["right"] = (zone_id + 1, (20, 0), column)
+    elif zone_id == 2:
+        targets["right"] = (3, (width // 2, height - 60), None)
+    if zone_id in (2, 3):
+        targets["left"] = (zone_id - 1, (width - 150, 0), column)
+    return targets
+
+
+class ZonePreparer:
+    """Builds the zones next door on a worker thread before the player gets there.
+
+    When the player comes within APPROACH_MARGIN of an edge, the zone behind
+    it is generated with EnvironmentManager.build_layout on a single worker,
+    seeded from the preparer's own Random so the game's global random stream
+    is never drawn from. The spawn clearance is kept for every height the
+    player could enter at. On the transition, take() hands back the finished
+    layout for apply_layout to swap in; anything else in flight is dropped.
+    """
+    APPROACH_MARGIN = 250 # Pixels from an edge
+
+    def __init__(self, zone_manager, env_manager, width, height):
+        self.zone_manager = zone_manager
+        self.env_manager = env_manager
+        self.width = width
+        self.height = height
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zone-prep")
+        # Key: (from zone, edge) -> (zone, entry_pos, entry_span, Future)
+        self.pending = {}
+        self.rng = random.Random() # Seeds worker builds; independent of the global stream
+
+        # Stats
+        self.prepared = 0
+        self.used = 0
+        self.missed = 0
+
+    def update(self, run_state, player):
+        """Start building the neighbour behind any edge the player is approaching."""
+        zone_id = run_state.current_zone_id
+        x = player.pos.x
+        edges = []
+        if x > self.width - self.APPROACH_MARGIN:
+            edges.append("right")
+        if x < self.APPROACH_MARGIN:
+            edges.append("left")
+
+        for edge in edges:
+            if (zone_id, edge) in self.pending:
+                continue
+            target = edge_targets(zone_id, self.width, self.height).get(edge)
+            if target is None:
+                continue
+            to_zone, entry_pos, entry_span = target
+            rng = random.Random(self.rng.getrandbits(32))
+            future = self.executor.submit(self.env_manager.build_layout, self.zone_manager.get_zone(to_zone),
+                                          self.width, self.height, entry_pos, rng, entry_span)
+            self.pending[(zone_id, edge)] = (to_zone, entry_pos, entry_span, future)
+            self.prepared += 1
+
+    def take(self, zone_id, safe_pos):
+        """
+        Return the prepared layout for entering zone_id at safe_pos, or None
+        (the caller then loads synchronously). Clears every pending build.
+        """
+        layout = None
+        for to_zone, entry_pos, entry_span, future in self.pending.values():
+            if layout is not None or to_zone != zone_id:
+                continue
+            if entry_span:
+                fits = safe_pos[0] == entry_pos[0] and entry_span[0] <= safe_pos[1] <= entry_span[1]
+            else:
+                fits = tuple(safe_pos) == entry_pos
+            if not fits:
+                continue
+            try:
+                layout = future.result() # Usually done; otherwise finish it now
+            except Exception as e:
+                print(f"Zone preparation failed: {e}")
+        self.reset()
+
+        if layout is None:
+            self.missed += 1
+        else:
+            self.used += 1
+        return layout
+
+    def reset(self):
+        """Drop every prepared or in-flight zone (new game, load, zone change)."""
+        for _, _, _, future in self.pending.values():
+            future.cancel()
+        self.pending = {}
+
+    def get_stats(self):
+        """Return counters for the debug overlay."""
+        return {"pending": len(self.pending), "prepared": self.prepared, "used": self.used, "missed": self.missed}
@@ -1,24 +1,15 @@
 import pygame
 import math
+import time
 from constants import MAX_LOG_SLOTS, LOGICAL_WIDTH, LOGICAL_HEIGHT
 
 # --- HELPER FUNCTIONS ---
 
-# Font Cache
-_font_cache = {}
-_text_cache = {}
-
-def get_font(name, size, bold=False, italic=False):
-    key = (name, size, bold, italic)
-    if key not in _font_cache:
-        _font_cache[key] = pygame.font.SysFont(name, size, bold, italic)
-    return _font_cache[key]
+# Fonts and rendered text are shared through ui.text (bounded LRU)
+from ui.text import get_font, render_text
 
 def get_text(font, text, color):
-    key = (text, color)
-    if key not in _text_cache:
-        _text_cache[key] = font.render(text, True, color)
-    return _text_cache[key]
+    return render_text(font, text, color)
 
 def draw_rustic_panel(screen, rect):
     """
@@ -315,6 +306,10 @@ def draw_inventory_ui(screen, run_state, screen_width, screen_height, active_too
     """
     Modern Tool Belt and Resource Pouch.
     """
+    draw_tool_belt(screen, screen_height, active_tool)
+    draw_resource_pouch(screen, run_state, screen_width, screen_height)
+
+def draw_tool_belt(screen, screen_height, active_tool="AXE"):
     font = get_font("Consolas", 14, bold=True)
     
     # === TOOLBELT (Left) ===
@@ -365,6 +360,9 @@ def draw_inventory_ui(screen, run_state, screen_width, screen_height, active_too
     draw_tool_slot(axe_rect, "AXE", active_tool=="AXE")
     draw_tool_slot(torch_rect, "TORCH", active_tool=="TORCH")
 
+def draw_resource_pouch(screen, run_state, screen_width, screen_height):
+    font = get_font("Consolas", 14, bold=True)
+    
     # === RESOURCE POUCH (Right) ===
     
     # Logs Panel
@@ -409,14 +407,7 @@ def draw_survival_panel(screen, run_state, tick_system, screen_width, screen_hei
     """
     Main HUD: Thermometer + Clock (Top Left), Inventory (Bottom Center).
     """
-    # Shake effect for warning
-    shake = 0
-    if event_manager and event_manager.is_warning:
-        import random
-        shake = random.randint(-1, 1)
-        
-    # Thermometer
-    draw_thermometer(screen, run_state.body_temp, 20, 20, shake_offset=shake)
+    draw_vitals(screen, run_state, event_manager)
     
     # Clock (Next to thermo)
     # Thermo width 12, x=20. Right edge = 32.
@@ -430,6 +421,57 @@ def draw_survival_panel(screen, run_state, tick_system, screen_width, screen_hei
     # Inventory - MOVED to main loop
     pass
 
+def draw_vitals(screen, run_state, event_manager=None):
+    """Thermometer and face icon (top left)."""
+    # Shake effect for warning
+    shake = 0
+    if event_manager and event_manager.is_warning:
+        import random
+        shake = random.randint(-1, 1)
+        
+    # Thermometer
+    draw_thermometer(screen, run_state.body_temp, 20, 20, shake_offset=shake)
+
+def get_hud_blocks(run_state, tick_system, screen_width, screen_height, active_tool="AXE", event_manager=None):
+    """
+    (key, rect, state, animating) for each HUD block, in draw order.
+    Rects match the layouts drawn by draw_tool_belt, draw_resource_pouch,
+    draw_vitals, draw_tick_clock, draw_objective_panel and
+    draw_stabilization_ui. A block only looks different when its state
+    changes, unless it is animating (random jitter, or the tick clock,
+    which sweeps every frame and is cheaper to draw than to re-bake).
+    """
+    temp = run_state.body_temp
+    
+    # Shake / shiver jitter every frame
+    vitals_animating = bool(event_manager and event_manager.is_warning) or 5 <= temp < 10
+    vitals_state = (temp, int(time.time() * 5) % 2 if temp < 5 else None)
+    
+    tick_pct = tick_system.time_since_last_tick / tick_system.tick_interval
+    flashing = time.time() - run_state.last_log_deposit_time < 0.5
+    
+    remaining = None
+    if run_state.current_zone_id == 1 and not run_state.zone_1_stabilized:
+        remaining = 20 - run_state.logs_deposited_in_zone_1
+    
+    return [
+        ("hud_belt", pygame.Rect(14, screen_height - 124, 162, 110), active_tool, False),
+        ("hud_pouch", pygame.Rect(screen_width - 312, screen_height - 92, 294, 74),
+         (run_state.inventory.get("logs", 0), run_state.inventory.get("sticks", 0)), False),
+        ("hud_vitals", pygame.Rect(12, 16, 60, 158), vitals_state, vitals_animating),
+        ("hud_clock", pygame.Rect(44, 19, 27, 27), (int(360 * tick_pct), tick_pct > 0), True),
+        ("hud_objective", pygame.Rect(18, 178, 184, 54), (get_current_objective(run_state), flashing), False),
+        ("hud_stabilization", pygame.Rect(screen_width // 2 - 120, 20, 240, 40), remaining, False),
+    ]
+
+def get_hud_render_states(run_state, tick_system, screen_width, screen_height, active_tool="AXE", event_manager=None):
+    """
+    (key, rect, state) for each HUD block, used for dirty-rect tracking.
+    """
+    return [(key, rect, object() if animating else state)
+            for key, rect, state, animating in get_hud_blocks(run_state, tick_system, screen_width, screen_height,
+                                                               active_tool, event_manager)]
+
 def draw_cold_overlay(screen, body_temp, screen_width, screen_height):
     """Draw blue tint that intensifies as player gets colder."""
     if body_temp >= 37:
@@ -528,11 +570,11 @@ def draw_shop_menu(screen, run_state, selection_index, stash_count):
         if owned: name_color = (100, 100, 100) # Grayed out
         
         # Name
-        name_surf = font_item.render(item["name"], True, name_color)
+        name_surf = get_text(font_item, item["name"], name_color)
         screen.blit(name_surf, (menu_rect.x + 40, item_y))
         
         # Description
-        desc_surf = font_desc.render(item["desc"], True, (80, 70, 60))
+        desc_surf = get_text(font_desc, item["desc"], (80, 70, 60))
         screen.blit(desc_surf, (menu_rect.x + 40, item_y + 30))
         
         # Cost / Status
@@ -543,7 +585,7 @@ def draw_shop_menu(screen, run_state, selection_index, stash_count):
             status = f"{item['cost']} LOGS"
             color = (180, 50, 50) if stash_count < item['cost'] else (50, 100, 50)
             
-        cost_surf = font_item.render(status, True, color)
+        cost_surf = get_text(font_item, status, color)
         screen.blit(cost_surf, (menu_rect.right - 40 - cost_surf.get_width(), item_y + 10))
     
     # Footer Instructions
@@ -1,5 +1,6 @@
 import pygame
 import math
+from ui.text import get_font, render_text
 
 class DialogueBox:
     def __init__(self):
@@ -66,6 +67,15 @@ class DialogueBox:
             # End of dialogue
             self.active = False
             
+    def get_render_state(self, width, height):
+        """Box bounds and visible text state, or None when hidden."""
+        if not self.active:
+            return None
+        box_height = 120
+        box_rect = pygame.Rect(20, height - box_height - 10, width - 40, box_height)
+        blink_visible = self.text_complete and (self.blink_timer % 1.0) < 0.5
+        return box_rect, (self.current_text, blink_visible)
+            
     def render(self, surface, width, height):
         """Draw the dialogue box with typewriter text."""
         if not self.active:
@@ -86,7 +96,7 @@ class DialogueBox:
         draw_rustic_panel(surface, box_rect)
         
         # Render text with word wrapping
-        font = pygame.font.SysFont("Arial", 22)
+        font = get_font("Arial", 22)
         text_color = (240, 240, 240)
         
         # Simple word wrap
@@ -109,7 +119,7 @@ class DialogueBox:
         # Draw wrapped text
         y_offset = box_y + padding
         for line in lines:
-            text_surf = font.render(line, True, text_color)
+            text_surf = render_text(font, line, text_color)
             surface.blit(text_surf, (40, y_offset))
             y_offset += 28
         
@@ -117,9 +127,9 @@ class DialogueBox:
         if self.text_complete:
             blink_visible = (self.blink_timer % 1.0) < 0.5
             if blink_visible:
-                prompt_font = pygame.font.SysFont("Arial", 18, bold=True)
+                prompt_font = get_font("Arial", 18, bold=True)
                 prompt_text = "▼ SPACE"
-                prompt_surf = prompt_font.render(prompt_text, True, (255, 215, 0))
+                prompt_surf = render_text(prompt_font, prompt_text, (255, 215, 0))
                 prompt_x = width - 100
                 prompt_y = box_y + box_height - 30
                 surface.blit(prompt_surf, (prompt_x, prompt_y))
@@ -1,4 +1,5 @@
 import pygame
+from ui.text import get_font, render_text
 
 class FloatingText:
     def __init__(self, x, y, text, color, duration=1.0):
@@ -8,21 +9,22 @@ class FloatingText:
         self.color = color
         self.duration = duration
         self.life = duration
-        self.font = pygame.font.SysFont("Arial", 20, bold=True)
+        self.font = get_font("Arial", 20, bold=True)
         
     def update(self, dt):
         self.life -= dt
         self.y -= 40 * dt # Move upward
         return self.life > 0
         
+    def get_rect(self):
+        """Screen bounds of the text (for dirty-rect tracking)."""
+        w, h = self.font.size(self.text)
+        return pygame.Rect(int(self.x - w / 2) - 1, int(self.y) - h - 1, w + 2, h + 2)
+        
     def render(self, surface):
         alpha = int((self.life / self.duration) * 255)
-        text_surf = self.font.render(self.text, True, self.color)
-        
-        # Apply fade
-        alpha_surf = pygame.Surface(text_surf.get_size(), pygame.SRCALPHA)
-        alpha_surf.fill((255, 255, 255, alpha))
-        text_surf.blit(alpha_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        # Faded copy comes from the shared text cache
+        text_surf = render_text(self.font, self.text, self.color, alpha=alpha)
         
         # Center text horizontally on x
         rect = text_surf.get_rect(centerx=self.x, bottom=self.y)
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+
+import pygame
+import pygame.sysfont
+
+# Every (name, bold, italic) face the game asks for; resolved up front so no
+# frame ever waits on the system font scan
+GAME_FACES = [
+    ("Arial", False, False), ("Arial", True, False),
+    ("Consolas", False, False), ("Consolas", True, False), ("Consolas", False, True),
+    ("Courier New", True, False),
+    ("Papyrus", False, False),
+    ("Segoe UI", True, False),
+    ("Stencil", True, False),
+    ("Times New Roman", False, False), ("Times New Roman", False, True),
+    ("Verdana", False, False), ("Verdana", True, False),
+]
+
+# Where installed fonts and fontconfig's configuration live, per platform
+if sys.platform == "win32":
+    FONT_DIRS = [os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+                 os.path.join(os.environ.get("LOCALAPPDATA", ""), "Microsoft", "Windows", "Fonts")]
+elif sys.platform == "darwin":
+    FONT_DIRS = ["/Library/Fonts", "/System/Library/Fonts", os.path.expanduser("~/Library/Fonts")]
+else:
+    FONT_DIRS = ["/etc/fonts", "/usr/share/fonts", "/usr/local/share/fonts",
+                 os.path.expanduser("~/.fonts"), os.path.expanduser("~/.local/share/fonts"),
+                 os.path.expanduser("~/.config/fontconfig")]
+
+
+def fontconfig_state():
+    """Fingerprint of the installed fonts: platform, pygame version and the
+    modification times of every font/config directory. Installing or removing
+    a font touches its directory, which invalidates the on-disk cache."""
+    parts = [sys.platform, pygame.version.ver,
+             os.environ.get("FONTCONFIG_FILE", ""), os.environ.get("FONTCONFIG_PATH", "")]
+    for root in FONT_DIRS:
+        for dirpath, _, _ in os.walk(root):
+            try:
+                parts.append((dirpath, os.stat(dirpath).st_mtime_ns))
+            except OSError:
+                pass
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+class FontRegistry:
+    """Resolves font faces once and hands out shared pygame Font objects.
+
+    SysFont pays for a full system font scan (fc-list on Linux) and then
+    silently falls back for faces like Papyrus or Stencil that usually aren't
+    installed. The registry records what SysFont picked for each face -- a
+    file path plus any synthetic bold/italic -- and saves it to cache_file
+    keyed by fontconfig_state(), so later launches build fonts straight from
+    the path without scanning at all. preload() resolves the game's faces on
+    a background thread while the rest of startup runs.
+    """
+
+    def __init__(self, cache_file="font_cache.json"):
+        self.cache_file = cache_file
+        # Key: (name, bold, italic) -> (path or None, set_bold, set_italic)
+        self.faces = {}
+        # Key: (name, size, bold, italic) -> Font
+        self.fonts = {}
+        self.state = None
+        self.dirty = False # Faces resolved since the cache file was read
+        self.lock = threading.Lock()
+        self.thread = None
+
+        # Stats
+        self.cache_hit = False
+        self.resolved = 0 # Faces that needed a SysFont lookup
+
+    def _face_key(self, name, bold, italic):
+        return (name.lower() if name else name, bool(bold), bool(italic))
+
+    def load_cache(self):
+        """Adopt the on-disk faces if they were saved under the current font state."""
+        self.state = fontconfig_state()
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r') as f:
+                    loaded = json.load(f)
+                if loaded.get("state") == self.state:
+                    for name, bold, italic, path, set_bold, set_italic in loaded.get("faces", []):
+                        if path is None or os.path.exists(path):
+                            self.faces[(name, bold, italic)] = (path, set_bold, set_italic)
+                    self.cache_hit = True
+        except Exception as e:
+            print(f"Failed to load font cache: {e}")
+
+    def save_cache(self):
+        """Write resolved faces to disk (skipped when nothing changed)."""
+        with self.lock:
+            if not self.dirty:
+                return
+            faces = [[*key, *value] for key, value in self.faces.items()]
+            self.dirty = False
+        try:
+            with open(self.cache_file, 'w') as f:
+                json.dump({"state": self.state, "faces": faces}, f, indent=4)
+        except Exception as e:
+            print(f"Failed to save font cache: {e}")
+
+    def _resolve(self, key):
+        """Ask SysFont which file (and synthetic styles) it would use for a face."""
+        name, bold, italic = key
+        # The constructor hook receives SysFont's decision instead of building a Font
+        path, set_bold, set_italic = pygame.sysfont.SysFont(
+            name, 1, bold, italic, constructor=lambda path, size, b, i: (path, b, i))
+        with self.lock:
+            self.faces[key] = (path, bool(set_bold), bool(set_italic))
+            self.dirty = True
+            self.resolved += 1
+        return self.faces[key]
+
+    def _preload(self, faces):
+        self.load_cache()
+        for face in faces:
+            key = self._face_key(*face)
+            if key not in self.faces:
+                self._resolve(key)
+        self.save_cache()
+
+    def preload(self, faces=GAME_FACES):
+        """Load the disk cache and resolve any missing faces on a background thread."""
+        self.thread = threading.Thread(target=self._preload, args=(list(faces),), daemon=True)
+        self.thread.start()
+
+    def wait(self):
+        """Block until the background preload has finished."""
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def get_font(self, name, size, bold=False, italic=False):
+        """Return the shared Font for a face, built from its resolved path."""
+        key = (name, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is not None:
+            return font
+
+        face_key = self._face_key(name, bold, italic)
+        face = self.faces.get(face_key)
+        if face is None:
+            # The preload may still be reading the cache or scanning; let it finish first
+            self.wait()
+            if self.state is None:
+                self.load_cache() # No preload ran
+            face = self.faces.get(face_key)
+            if face is None:
+                face = self._resolve(face_key)
+                self.save_cache()
+
+        path, set_bold, set_italic = face
+        font = self.fonts[key] = pygame.font.Font(path, size)
+        if set_bold:
+            font.set_bold(True)
+        if set_italic:
+            font.set_italic(True)
+        return font
+
+    def get_stats(self):
+        """Return counters for the debug overlay."""
+        return {"faces": len(self.faces), "fonts": len(self.fonts),
+                "resolved": self.resolved, "cache_hit": self.cache_hit}
+
+
+# Shared by every UI module
+font_registry = FontRegistry()
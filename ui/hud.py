@@ -0,0 +1,113 @@
+import pygame
+
+from utils.surfaces import prepare
+from ui import (get_hud_blocks, draw_tool_belt, draw_resource_pouch, draw_vitals, draw_tick_clock,
+                draw_objective_panel, draw_stabilization_ui)
+
+
+class HudWidget:
+    """One retained HUD block: its last drawn state and cached pixels."""
+
+    def __init__(self, key):
+        self.key = key
+        self.state = None
+        self.surface = None # Premultiplied SRCALPHA copy of the block, None when blank
+        self.valid = False
+
+
+class HudLayer:
+    """Retained-mode HUD.
+
+    Each block from get_hud_blocks is drawn once into a premultiplied-alpha
+    cache and only redrawn when its state changes. Blocks are drawn twice,
+    over black and over white scratch surfaces; the difference between the
+    two recovers coverage exactly, so panels, glows and faded icons composite
+    the same as drawing them straight onto the frame. All cached blocks go
+    out in one blits call. Blocks that change every frame (shake, shiver,
+    the tick clock) bypass the cache while they animate.
+    """
+
+    def __init__(self):
+        # Key: block key -> HudWidget
+        self.widgets = {}
+        # Full-frame scratch surfaces so the draw functions keep screen coordinates
+        self.black = None
+        self.white = None
+
+        # Stats
+        self.redraws = 0
+        self.direct = 0
+
+    def _scratch(self, screen):
+        if self.black is None or self.black.get_size() != screen.get_size():
+            self.black = pygame.Surface(screen.get_size(), 0, screen)
+            self.white = pygame.Surface(screen.get_size(), 0, screen)
+
+    def _bake(self, widget, rect, draw, screen):
+        """Redraw one block into its premultiplied cache."""
+        self._scratch(screen)
+        for scratch, bg in ((self.black, (0, 0, 0)), (self.white, (255, 255, 255))):
+            scratch.set_clip(rect)
+            scratch.fill(bg, rect)
+            draw(scratch)
+            scratch.set_clip(None)
+
+        # Over black a block leaves its premultiplied colour; over white it
+        # also leaves 255 * (1 - alpha), which gives the coverage back
+        black = pygame.surfarray.array3d(self.black.subsurface(rect)).astype('int16')
+        white = pygame.surfarray.array3d(self.white.subsurface(rect)).astype('int16')
+        alpha = (255 - (white - black).mean(axis=2)).round().clip(0, 255).astype('uint8')
+
+        widget.surface = None
+        if alpha.any():
+            surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+            pygame.surfarray.pixels3d(surface)[...] = black.clip(0, 255)
+            pygame.surfarray.pixels_alpha(surface)[...] = alpha
+            widget.surface = prepare(surface)
+        self.redraws += 1
+
+    def render(self, screen, run_state, tick_system, screen_width, screen_height, active_tool="AXE", event_manager=None):
+        """Composite the HUD onto screen, redrawing only blocks whose state changed."""
+        tick_pct = tick_system.time_since_last_tick / tick_system.tick_interval
+        draws = {
+            "hud_belt": lambda s: draw_tool_belt(s, screen_height, active_tool),
+            "hud_pouch": lambda s: draw_resource_pouch(s, run_state, screen_width, screen_height),
+            "hud_vitals": lambda s: draw_vitals(s, run_state, event_manager),
+            "hud_clock": lambda s: draw_tick_clock(s, tick_pct, 45, 20, radius=12),
+            "hud_objective": lambda s: draw_objective_panel(s, run_state),
+            "hud_stabilization": lambda s: draw_stabilization_ui(s, run_state, screen_width, screen_height),
+        }
+
+        blits = []
+        for key, rect, state, animating in get_hud_blocks(run_state, tick_system, screen_width, screen_height,
+                                                          active_tool, event_manager):
+            widget = self.widgets.get(key)
+            if widget is None:
+                widget = self.widgets[key] = HudWidget(key)
+
+            if animating:
+                # Keep draw order: flush the blocks underneath, then draw live
+                screen.blits(blits, doreturn=False)
+                blits = []
+                draws[key](screen)
+                widget.valid = False
+                self.direct += 1
+                continue
+
+            if not widget.valid or widget.state != state:
+                self._bake(widget, rect, draws[key], screen)
+                widget.state = state
+                widget.valid = True
+            if widget.surface is not None:
+                blits.append((widget.surface, rect.topleft, None, pygame.BLEND_PREMULTIPLIED))
+        screen.blits(blits, doreturn=False)
+
+    def invalidate(self):
+        """Force every block to redraw on the next render."""
+        for widget in self.widgets.values():
+            widget.valid = False
+
+    def get_stats(self):
+        """Return counters for the debug overlay."""
+        return {"widgets": len(self.widgets), "cached": sum(w.valid for w in self.widgets.values()),
+                "redraws": self.redraws, "direct": self.direct}
@@ -1,5 +1,6 @@
 import pygame
 import math
+from ui.text import get_font, render_text
 
 # Modern color palette
 COLORS = {
@@ -109,8 +110,8 @@ def draw_modern_thermometer(screen, body_temp, x, y, width=50, height=220, shake
                         (x + width, tick_y), (x + width + 8, tick_y), 2)
     
     # Temperature display with modern font
-    font = pygame.font.SysFont("Segoe UI", 20, bold=True)
-    temp_text = font.render(f"{int(body_temp)}°", True, color)
+    font = get_font("Segoe UI", 20, bold=True)
+    temp_text = render_text(font, f"{int(body_temp)}°", color)
     
     # Text background
     text_bg = pygame.Surface((60, 30), pygame.SRCALPHA)
@@ -120,8 +121,8 @@ def draw_modern_thermometer(screen, body_temp, x, y, width=50, height=220, shake
     screen.blit(temp_text, (x + width + 22, y + height // 2 - 12))
     
     # Label
-    label_font = pygame.font.SysFont("Segoe UI", 11, bold=True)
-    label = label_font.render("BODY TEMP", True, COLORS['text_secondary'])
+    label_font = get_font("Segoe UI", 11, bold=True)
+    label = render_text(label_font, "BODY TEMP", COLORS['text_secondary'])
     screen.blit(label, (x, y - 22))
 
 def draw_modern_tick_clock(screen, tick_progress, x, y, radius=35):
@@ -161,8 +162,8 @@ def draw_modern_tick_clock(screen, tick_progress, x, y, radius=35):
     pygame.draw.circle(screen, (*COLORS['accent_secondary'], 100), (x, y), center_radius + 3)
     
     # Label
-    label_font = pygame.font.SysFont("Segoe UI", 11, bold=True)
-    label = label_font.render("TICK", True, COLORS['text_secondary'])
+    label_font = get_font("Segoe UI", 11, bold=True)
+    label = render_text(label_font, "TICK", COLORS['text_secondary'])
     label_rect = label.get_rect(center=(x, y + radius + 18))
     screen.blit(label, label_rect)
 
@@ -181,8 +182,8 @@ def draw_modern_survival_panel(screen, run_state, tick_system, screen_width, scr
     draw_modern_tick_clock(screen, tick_progress, 60, 360)
     
     # Zone indicator with modern design
-    zone_font = pygame.font.SysFont("Segoe UI", 28, bold=True)
-    zone_text = zone_font.render(f"ZONE {run_state.current_zone_id}", True, COLORS['text_primary'])
+    zone_font = get_font("Segoe UI", 28, bold=True)
+    zone_text = render_text(zone_font, f"ZONE {run_state.current_zone_id}", COLORS['text_primary'])
     zone_rect = zone_text.get_rect(center=(screen_width // 2, 35))
     
     # Zone background
@@ -210,10 +211,10 @@ def draw_modern_inventory(screen, run_state, screen_width, screen_height):
     draw_modern_panel(screen, panel_x, panel_y, panel_width, panel_height, alpha=230, glow=is_full)
     
     # Title with icon
-    title_font = pygame.font.SysFont("Segoe UI", 14, bold=True)
+    title_font = get_font("Segoe UI", 14, bold=True)
     title_color = COLORS['accent_danger'] if is_full else COLORS['text_primary']
     title_text = "BACKPACK FULL!" if is_full else "BACKPACK"
-    title = title_font.render(title_text, True, title_color)
+    title = render_text(title_font, title_text, title_color)
     screen.blit(title, (panel_x + 12, panel_y + 8))
     
     # Log slots
@@ -247,8 +248,8 @@ def draw_modern_inventory(screen, run_state, screen_width, screen_height):
     
     # Sticks counter
     if stick_count > 0:
-        stick_font = pygame.font.SysFont("Segoe UI", 12, bold=True)
-        stick_text = stick_font.render(f"🌿 {stick_count} STICKS", True, COLORS['accent_success'])
+        stick_font = get_font("Segoe UI", 12, bold=True)
+        stick_text = render_text(stick_font, f"🌿 {stick_count} STICKS", COLORS['accent_success'])
         stick_bg = pygame.Surface((stick_text.get_width() + 16, 22), pygame.SRCALPHA)
         stick_bg.fill((*COLORS['bg_dark'], 200))
         pygame.draw.rect(stick_bg, COLORS['accent_success'], (0, 0, stick_text.get_width() + 16, 22), 1, border_radius=4)
@@ -288,14 +289,14 @@ def draw_modern_stabilization_ui(screen, run_state, screen_width, screen_height)
         screen.blit(prog_surf, (x + 6, y + 6))
     
     # Text
-    font = pygame.font.SysFont("Segoe UI", 13, bold=True)
+    font = get_font("Segoe UI", 13, bold=True)
     remaining = goal - run_state.logs_deposited_in_zone_1
     text = f"{remaining} LOGS TO STABILIZE" if remaining > 0 else "ZONE STABILIZED!"
-    text_surf = font.render(text, True, COLORS['text_primary'])
+    text_surf = render_text(font, text, COLORS['text_primary'])
     text_rect = text_surf.get_rect(center=(x + width // 2, y + height // 2))
     
     # Text shadow
-    shadow = font.render(text, True, (0, 0, 0))
+    shadow = render_text(font, text, (0, 0, 0))
     screen.blit(shadow, (text_rect.x + 1, text_rect.y + 1))
     screen.blit(text_surf, text_rect)
 
@@ -1,5 +1,6 @@
 import pygame
 import math
+from ui.text import get_font, render_text
 
 class ModernNotification:
     """Modern notification with slide-in animation and auto-fade."""
@@ -50,11 +51,11 @@ class ModernNotification:
         draw_rustic_panel(surface, panel_rect)
         
         # Text
-        font = pygame.font.SysFont("Consolas", 14, bold=True)
+        font = get_font("Consolas", 14, bold=True)
         # Use simple white or accent color for text?
         # User requested rustic style. "Dark Brown fill" is the panel.
         # Let's use accent color for text to differentiate types.
-        text_surf = font.render(self.text, True, accent_color)
+        text_surf = render_text(font, self.text, accent_color)
         
         # Center vertically, padding left
         text_rect = text_surf.get_rect(midleft=(panel_rect.x + 16, panel_rect.centery))
@@ -74,6 +75,21 @@ class NotificationManager:
         """Update all notifications."""
         self.notifications = [n for n in self.notifications if n.update(dt)]
         
+    def get_render_states(self, screen_width, screen_height):
+        """(notification, rect, state) per card, matching render() layout."""
+        notif_width = 400
+        notif_spacing = 10
+        start_y = 150
+        
+        states = []
+        for i, notif in enumerate(self.notifications):
+            x = screen_width - notif_width - 30
+            y = start_y + i * (50 + notif_spacing)
+            ease = notif.slide_progress * notif.slide_progress * (3 - 2 * notif.slide_progress)
+            offset_x = int((1 - ease) * notif_width)
+            states.append((notif, pygame.Rect(x + offset_x, y, notif_width, 50), (i, offset_x)))
+        return states
+        
     def render(self, surface, screen_width, screen_height):
         """Render all notifications stacked."""
         notif_width = 400
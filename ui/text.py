@@ -0,0 +1,92 @@
+import pygame
+from collections import OrderedDict
+
+from ui.fonts import font_registry
+from utils.surfaces import prepare
+
+class TextCache:
+    """Process-wide font and rendered-text cache shared by every UI module.
+
+    Fonts come from the shared FontRegistry (resolved once, interned by
+    (name, size, bold, italic)). Rendered strings are
+    kept in an LRU keyed by font, text, colour and fade level, bounded by the
+    bytes of surface memory they hold, so HUD values that change every tick
+    (temperatures, timers) age out instead of piling up. Faded variants are
+    quantized to ALPHA_STEP levels. Cached surfaces are shared: never draw
+    into them.
+    """
+    ALPHA_STEP = 8
+
+    def __init__(self, budget=8 * 1024 * 1024):
+        # Key: (font, text, color, antialias, background, alpha) -> Surface, least recently used first
+        self.surfaces = OrderedDict()
+        self.budget = budget # Bytes of text surfaces kept
+        self.bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_font(self, name, size, bold=False, italic=False):
+        """Return the shared Font for a face (see FontRegistry.get_font)."""
+        return font_registry.get_font(name, size, bold, italic)
+
+    def render(self, font, text, color, antialias=True, background=None, alpha=255):
+        """Return a cached Surface of font.render(text, ...), faded to alpha (0-255)."""
+        alpha = max(0, min(255, int(alpha)))
+        if alpha < 255:
+            alpha = min(255, (alpha + self.ALPHA_STEP // 2) // self.ALPHA_STEP * self.ALPHA_STEP)
+        key = (font, text, tuple(color), antialias, background, alpha)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+
+        if alpha < 255:
+            # Fade the opaque version (itself cached) by multiplying its alpha
+            surf = self.render(font, text, color, antialias, background).copy()
+            if surf.get_flags() & pygame.SRCALPHA:
+                surf.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            else:
+                surf.set_alpha(alpha)
+        else:
+            surf = prepare(font.render(text, antialias, color, background))
+
+        self.surfaces[key] = surf
+        self.bytes += self._surface_bytes(surf)
+        # Evict least recently used text past the budget
+        while self.bytes > self.budget and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes -= self._surface_bytes(old)
+            self.evictions += 1
+        return surf
+
+    def _surface_bytes(self, surf):
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+    def clear(self):
+        """Drop every rendered string (fonts stay interned)."""
+        self.surfaces.clear()
+        self.bytes = 0
+
+    def get_stats(self):
+        """Return cache counters for the debug overlay."""
+        lookups = self.hits + self.misses
+        return {"fonts": len(font_registry.fonts), "entries": len(self.surfaces), "bytes": self.bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+
+# Shared by every UI module
+text_cache = TextCache()
+
+def get_font(name, size, bold=False, italic=False):
+    """Shared font for a face (see TextCache.get_font)."""
+    return text_cache.get_font(name, size, bold, italic)
+
+def render_text(font, text, color, alpha=255, antialias=True, background=None):
+    """Cached text surface (see TextCache.render)."""
+    return text_cache.render(font, text, color, antialias, background, alpha)
@@ -1,5 +1,6 @@
 import pygame
 import math
+from ui.text import get_font, render_text
 
 def draw_tutorial_arrow(surface, target_pos, color=(255, 255, 0)):
     """Draw a bouncing arrow pointing down at the target position."""
@@ -37,14 +38,14 @@ def draw_tutorial_ui(surface, run_state, width, height, env_manager=None, player
     pygame.draw.rect(surface, (200, 180, 100), (20, box_y, width - 40, box_height), 3)
     
     # Tutorial text based on step
-    font_large = pygame.font.SysFont("Arial", 28, bold=True)
-    font_small = pygame.font.SysFont("Arial", 20)
+    font_large = get_font("Arial", 28, bold=True)
+    font_small = get_font("Arial", 20)
     
     if run_state.tutorial_step == 0:
         # Step 0: Movement
-        title = font_large.render("LEARN TO MOVE", True, (255, 220, 100))
-        prompt = font_small.render("Use WASD or Arrow Keys to walk around", True, (220, 220, 220))
-        progress = font_small.render(f"Distance: {int(run_state.distance_moved)}/100", True, (150, 200, 255))
+        title = render_text(font_large, "LEARN TO MOVE", (255, 220, 100))
+        prompt = render_text(font_small, "Use WASD or Arrow Keys to walk around", (220, 220, 220))
+        progress = render_text(font_small, f"Distance: {int(run_state.distance_moved)}/100", (150, 200, 255))
         
         surface.blit(title, (width // 2 - title.get_width() // 2, box_y + 10))
         surface.blit(prompt, (width // 2 - prompt.get_width() // 2, box_y + 40))
@@ -52,9 +53,9 @@ def draw_tutorial_ui(surface, run_state, width, height, env_manager=None, player
         
     elif run_state.tutorial_step == 1:
         # Step 1: Gathering
-        title = font_large.render("GATHER WOOD", True, (255, 220, 100))
-        prompt = font_small.render("Press SPACE near a tree to chop it", True, (220, 220, 220))
-        progress = font_small.render(f"Logs: {run_state.inventory['logs']}/1", True, (150, 200, 255))
+        title = render_text(font_large, "GATHER WOOD", (255, 220, 100))
+        prompt = render_text(font_small, "Press SPACE near a tree to chop it", (220, 220, 220))
+        progress = render_text(font_small, f"Logs: {run_state.inventory['logs']}/1", (150, 200, 255))
         
         surface.blit(title, (width // 2 - title.get_width() // 2, box_y + 10))
         surface.blit(prompt, (width // 2 - prompt.get_width() // 2, box_y + 40))
@@ -76,9 +77,9 @@ def draw_tutorial_ui(surface, run_state, width, height, env_manager=None, player
         
     elif run_state.tutorial_step == 2:
         # Step 2: Fueling
-        title = font_large.render("STOKE THE FIRE", True, (255, 220, 100))
-        prompt = font_small.render("Press E or SPACE near the Elder's fire to add fuel", True, (220, 220, 220))
-        hint = font_small.render("The fire keeps you warm in the cold", True, (180, 180, 180))
+        title = render_text(font_large, "STOKE THE FIRE", (255, 220, 100))
+        prompt = render_text(font_small, "Press E or SPACE near the Elder's fire to add fuel", (220, 220, 220))
+        hint = render_text(font_small, "The fire keeps you warm in the cold", (180, 180, 180))
         
         surface.blit(title, (width // 2 - title.get_width() // 2, box_y + 10))
         surface.blit(prompt, (width // 2 - prompt.get_width() // 2, box_y + 35))
@@ -92,9 +93,9 @@ def draw_tutorial_ui(surface, run_state, width, height, env_manager=None, player
         
     elif run_state.tutorial_step == 3:
         # Step 3: Departure
-        title = font_large.render("THE ELDER SPEAKS", True, (255, 220, 100))
-        quote = font_small.render('"The woods are turning... Go."', True, (220, 220, 220))
-        prompt = font_small.render("Walk to the right edge to enter The Quiet Woods", True, (150, 200, 255))
+        title = render_text(font_large, "THE ELDER SPEAKS", (255, 220, 100))
+        quote = render_text(font_small, '"The woods are turning... Go."', (220, 220, 220))
+        prompt = render_text(font_small, "Walk to the right edge to enter The Quiet Woods", (150, 200, 255))
         
         surface.blit(title, (width // 2 - title.get_width() // 2, box_y + 10))
         surface.blit(quote, (width // 2 - quote.get_width() // 2, box_y + 35))
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import zlib
+
+import numpy as np
+import pygame
+
+BAKE_VERSION = 1 # Bump when the file layout changes; older directories are removed
+
+
+def source_version(*functions):
+    """
+    Fingerprint of generator code: the bytecode and constants of each function
+    (nested functions and lambdas included). Editing a generator changes its
+    fingerprint; moving it around the file does not.
+    """
+    digest = hashlib.sha1()
+    pending = [getattr(f, "__func__", f).__code__ for f in functions]
+    while pending:
+        code = pending.pop()
+        digest.update(code.co_code)
+        for const in code.co_consts:
+            if hasattr(const, "co_code"):
+                pending.append(const)
+            else:
+                digest.update(repr(const).encode())
+        digest.update(repr(code.co_names).encode())
+    return digest.hexdigest()
+
+
+class BakeCache:
+    """Versioned on-disk cache for procedurally generated pixels and PCM.
+
+    Each entry is keyed by a hash of the generator's name, its parameters,
+    the generator's source_version() and the Python/pygame versions, so a
+    change to any of them misses and rebuilds. Entries are a JSON header line
+    followed by the zlib-compressed raw data. Missing, stale or unreadable
+    entries just rebuild; the game never depends on the cache existing.
+    """
+
+    def __init__(self, root="bake_cache"):
+        self.root = root
+        self.dir = os.path.join(root, f"v{BAKE_VERSION}")
+        self.ready = False
+        self.lock = threading.Lock()
+        # Key: tuple of generator functions -> fingerprint (hashing bytecode is not free)
+        self.versions = {}
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.bytes_read = 0
+
+    def _prepare_dir(self):
+        """Create the cache directory and drop any other format version."""
+        with self.lock:
+            if self.ready:
+                return
+            self.ready = True
+            try:
+                if os.path.isdir(self.root):
+                    for entry in os.listdir(self.root):
+                        path = os.path.join(self.root, entry)
+                        if entry != f"v{BAKE_VERSION}" and os.path.isdir(path):
+                            shutil.rmtree(path, ignore_errors=True)
+                os.makedirs(self.dir, exist_ok=True)
+            except OSError as e:
+                print(f"Bake cache unavailable: {e}")
+
+    def _key(self, name, params, sources):
+        version = self.versions.get(sources)
+        if version is None:
+            version = self.versions[sources] = source_version(*sources)
+        parts = (name, params, version, sys.version_info[:2], pygame.version.ver)
+        return hashlib.sha1(repr(parts).encode()).hexdigest()[:20]
+
+    def _load(self, path):
+        """Return (header, raw bytes) for an entry, or None."""
+        try:
+            with open(path, 'rb') as f:
+                header = json.loads(f.readline())
+                raw = zlib.decompress(f.read())
+            self.bytes_read += len(raw)
+            return header, raw
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.errors += 1
+            print(f"Discarding bake cache entry {path}: {e}")
+            return None
+
+    def _store(self, path, header, raw):
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(json.dumps(header).encode() + b"\n")
+                f.write(zlib.compress(raw))
+            os.replace(tmp, path) # Readers never see half an entry
+        except OSError as e:
+            self.errors += 1
+            print(f"Failed to write bake cache entry {path}: {e}")
+
+    def _get(self, kind, name, params, sources, build, encode, decode):
+        self._prepare_dir()
+        sources = tuple(getattr(f, "__func__", f) for f in sources)
+        path = os.path.join(self.dir, f"{name}-{self._key(name, params, sources)}.{kind}")
+        entry = self._load(path)
+        if entry is not None:
+            try:
+                value = decode(*entry)
+                self.hits += 1
+                return value
+            except Exception as e:
+                self.errors += 1
+                print(f"Discarding bake cache entry {path}: {e}")
+        self.misses += 1
+        value = build()
+        self._store(path, *encode(value))
+        return value
+
+    def data(self, name, params, build, sources=()):
+        """Return bytes from build(), baked to disk."""
+        return self._get("bin", name, params, sources, build,
+                         lambda value: ({}, bytes(value)),
+                         lambda header, raw: raw)
+
+    def array(self, name, params, build, sources=()):
+        """Return a NumPy array from build(), baked to disk."""
+        def encode(array):
+            array = np.ascontiguousarray(array)
+            return {"dtype": array.dtype.str, "shape": array.shape}, array.tobytes()
+        def decode(header, raw):
+            return np.frombuffer(raw, dtype=header["dtype"]).reshape(header["shape"]).copy()
+        return self._get("npy", name, params, sources, build, encode, decode)
+
+    def surface(self, name, params, build, sources=()):
+        """
+        Return a Surface from build(), baked to disk. Per-pixel alpha is kept;
+        callers still run the result through prepare().
+        """
+        def encode(surface):
+            fmt = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGBX"
+            return {"size": surface.get_size(), "format": fmt}, pygame.image.tobytes(surface, fmt)
+        def decode(header, raw):
+            size = tuple(header["size"])
+            if not raw: # frombytes rejects empty images
+                return pygame.Surface(size, pygame.SRCALPHA if header["format"] == "RGBA" else 0)
+            return pygame.image.frombytes(raw, size, header["format"])
+        return self._get("px", name, params, sources, build, encode, decode)
+
+    def get_stats(self):
+        """Return counters for the debug overlay."""
+        return {"hits": self.hits, "misses": self.misses, "errors": self.errors, "bytes_read": self.bytes_read}
+
+
+# Shared by every generator
+bake_cache = BakeCache()
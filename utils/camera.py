@@ -12,7 +12,7 @@ class Camera:
         self.y = 0
         
         # Smoothing parameters
-        self.lerp_speed = 0.1  # How fast camera follows (0.1 = smooth, 1.0 = instant)
+        self.lerp_speed = 0.1  # Fraction covered per 1/60 s (0.1 = smooth, 1.0 = instant)
         
         # Look-ahead
         self.look_ahead_distance = 50  # Pixels to shift in movement direction
@@ -39,17 +39,21 @@ class Camera:
                 target_look_ahead_x = (player_velocity[0] / vel_length) * self.look_ahead_distance
                 target_look_ahead_y = (player_velocity[1] / vel_length) * self.look_ahead_distance
         
+        # Lerp factors are tuned per 60 Hz frame; rescale so any step size converges the same
+        look_ahead_t = 1.0 - (1.0 - self.look_ahead_lerp) ** (dt * 60)
+        follow_t = 1.0 - (1.0 - self.lerp_speed) ** (dt * 60)
+        
         # Smooth look-ahead transition
-        self.look_ahead_x += (target_look_ahead_x - self.look_ahead_x) * self.look_ahead_lerp
-        self.look_ahead_y += (target_look_ahead_y - self.look_ahead_y) * self.look_ahead_lerp
+        self.look_ahead_x += (target_look_ahead_x - self.look_ahead_x) * look_ahead_t
+        self.look_ahead_y += (target_look_ahead_y - self.look_ahead_y) * look_ahead_t
         
         # Target position with look-ahead
         final_target_x = target_x + self.look_ahead_x
         final_target_y = target_y + self.look_ahead_y
         
         # Lerp camera position toward target
-        self.x += (final_target_x - self.x) * self.lerp_speed
-        self.y += (final_target_y - self.y) * self.lerp_speed
+        self.x += (final_target_x - self.x) * follow_t
+        self.y += (final_target_y - self.y) * follow_t
         
         # Update trauma (decay)
         if self.trauma > 0:
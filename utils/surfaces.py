@@ -0,0 +1,63 @@
+import threading
+from collections import OrderedDict
+
+import pygame
+
+def display_ready():
+    """True once a display mode is set (conversion needs its pixel format)."""
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+def prepare(surface, static=True):
+    """
+    Return generated art in the display's pixel format so blits skip the
+    per-pixel format conversion. Per-pixel alpha art goes through
+    convert_alpha(), everything else through convert() (colour key and
+    surface alpha are kept). Static colour-keyed art is RLE-accelerated.
+    Before a display exists (headless runs) the surface is returned as is.
+    """
+    if not display_ready():
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    converted = surface.convert()
+    colorkey = converted.get_colorkey()
+    if static and colorkey is not None:
+        converted.set_colorkey(colorkey, pygame.RLEACCEL)
+    return converted
+
+
+class SurfaceCache:
+    """Small LRU of prepared surfaces that are expensive to generate.
+
+    Entries are built by a callback on first request and converted with
+    prepare(). Safe to use from worker threads (zone preparation). Cached
+    surfaces are shared: never draw into them.
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        # Key: caller-defined -> Surface, least recently used first
+        self.surfaces = OrderedDict()
+        self.lock = threading.Lock()
+
+        # Stats
+        self.hits = 0
+        self.builds = 0
+
+    def get(self, key, build):
+        """Return the surface for key, calling build() to make it on a miss."""
+        with self.lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key)
+                self.hits += 1
+                return surface
+            surface = self.surfaces[key] = prepare(build())
+            self.builds += 1
+            while len(self.surfaces) > self.max_entries:
+                self.surfaces.popitem(last=False)
+            return surface
+
+    def clear(self):
+        with self.lock:
+            self.surfaces.clear()